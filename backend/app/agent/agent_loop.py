@@ -526,28 +526,34 @@ async def cleanup_old_logs(retention_days: int = 7):
         retention_days: Number of days to retain logs
     """
     try:
-        from app.database.database import SessionLocal
-        from app.database.models import AgentLog
+        # Bulk delete + commit is blocking; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, _delete_old_logs, retention_days)
+    except Exception as e:
+        print(f"[ERROR] Cleanup error: {e}")
+
+
+def _delete_old_logs(retention_days: int):
+    """Delete agent logs older than the retention window (blocking)"""
+    from app.database.database import SessionLocal
+    from app.database.models import AgentLog
+    
+    db = SessionLocal()
+    
+    try:
+        cutoff_time = time.time() - (retention_days * 24 * 3600)
         
-        db = SessionLocal()
+        deleted = db.query(AgentLog)\
+            .filter(AgentLog.timestamp < cutoff_time)\
+            .delete()
+        
+        db.commit()
+        
+        print(f"[CLEANUP] Cleaned up {deleted} old agent logs")
         
-        try:
-            cutoff_time = time.time() - (retention_days * 24 * 3600)
-            
-            deleted = db.query(AgentLog)\
-                .filter(AgentLog.timestamp < cutoff_time)\
-                .delete()
-            
-            db.commit()
-            
-            print(f"[CLEANUP] Cleaned up {deleted} old agent logs")
-            
-        except Exception as e:
-            print(f"[ERROR] Log cleanup error: {e}")
-            db.rollback()
-        finally:
-            db.close()
-            
     except Exception as e:
-        print(f"[ERROR] Cleanup error: {e}")
+        print(f"[ERROR] Log cleanup error: {e}")
+        db.rollback()
+    finally:
+        db.close()
 
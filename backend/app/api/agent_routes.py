@@ -294,7 +294,7 @@ async def get_agent_logs_count(
 @router.get("/logs/{log_id}", response_model=Dict[str, Any])
 async def get_agent_log(log_id: int, db: Session = Depends(get_db)):
     """Get specific agent log by ID with full details"""
-    log = db.query(AgentLog).filter(AgentLog.id == log_id).first()
+    log = db.get(AgentLog, log_id)
     
     if not log:
         raise HTTPException(status_code=404, detail="Log not found")
@@ -205,7 +205,7 @@ async def get_violation(
     db: Session = Depends(get_db)
 ):
     """Get specific violation by ID"""
-    violation = db.query(Violation).filter(Violation.id == violation_id).first()
+    violation = db.get(Violation, violation_id)
     
     if not violation:
         raise HTTPException(status_code=404, detail="Violation not found")
@@ -336,7 +336,7 @@ async def get_challan(
     db: Session = Depends(get_db)
 ):
     """Get specific challan by ID"""
-    challan = db.query(Challan).filter(Challan.challan_id == challan_id).first()
+    challan = db.get(Challan, challan_id)
     
     if not challan:
         raise HTTPException(status_code=404, detail="Challan not found")
@@ -368,7 +368,7 @@ async def pay_challan(
     Uses mock payment gateway.
     """
     # Get challan
-    challan = db.query(Challan).filter(Challan.challan_id == challan_id).first()
+    challan = db.get(Challan, challan_id)
     if not challan:
         raise HTTPException(status_code=404, detail="Challan not found")
     
@@ -376,9 +376,7 @@ async def pay_challan(
         raise HTTPException(status_code=400, detail="Challan already paid")
     
     # Get owner
-    owner = db.query(VehicleOwner).filter(
-        VehicleOwner.number_plate == challan.number_plate
-    ).first()
+    owner = db.get(VehicleOwner, challan.number_plate)
     
     if not owner:
         raise HTTPException(status_code=404, detail="Vehicle owner not found")
@@ -463,9 +461,7 @@ async def get_owner(
     db: Session = Depends(get_db)
 ):
     """Get owner by number plate"""
-    owner = db.query(VehicleOwner).filter(
-        VehicleOwner.number_plate == number_plate
-    ).first()
+    owner = db.get(VehicleOwner, number_plate)
     
     if not owner:
         raise HTTPException(status_code=404, detail="Owner not found")
@@ -668,9 +664,7 @@ async def add_owner_balance(
             }
     
     # Fallback to database
-    owner = db.query(VehicleOwner).filter(
-        VehicleOwner.number_plate == number_plate
-    ).first()
+    owner = db.get(VehicleOwner, number_plate)
     
     if not owner:
         raise HTTPException(status_code=404, detail="Owner not found")
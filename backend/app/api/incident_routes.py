@@ -9,6 +9,8 @@ Endpoints:
 - GET /api/incidents - List all incidents
 - POST /api/incident/{id}/resolve - Mark incident as resolved
 - GET /api/incident/statistics - Get system statistics
+- GET /api/incident/detections/summary - Summarize recent detections
+- GET /api/incident/detections/route/{plate} - Recent route of a vehicle
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
@@ -18,6 +20,7 @@ from typing import Optional, List, Dict, Any
 import time
 
 from app.database.database import get_db
+from app.models.detection import DetectionSummary, VehicleRoute
 
 router = APIRouter(prefix="/api/incident", tags=["incident"])
 
@@ -525,3 +528,56 @@ async def get_incident_statistics():
         stats["detectionLogger"] = _detection_logger.get_statistics()
     
     return stats
+
+
+@router.get("/detections/summary", response_model=DetectionSummary)
+async def get_detection_summary(
+    windowSeconds: float = Query(300.0, gt=0, description="Seconds of recent detections to summarize")
+):
+    """
+    Summarize recent detections
+    
+    Aggregates the detection logger's in-memory window (counts per
+    junction and vehicle type, average speed).
+    """
+    if not _detection_logger:
+        raise HTTPException(
+            status_code=503,
+            detail="Detection logger not initialized"
+        )
+    
+    now = time.time()
+    return _detection_logger.store.summary(start_time=now - windowSeconds, end_time=now)
+
+
+@router.get("/detections/route/{number_plate}", response_model=VehicleRoute)
+async def get_detection_route(
+    number_plate: str,
+    startTime: Optional[float] = Query(None, description="Start of time range (Unix timestamp)"),
+    endTime: Optional[float] = Query(None, description="End of time range (Unix timestamp)")
+):
+    """
+    Get a vehicle's recent route
+    
+    Reconstructed from the detection logger's in-memory window; older
+    movements are available through incident reports.
+    """
+    if not _detection_logger:
+        raise HTTPException(
+            status_code=503,
+            detail="Detection logger not initialized"
+        )
+    
+    route = _detection_logger.store.route(
+        number_plate,
+        start_time=startTime,
+        end_time=endTime
+    )
+    
+    if route is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No recent detections for: {number_plate}"
+        )
+    
+    return route
@@ -256,9 +256,7 @@ class ChallanManager:
             
             # Save violation first if provided
             if violation:
-                existing_violation = db.query(ViolationDB).filter(
-                    ViolationDB.id == violation.violation_id
-                ).first()
+                existing_violation = db.get(ViolationDB, violation.violation_id)
                 
                 if not existing_violation:
                     db_violation = ViolationDB(
@@ -283,9 +281,7 @@ class ChallanManager:
                     db.add(db_violation)
             
             # Check if challan exists
-            existing = db.query(ChallanDB).filter(
-                ChallanDB.challan_id == challan.challan_id
-            ).first()
+            existing = db.get(ChallanDB, challan.challan_id)
             
             if existing:
                 # Update existing
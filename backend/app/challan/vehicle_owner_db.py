@@ -10,6 +10,7 @@ For demo purposes - simulates a real vehicle registration database.
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List
 import random
+import sys
 import time
 
 from sqlalchemy.orm import Session
@@ -80,8 +81,9 @@ class VehicleOwnerDatabase:
         """
         self.config = config or {}
         
-        # In-memory cache
+        # In-memory cache (by number plate, plus a vehicle ID index)
         self.owners: Dict[str, VehicleOwnerRecord] = {}
+        self._owners_by_vehicle_id: Dict[str, VehicleOwnerRecord] = {}
         self.owner_counter = 0
         
         # Balance configuration
@@ -114,7 +116,7 @@ class VehicleOwnerDatabase:
                     total_fines_paid=owner.total_fines_paid,
                     registration_date=time.time()
                 )
-                self.owners[owner.number_plate] = record
+                self._add_owner(record)
             
             db.close()
         except Exception as e:
@@ -175,8 +177,8 @@ class VehicleOwnerDatabase:
             return self.owners[number_plate]
         
         # Generate mock owner
-        owner = self._generate_mock_owner(number_plate)
-        self.owners[number_plate] = owner
+        owner = self._generate_mock_owner(sys.intern(number_plate))
+        self._add_owner(owner)
         
         # Persist to database
         self._save_to_database(owner)
@@ -185,15 +187,18 @@ class VehicleOwnerDatabase:
         
         return owner
     
+    def _add_owner(self, owner: VehicleOwnerRecord):
+        """Add an owner to the in-memory cache and its indexes"""
+        self.owners[owner.number_plate] = owner
+        self._owners_by_vehicle_id[owner.vehicle_id] = owner
+    
     def _save_to_database(self, owner: VehicleOwnerRecord):
         """Save owner to SQLite database"""
         try:
             db = SessionLocal()
             
             # Check if exists
-            existing = db.query(VehicleOwnerDB).filter(
-                VehicleOwnerDB.number_plate == owner.number_plate
-            ).first()
+            existing = db.get(VehicleOwnerDB, owner.number_plate)
             
             if existing:
                 # Update existing
@@ -231,18 +236,17 @@ class VehicleOwnerDatabase:
         Returns:
             VehicleOwnerRecord or None
         """
+        owner = self.owners.get(number_plate)
+        
         # Auto-register if not exists (for demo)
-        if number_plate not in self.owners:
+        if owner is None:
             return self.register_vehicle(number_plate)
         
-        return self.owners.get(number_plate)
+        return owner
     
     def get_owner_by_vehicle_id(self, vehicle_id: str) -> Optional[VehicleOwnerRecord]:
-        """Get owner by vehicle ID (searches by vehicle_id field)"""
-        for owner in self.owners.values():
-            if owner.vehicle_id == vehicle_id:
-                return owner
-        return None
+        """Get owner by vehicle ID"""
+        return self._owners_by_vehicle_id.get(vehicle_id)
     
     def deduct_fine(self, number_plate: str, amount: float) -> tuple[bool, Optional[str]]:
         """
@@ -8,6 +8,7 @@ and database initialization utilities.
 import os
 from pathlib import Path
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -31,6 +32,38 @@ engine = create_engine(
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _to_async_url(url: str) -> str:
+    """Map a sync database URL onto its asyncio driver"""
+    for sync_prefix, async_prefix in (
+        ("sqlite://", "sqlite+aiosqlite://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+ASYNC_DATABASE_URL = _to_async_url(DATABASE_URL)
+
+# Pool sizing only applies to server databases; SQLite's async pool
+# rejects pool_size/max_overflow
+_async_pool_args = (
+    {} if ASYNC_DATABASE_URL.startswith("sqlite")
+    else {"pool_size": 10, "max_overflow": 20}
+)
+
+# Async engine with a bounded connection pool, for callers on the event loop
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    echo=False,
+    **_async_pool_args
+)
+
+# Async session factory (objects stay usable after commit)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -51,6 +84,19 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    Dependency for FastAPI - provides an async database session
+    
+    Usage in FastAPI endpoint:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            return (await db.execute(select(Item))).scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     Initialize database - create all tables
@@ -0,0 +1,47 @@
+"""
+Fleet-wide Road Density Kernel
+
+Computes density score and classification for every tracked road in one
+call over parallel arrays, instead of one DensityCalculator call pair per
+road. Compiled with Numba when available (see app.utils.jit).
+
+Classification codes index density_tracker.DENSITY_LEVELS:
+0 = LOW, 1 = MEDIUM, 2 = HIGH.
+"""
+
+from app.utils.jit import njit
+
+
+# Explicit signature: compiled (or loaded from cache) at import, so the
+# first density update of a run does not pay the JIT cost
+@njit("void(int32[::1], int32[::1], float64, float64, float64[::1], int8[::1])", cache=True, boundscheck=False)
+def classify_densities(counts, capacities, low_threshold, medium_threshold, scores, classes):
+    """
+    Density score and class per road
+    
+    Matches DensityCalculator.calculate_density_score / classify_density.
+    
+    Args:
+        counts: int32[N] vehicles on each road
+        capacities: int32[N] road capacity (0 -> score 0)
+        low_threshold: vehicle count from which a road is MEDIUM
+        medium_threshold: vehicle count from which a road is HIGH
+        scores: float64[N] output, 0-100
+        classes: int8[N] output classification codes
+    """
+    for i in range(counts.shape[0]):
+        count = counts[i]
+        capacity = capacities[i]
+        
+        if capacity == 0:
+            scores[i] = 0.0
+        else:
+            scores[i] = min((count / capacity) * 100, 100.0)
+        
+        if count < low_threshold:
+            classes[i] = 0
+        elif count < medium_threshold:
+            classes[i] = 1
+        else:
+            classes[i] = 2
+
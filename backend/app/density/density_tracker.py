@@ -16,7 +16,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 import time
 
+import numpy as np
+
 from app.config import get_config
+from app.utils.tick_clock import tick_time
+from app.density._density_numba import classify_densities
 
 
 class DensityLevel(str, Enum):
@@ -26,6 +30,10 @@ class DensityLevel(str, Enum):
     HIGH = "HIGH"
 
 
+# Classification code (as produced by classify_densities) -> level
+DENSITY_LEVELS = (DensityLevel.LOW, DensityLevel.MEDIUM, DensityLevel.HIGH)
+
+
 class TrafficDataSource(str, Enum):
     """Traffic data source modes"""
     LIVE_API = "LIVE_API"
@@ -353,7 +361,7 @@ class DensityTracker:
         
         # Classify
         data.classification = self.calculator.classify_density(data.vehicle_count)
-        data.timestamp = time.time()
+        data.timestamp = tick_time()
     
     def update(self, vehicles: list, roads: list, junctions: list, current_time: float):
         """
@@ -427,7 +435,8 @@ class DensityTracker:
                 road_data.vehicle_ids.add(vehicle_id)
                 road_data.vehicle_count = len(road_data.vehicle_ids)
         
-        # Calculate density scores and classifications
+        # Collect tracked roads; capacity 0 means derive it from geometry
+        tracked: List[RoadDensityData] = []
         for road in roads:
             road_id = road.id if hasattr(road, 'id') else road.get('id', str(road))
             
@@ -436,9 +445,7 @@ class DensityTracker:
             
             road_data = self.road_densities[road_id]
             
-            # Get capacity
-            capacity = road_data.capacity
-            if capacity == 0:
+            if road_data.capacity == 0:
                 length = 300  # default
                 lanes = 2
                 if hasattr(road, 'geometry'):
@@ -449,20 +456,30 @@ class DensityTracker:
                     length = geometry.get('length', 300)
                     lanes = geometry.get('lanes', 2)
                 
-                capacity = self.calculator.calculate_road_capacity(length, lanes)
-                road_data.capacity = capacity
-            
-            # Calculate score
-            road_data.density_score = self.calculator.calculate_density_score(
-                road_data.vehicle_count,
-                capacity
-            )
-            
-            # Classify
-            road_data.classification = self.calculator.classify_density(
-                road_data.vehicle_count
-            )
+                road_data.capacity = self.calculator.calculate_road_capacity(length, lanes)
             
+            tracked.append(road_data)
+        
+        if not tracked:
+            return
+        
+        # Score and classify all roads in one kernel call
+        n = len(tracked)
+        counts = np.fromiter((d.vehicle_count for d in tracked), dtype=np.int32, count=n)
+        capacities = np.fromiter((d.capacity for d in tracked), dtype=np.int32, count=n)
+        scores = np.empty(n, dtype=np.float64)
+        classes = np.empty(n, dtype=np.int8)
+        
+        calculator = self.calculator
+        classify_densities(
+            counts, capacities,
+            float(calculator.low_threshold), float(calculator.medium_threshold),
+            scores, classes
+        )
+        
+        for road_data, score, code in zip(tracked, scores.tolist(), classes.tolist()):
+            road_data.density_score = score
+            road_data.classification = DENSITY_LEVELS[code]
             road_data.timestamp = current_time
     
     def _update_junction_densities(self, junctions: list, current_time: float):
@@ -0,0 +1,110 @@
+"""
+A* Kernel over CSR Arrays
+
+Allocation-free A* core used by EmergencyPathfinder. The open set is a
+binary min-heap stored in two parallel arrays (f-cost, node index).
+Compiled with Numba when available (see app.utils.jit).
+"""
+
+import numpy as np
+
+from app.utils.jit import njit
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_node, size, f, node):
+    """Insert (f, node) and sift up; returns new heap size"""
+    i = size
+    heap_f[i] = f
+    heap_node[i] = node
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap_f[parent] <= heap_f[i]:
+            break
+        heap_f[i], heap_f[parent] = heap_f[parent], heap_f[i]
+        heap_node[i], heap_node[parent] = heap_node[parent], heap_node[i]
+        i = parent
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_node, size):
+    """Remove the minimum entry and sift down; returns (f, node, new size)"""
+    f = heap_f[0]
+    node = heap_node[0]
+    size -= 1
+    heap_f[0] = heap_f[size]
+    heap_node[0] = heap_node[size]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        if left >= size:
+            break
+        child = left
+        right = left + 1
+        if right < size and heap_f[right] < heap_f[left]:
+            child = right
+        if heap_f[i] <= heap_f[child]:
+            break
+        heap_f[i], heap_f[child] = heap_f[child], heap_f[i]
+        heap_node[i], heap_node[child] = heap_node[child], heap_node[i]
+        i = child
+    return f, node, size
+
+
+@njit(cache=True)
+def astar_csr(indptr, indices, weights, h, src, dst, g_cost_out, parent_out, max_iterations):
+    """
+    A* search from `src` to `dst` on a CSR graph
+    
+    Args:
+        indptr: int32[N+1] edge row offsets per node
+        indices: int32[E] neighbor node per edge row
+        weights: float32[E] edge length per edge row
+        h: float32[N] heuristic (straight-line distance) to dst per node
+        src, dst: start and goal node indices
+        g_cost_out: float32[N] output, best known cost from src
+        parent_out: int32[N] output, parent node index (-1 if none)
+        max_iterations: pop limit before giving up
+    
+    Returns:
+        (found, iterations)
+    """
+    n = indptr.shape[0] - 1
+    closed = np.zeros(n, dtype=np.bool_)
+    g_cost_out[:] = np.inf
+    parent_out[:] = -1
+    
+    # Each edge is relaxed at most once, so E + 1 slots always suffice
+    capacity = indices.shape[0] + 1
+    heap_f = np.empty(capacity, dtype=np.float32)
+    heap_node = np.empty(capacity, dtype=np.int32)
+    
+    g_cost_out[src] = 0.0
+    size = _heap_push(heap_f, heap_node, 0, h[src], src)
+    
+    iterations = 0
+    while size > 0 and iterations < max_iterations:
+        iterations += 1
+        f, u, size = _heap_pop(heap_f, heap_node, size)
+        
+        if u == dst:
+            return True, iterations
+        
+        if closed[u]:
+            continue
+        closed[u] = True
+        
+        g_u = g_cost_out[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if closed[v]:
+                continue
+            tentative_g = g_u + weights[k]
+            if tentative_g >= g_cost_out[v]:
+                continue
+            g_cost_out[v] = tentative_g
+            parent_out[v] = u
+            size = _heap_push(heap_f, heap_node, size, tentative_g + h[v], v)
+    
+    return False, iterations
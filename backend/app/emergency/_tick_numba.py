@@ -0,0 +1,109 @@
+"""
+Emergency Vehicle Tick Kernel
+
+Per-tick arrival check over structure-of-arrays vehicle buffers.
+Compiled with Numba when available (see app.utils.jit).
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from app.utils.jit import njit
+
+
+# Vehicle is considered arrived within 30 canvas units of destination
+ARRIVAL_RADIUS = 30.0
+ARRIVAL_RADIUS_SQ = ARRIVAL_RADIUS * ARRIVAL_RADIUS
+
+
+@njit(cache=True)
+def tick(pos, dest, speed, heading, active, arrived_out):
+    """
+    Check every active vehicle slot for arrival at its destination
+    
+    Args:
+        pos: float64[N, 2] current positions
+        dest: float64[N, 2] destination positions
+        speed: float64[N] current speeds
+        heading: float64[N] current headings (degrees)
+        active: bool[N] slot occupancy mask
+        arrived_out: bool[N] output, True where the vehicle has arrived
+    """
+    for i in range(pos.shape[0]):
+        if active[i]:
+            dx = pos[i, 0] - dest[i, 0]
+            dy = pos[i, 1] - dest[i, 1]
+            arrived_out[i] = (dx * dx + dy * dy) < ARRIVAL_RADIUS_SQ
+        else:
+            arrived_out[i] = False
+
+
+class VehicleTickBuffer:
+    """
+    Structure-of-arrays storage for tracked emergency vehicles
+    
+    Each tracked session owns one row (slot). Rows are recycled after
+    the session ends, and the arrays grow by doubling when full.
+    """
+    
+    def __init__(self, capacity: int = 8):
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.dest = np.zeros((capacity, 2), dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.heading = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        self.arrived = np.zeros(capacity, dtype=np.bool_)
+        self.slot_ids = [None] * capacity
+        self._slots = {}
+    
+    def add(self, key: str, position: tuple, destination: tuple) -> int:
+        """Assign a slot to `key` and seed its position/destination"""
+        free = np.flatnonzero(~self.active)
+        if len(free) == 0:
+            self._grow()
+            free = np.flatnonzero(~self.active)
+        slot = int(free[0])
+        
+        self.pos[slot] = position
+        self.dest[slot] = destination
+        self.speed[slot] = 0.0
+        self.heading[slot] = 0.0
+        self.active[slot] = True
+        self.slot_ids[slot] = key
+        self._slots[key] = slot
+        return slot
+    
+    def remove(self, key: str):
+        """Release the slot owned by `key`"""
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self.active[slot] = False
+            self.slot_ids[slot] = None
+    
+    def write(self, key: str, position: tuple, speed: float, heading: float) -> Optional[int]:
+        """Write a position sample into the slot owned by `key`"""
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        self.pos[slot, 0] = position[0]
+        self.pos[slot, 1] = position[1]
+        self.speed[slot] = speed
+        self.heading[slot] = heading
+        return slot
+    
+    def run(self) -> List[str]:
+        """Run the tick kernel and return keys of arrived vehicles"""
+        tick(self.pos, self.dest, self.speed, self.heading, self.active, self.arrived)
+        return [self.slot_ids[i] for i in np.flatnonzero(self.arrived)]
+    
+    def _grow(self):
+        """Double buffer capacity"""
+        capacity = len(self.active)
+        self.pos = np.concatenate([self.pos, np.zeros((capacity, 2))])
+        self.dest = np.concatenate([self.dest, np.zeros((capacity, 2))])
+        self.speed = np.concatenate([self.speed, np.zeros(capacity)])
+        self.heading = np.concatenate([self.heading, np.zeros(capacity)])
+        self.active = np.concatenate([self.active, np.zeros(capacity, dtype=np.bool_)])
+        self.arrived = np.concatenate([self.arrived, np.zeros(capacity, dtype=np.bool_)])
+        self.slot_ids.extend([None] * capacity)
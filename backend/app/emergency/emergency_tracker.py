@@ -6,20 +6,22 @@ Manages emergency sessions, vehicle position updates, and lifecycle.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, FrozenSet
 from enum import Enum
 import time
 import uuid
 
+from ._tick_numba import ARRIVAL_RADIUS_SQ, VehicleTickBuffer
 
-class EmergencyType(Enum):
+
+class EmergencyType(str, Enum):
     """Types of emergency vehicles"""
     AMBULANCE = "AMBULANCE"
     FIRE_TRUCK = "FIRE_TRUCK"
     POLICE = "POLICE"
 
 
-class EmergencyStatus(Enum):
+class EmergencyStatus(str, Enum):
     """Emergency session status"""
     INACTIVE = "INACTIVE"
     ACTIVE = "ACTIVE"
@@ -27,7 +29,7 @@ class EmergencyStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass
+@dataclass(slots=True)
 class EmergencyVehicle:
     """
     Emergency vehicle data
@@ -49,7 +51,7 @@ class EmergencyVehicle:
     destination_lon: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EmergencySession:
     """
     Active emergency corridor session
@@ -67,15 +69,30 @@ class EmergencySession:
     total_distance: float = 0.0
     estimated_time: float = 0.0
     actual_travel_time: Optional[float] = None
+    # Set views of the lists above for O(1) membership checks
+    calculated_route_set: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+    affected_junctions_set: FrozenSet[str] = field(default=frozenset(), repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.calculated_route_set = frozenset(self.calculated_route)
+        self.affected_junctions_set = frozenset(self.affected_junctions)
+    
+    def is_corridor_junction(self, junction_id: str) -> bool:
+        """Check if junction is part of the active corridor"""
+        return junction_id in self.affected_junctions_set
+    
+    def is_on_route(self, junction_id: str) -> bool:
+        """Check if junction lies on the calculated route"""
+        return junction_id in self.calculated_route_set
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert session to dictionary for API response"""
         return {
             'sessionId': self.session_id,
             'vehicleId': self.vehicle.vehicle_id,
-            'vehicleType': self.vehicle.type.value,
+            'vehicleType': self.vehicle.type,
             'numberPlate': self.vehicle.number_plate,
-            'status': self.status.value,
+            'status': self.status,
             'activatedAt': self.activated_at,
             'completedAt': self.completed_at,
             'currentPosition': {
@@ -135,6 +152,9 @@ class EmergencyTracker:
         # Session counter for IDs
         self.session_counter = 0
         
+        # SoA position buffers for the per-tick arrival kernel
+        self._tick_buffer = VehicleTickBuffer()
+        
         # Statistics
         self.total_emergencies = 0
         self.completed_emergencies = 0
@@ -231,6 +251,7 @@ class EmergencyTracker:
         )
         
         self.active_sessions.append(session)
+        self._tick_buffer.add(session_id, spawn_pos, dest_pos)
         self.total_emergencies += 1
         
         print(f"🚨 Emergency activated: {session_id}")
@@ -257,6 +278,7 @@ class EmergencyTracker:
             return
         
         session.calculated_route = route
+        session.calculated_route_set = frozenset(route)
         session.total_distance = distance
         session.estimated_time = estimated_time
         
@@ -275,6 +297,7 @@ class EmergencyTracker:
             return
         
         session.affected_junctions = junctions
+        session.affected_junctions_set = frozenset(junctions)
     
     def update_vehicle_position(
         self,
@@ -309,10 +332,57 @@ class EmergencyTracker:
         if current_junction:
             session.vehicle.current_junction_id = current_junction
         
-        # Check if reached destination
+        self._tick_buffer.write(session_id, position, speed, heading)
+        
+        # Single-vehicle updates complete immediately rather than waiting
+        # for the next tick(); same radius as the kernel
         if self._has_reached_destination(session):
             self.complete_emergency(session_id)
     
+    def update_vehicle_positions(self, updates: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Apply one tick of position samples for many vehicles
+        
+        Positions are written into the SoA buffers and the arrival check
+        runs once for all vehicles via the compiled tick kernel.
+        
+        Args:
+            updates: Mapping of session ID to a dict with 'position' and
+                optional 'speed', 'heading' and 'current_junction'
+        
+        Returns:
+            Session IDs completed during this tick
+        """
+        for session_id, update in updates.items():
+            session = self._get_session(session_id)
+            if not session or session.status != EmergencyStatus.ACTIVE:
+                continue
+            
+            vehicle = session.vehicle
+            vehicle.current_position = update['position']
+            vehicle.speed = update.get('speed', 0.0)
+            vehicle.heading = update.get('heading', 0.0)
+            if update.get('current_junction'):
+                vehicle.current_junction_id = update['current_junction']
+            
+            self._tick_buffer.write(
+                session_id, vehicle.current_position, vehicle.speed, vehicle.heading
+            )
+        
+        return self.tick()
+    
+    def tick(self) -> List[str]:
+        """
+        Run the per-tick arrival check for all tracked vehicles
+        
+        Returns:
+            Session IDs completed during this tick
+        """
+        arrived = self._tick_buffer.run()
+        for session_id in arrived:
+            self.complete_emergency(session_id)
+        return arrived
+    
     def complete_emergency(self, session_id: str):
         """
         Complete emergency session
@@ -329,6 +399,7 @@ class EmergencyTracker:
         
         session.status = EmergencyStatus.COMPLETED
         session.completed_at = time.time()
+        self._tick_buffer.remove(session_id)
         session.actual_travel_time = session.completed_at - session.activated_at
         
         # Calculate time saved (compared to estimated normal time)
@@ -361,6 +432,7 @@ class EmergencyTracker:
         
         session.status = EmergencyStatus.CANCELLED
         session.completed_at = time.time()
+        self._tick_buffer.remove(session_id)
         
         print(f"[ERROR] Emergency cancelled: {session_id} - {reason}")
         
@@ -405,41 +477,44 @@ class EmergencyTracker:
         
         # Calculate progress based on position along route
         route = session.calculated_route
+        route_len = len(route)
         current_junction = session.vehicle.current_junction_id
+        estimated = session.estimated_time
         
-        if not route or len(route) < 2:
+        if route_len < 2:
             return {
                 'progress': 0,
                 'currentJunction': current_junction,
                 'totalJunctions': 0,
-                'eta': session.estimated_time
+                'eta': estimated
             }
         
         # Find current position in route
         try:
-            current_idx = route.index(current_junction) if current_junction in route else 0
+            current_idx = route.index(current_junction)
         except ValueError:
             current_idx = 0
         
-        progress = (current_idx / (len(route) - 1)) * 100 if len(route) > 1 else 0
+        progress = (current_idx / (route_len - 1)) * 100
         
         # Estimate remaining time
-        elapsed = time.time() - session.activated_at
+        now = time.time()
+        elapsed = now - session.activated_at
         if progress > 0:
             total_estimated = elapsed / (progress / 100)
             eta = max(0, total_estimated - elapsed)
         else:
-            eta = session.estimated_time
+            eta = estimated
         
         return {
             'progress': round(progress, 1),
             'currentJunction': current_junction,
             'currentJunctionIndex': current_idx,
-            'totalJunctions': len(route),
-            'remainingJunctions': len(route) - current_idx - 1,
+            'totalJunctions': route_len,
+            'remainingJunctions': route_len - current_idx - 1,
             'elapsed': elapsed,
             'eta': eta,
-            'estimatedArrival': time.time() + eta
+            'estimatedArrival': now + eta
         }
     
     def _get_session(self, session_id: str) -> Optional[EmergencySession]:
@@ -487,17 +562,20 @@ class EmergencyTracker:
         return (None, None, None)
     
     def _has_reached_destination(self, session: EmergencySession) -> bool:
-        """Check if vehicle has reached destination"""
+        """
+        Check if a single vehicle has reached its destination
+        
+        Scalar counterpart of the tick kernel, used only by the
+        one-vehicle update_vehicle_position() path; tick() is the
+        authoritative arrival check for batched updates. Both compare
+        squared distance against ARRIVAL_RADIUS_SQ.
+        """
         vehicle_pos = session.vehicle.current_position
         dest_pos = session.vehicle.destination
         
-        # Simple distance check (within 30 units)
-        distance = (
-            (vehicle_pos[0] - dest_pos[0]) ** 2 +
-            (vehicle_pos[1] - dest_pos[1]) ** 2
-        ) ** 0.5
-        
-        return distance < 30
+        dx = vehicle_pos[0] - dest_pos[0]
+        dy = vehicle_pos[1] - dest_pos[1]
+        return dx * dx + dy * dy < ARRIVAL_RADIUS_SQ
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get emergency system statistics"""
@@ -6,23 +6,92 @@ Uses A* pathfinding on the road network graph.
 """
 
 from typing import List, Dict, Tuple, Optional, Any
+from pathlib import Path
+import hashlib
 import heapq
-from dataclasses import dataclass, field
+import json
+import itertools
+import math
+import sys
 import time
+from collections import deque
+from functools import partial
 
+import numpy as np
 
-@dataclass(order=True)
-class PathNode:
+from app.utils.jit import NUMBA_AVAILABLE
+from ._astar_numba import astar_csr
+
+
+# Node expansion limit per search
+MAX_ITERATIONS = 10000
+
+INF = float('inf')
+
+# Upper bound on cached path position maps (one per active route)
+PATH_POS_CACHE_SIZE = 256
+
+
+def _intern(value: Any) -> Any:
+    """Intern string IDs so graph dict lookups hit the identity fast path"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class BucketQueue:
     """
-    Node in A* pathfinding
+    Bucket (calendar) priority queue for quantized f-costs
     
-    Represents a junction being explored.
+    Entries are tuples whose first element is the priority. Priorities
+    are binned into buckets of `width`; a rolling window of
+    `num_buckets` deques gives O(1) push/pop, and entries beyond the
+    window wait in an overflow heap until the window reaches them.
+    Entries within one bucket pop in FIFO order, so results are exact
+    only up to `width`.
     """
-    f_cost: float
-    junction_id: str = field(compare=False)
-    g_cost: float = field(compare=False)  # Cost from start
-    h_cost: float = field(compare=False)  # Heuristic cost to goal
-    parent_id: Optional[str] = field(default=None, compare=False)
+    
+    def __init__(self, width: float, num_buckets: int = 4096):
+        self.width = width
+        self.num_buckets = num_buckets
+        self.buckets = [deque() for _ in range(num_buckets)]
+        self.current_idx = 0  # absolute bucket index at window start
+        self.in_window = 0
+        self.overflow: List[Tuple[int, int, tuple]] = []
+        self._seq = itertools.count()
+    
+    def __len__(self) -> int:
+        return self.in_window + len(self.overflow)
+    
+    def push(self, entry: tuple):
+        """Add an entry keyed on entry[0]"""
+        bucket = max(int(entry[0] // self.width), self.current_idx)
+        if bucket < self.current_idx + self.num_buckets:
+            self.buckets[bucket % self.num_buckets].append(entry)
+            self.in_window += 1
+        else:
+            heapq.heappush(self.overflow, (bucket, next(self._seq), entry))
+    
+    def pop(self) -> tuple:
+        """Remove and return an entry from the lowest non-empty bucket"""
+        if not self.in_window:
+            # Window drained: jump straight to the first overflow bucket
+            self.current_idx = self.overflow[0][0]
+            self._drain_overflow()
+        
+        while True:
+            bucket = self.buckets[self.current_idx % self.num_buckets]
+            if bucket:
+                self.in_window -= 1
+                return bucket.popleft()
+            self.current_idx += 1
+            self._drain_overflow()
+    
+    def _drain_overflow(self):
+        """Move overflow entries that now fall inside the window"""
+        window_end = self.current_idx + self.num_buckets
+        while self.overflow and self.overflow[0][0] < window_end:
+            bucket, _, entry = heapq.heappop(self.overflow)
+            self.buckets[bucket % self.num_buckets].append(entry)
+            self.in_window += 1
 
 
 class EmergencyPathfinder:
@@ -43,19 +112,56 @@ class EmergencyPathfinder:
         roads = pathfinder.get_road_segments_in_path(path)
     """
     
-    def __init__(self, map_loader=None):
+    def __init__(
+        self,
+        map_loader=None,
+        bucket_width: Optional[float] = None,
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize pathfinder
         
         Args:
             map_loader: MapLoaderService instance with junctions and roads
+            bucket_width: If set, A* uses a BucketQueue with this f-cost
+                resolution instead of a binary heap
+            cache_dir: Directory for compiled graph caches
         """
         self.map_loader = map_loader
+        self.bucket_width = bucket_width
+        
+        if cache_dir:
+            self.cache_dir = Path(cache_dir)
+        else:
+            self.cache_dir = Path(__file__).parent.parent.parent / "data" / "map_cache"
+        
+        # Signature of the map data the current graph was built from
+        self._graph_signature: Optional[str] = None
         
         # Graph structures
         self.junction_graph: Dict[str, Dict[str, float]] = {}  # junction_id -> {neighbor_id: weight}
         self.junction_positions: Dict[str, Tuple[float, float]] = {}  # junction_id -> (x, y)
-        self.road_lookup: Dict[Tuple[str, str], str] = {}  # (j1, j2) -> road_id
+        
+        # Compressed sparse row (CSR) graph used by A*, compiled from the
+        # dict views above. Junction IDs are interned to int indices.
+        self.id_to_idx: Dict[str, int] = {}
+        self.idx_to_id: List[str] = []
+        self.indptr = np.zeros(1, dtype=np.int32)  # node -> first edge row
+        self.indices = np.zeros(0, dtype=np.int32)  # edge row -> neighbor node
+        self.weights = np.zeros(0, dtype=np.float32)  # edge row -> length
+        self.edge_road_ids: List[Optional[str]] = []  # edge row -> road_id
+        self.edge_map: Dict[int, int] = {}  # (u << 32) | v -> edge row
+        self.xs = np.zeros(0, dtype=np.float32)
+        self.ys = np.zeros(0, dtype=np.float32)
+        
+        # Reverse CSR (incoming edges) for backward search
+        self.rev_indptr = np.zeros(1, dtype=np.int32)
+        self.rev_indices = np.zeros(0, dtype=np.int32)
+        self.rev_weights = np.zeros(0, dtype=np.float32)
+        
+        # tuple(path) -> {junction_id: position} for get_next_junctions.
+        # Keyed by a snapshot so in-place edits to a path never hit a stale map.
+        self._path_pos_cache: Dict[Tuple[str, ...], Dict[str, int]] = {}
         
         # Build graph if map loader provided
         if map_loader:
@@ -78,38 +184,135 @@ class EmergencyPathfinder:
         
         start_time = time.time()
         
-        # Reset graphs
-        self.junction_graph = {}
-        self.junction_positions = {}
-        self.road_lookup = {}
-        
         # Get junctions and roads from map loader
         junctions = self.map_loader.junctions
         roads = self.map_loader.roads
         
+        # Skip rebuild if the map has not changed
+        signature = self._map_signature(junctions, roads)
+        if signature is not None and signature == self._graph_signature:
+            return
+        
+        cache_file = self.cache_dir / f"graph_{signature}.npz" if signature else None
+        if cache_file and self._load_graph_cache(cache_file):
+            self._graph_signature = signature
+            elapsed = (time.time() - start_time) * 1000
+            print(f"   Graph loaded from cache in {elapsed:.1f}ms")
+            return
+        
+        # Reset graphs
+        self.junction_graph = {}
+        self.junction_positions = {}
+        road_lookup: Dict[Tuple[str, str], str] = {}  # (j1, j2) -> road_id
+        
         # Initialize junction nodes
         for junction in junctions:
-            self.junction_graph[junction.id] = {}
-            self.junction_positions[junction.id] = (junction.x, junction.y)
+            jid = _intern(junction.id)
+            self.junction_graph[jid] = {}
+            self.junction_positions[jid] = (junction.x, junction.y)
         
         # Add edges from roads
         for road in roads:
-            start_id = road.start_junction_id
-            end_id = road.end_junction_id
+            start_id = _intern(road.start_junction_id)
+            end_id = _intern(road.end_junction_id)
+            road_id = _intern(road.id)
             weight = road.length if road.length > 0 else 100  # Default weight if no length
             
             # Add bidirectional edges (unless oneway)
             if start_id in self.junction_graph:
                 self.junction_graph[start_id][end_id] = weight
-                self.road_lookup[(start_id, end_id)] = road.id
+                road_lookup[(start_id, end_id)] = road_id
             
             if not road.oneway and end_id in self.junction_graph:
                 self.junction_graph[end_id][start_id] = weight
-                self.road_lookup[(end_id, start_id)] = road.id
+                road_lookup[(end_id, start_id)] = road_id
+        
+        self._compile_csr(road_lookup)
+        self._graph_signature = signature
+        
+        if cache_file:
+            self._save_graph_cache(cache_file)
         
         elapsed = (time.time() - start_time) * 1000
         print(f"   Graph built in {elapsed:.1f}ms")
     
+    def _map_signature(self, junctions: List[Any], roads: List[Any]) -> Optional[str]:
+        """Hash junction/road IDs, positions and lengths to key the graph cache"""
+        try:
+            payload = json.dumps([
+                [[j.id, j.x, j.y] for j in junctions],
+                [[r.id, r.start_junction_id, r.end_junction_id, r.length, r.oneway] for r in roads]
+            ])
+        except (TypeError, AttributeError):
+            return None
+        
+        return hashlib.blake2b(payload.encode()).hexdigest()[:16]
+    
+    def _save_graph_cache(self, cache_file: Path):
+        """Persist compiled graph arrays and ID tables"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                cache_file,
+                junction_ids=np.asarray(self.idx_to_id, dtype=str),
+                positions=np.asarray(
+                    [self.junction_positions[jid] for jid in self.idx_to_id],
+                    dtype=np.float64
+                ).reshape(-1, 2),
+                indptr=self.indptr,
+                indices=self.indices,
+                weights=self.weights,
+                edge_road_ids=np.asarray(
+                    [road_id or '' for road_id in self.edge_road_ids], dtype=str
+                ),
+            )
+        except Exception as e:
+            print(f"[WARN] Could not cache graph: {e}")
+    
+    def _load_graph_cache(self, cache_file: Path) -> bool:
+        """Load compiled graph arrays and rebuild the dict views; False on miss"""
+        if not cache_file.exists():
+            return False
+        
+        try:
+            with np.load(cache_file) as data:
+                idx_to_id = [sys.intern(jid) for jid in data['junction_ids'].tolist()]
+                positions = data['positions']
+                indptr = data['indptr']
+                indices = data['indices']
+                weights = data['weights']
+                edge_road_ids = [sys.intern(road_id) for road_id in data['edge_road_ids'].tolist()]
+        except Exception as e:
+            print(f"[WARN] Could not load graph cache: {e}")
+            return False
+        
+        self.idx_to_id = idx_to_id
+        self.id_to_idx = {jid: i for i, jid in enumerate(idx_to_id)}
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.xs = positions[:, 0].astype(np.float32)
+        self.ys = positions[:, 1].astype(np.float32)
+        
+        self.junction_positions = {
+            jid: (x, y) for jid, (x, y) in zip(idx_to_id, positions.tolist())
+        }
+        indices_list = indices.tolist()
+        weights_list = weights.tolist()
+        indptr_list = indptr.tolist()
+        self.junction_graph = {
+            jid: {
+                idx_to_id[indices_list[k]]: weights_list[k]
+                for k in range(indptr_list[i], indptr_list[i + 1])
+            }
+            for i, jid in enumerate(idx_to_id)
+        }
+        self.edge_road_ids = [road_id or None for road_id in edge_road_ids]
+        
+        self._compile_reverse_csr()
+        self._compile_edge_map()
+        return True
+    
     def build_graph_from_data(
         self,
         junctions: List[Any],
@@ -126,11 +329,12 @@ class EmergencyPathfinder:
         """
         self.junction_graph = {}
         self.junction_positions = {}
-        self.road_lookup = {}
+        self._graph_signature = None  # No longer the map loader's graph
+        road_lookup: Dict[Tuple[str, str], str] = {}  # (j1, j2) -> road_id
         
         # Initialize junctions
         for junction in junctions:
-            jid = junction.id if hasattr(junction, 'id') else junction.get('id')
+            jid = _intern(junction.id if hasattr(junction, 'id') else junction.get('id'))
             x = junction.x if hasattr(junction, 'x') else junction.get('x', 0)
             y = junction.y if hasattr(junction, 'y') else junction.get('y', 0)
             
@@ -139,20 +343,22 @@ class EmergencyPathfinder:
         
         # Add road edges
         for road in roads:
-            start_id = road.start_junction_id if hasattr(road, 'start_junction_id') else road.get('start_junction_id')
-            end_id = road.end_junction_id if hasattr(road, 'end_junction_id') else road.get('end_junction_id')
+            start_id = _intern(road.start_junction_id if hasattr(road, 'start_junction_id') else road.get('start_junction_id'))
+            end_id = _intern(road.end_junction_id if hasattr(road, 'end_junction_id') else road.get('end_junction_id'))
             length = road.length if hasattr(road, 'length') else road.get('length', 100)
-            road_id = road.id if hasattr(road, 'id') else road.get('id')
+            road_id = _intern(road.id if hasattr(road, 'id') else road.get('id'))
             oneway = road.oneway if hasattr(road, 'oneway') else road.get('oneway', False)
             
             # Add bidirectional edges
             if start_id in self.junction_graph:
                 self.junction_graph[start_id][end_id] = length
-                self.road_lookup[(start_id, end_id)] = road_id
+                road_lookup[(start_id, end_id)] = road_id
             
             if not oneway and end_id in self.junction_graph:
                 self.junction_graph[end_id][start_id] = length
-                self.road_lookup[(end_id, start_id)] = road_id
+                road_lookup[(end_id, start_id)] = road_id
+        
+        self._compile_csr(road_lookup)
     
     def build_mock_graph(self, grid_size: int = 3):
         """
@@ -162,14 +368,15 @@ class EmergencyPathfinder:
         """
         self.junction_graph = {}
         self.junction_positions = {}
-        self.road_lookup = {}
+        self._graph_signature = None  # No longer the map loader's graph
+        road_lookup: Dict[Tuple[str, str], str] = {}  # (j1, j2) -> road_id
         
         # Create grid positions
         cell_size = 300
         for row in range(grid_size):
             for col in range(grid_size):
                 idx = row * grid_size + col
-                jid = f"J-{idx}"
+                jid = sys.intern(f"J-{idx}")
                 x = 100 + col * cell_size
                 y = 100 + row * cell_size
                 
@@ -180,29 +387,91 @@ class EmergencyPathfinder:
         road_idx = 0
         for row in range(grid_size):
             for col in range(grid_size - 1):
-                j1 = f"J-{row * grid_size + col}"
-                j2 = f"J-{row * grid_size + col + 1}"
+                j1 = sys.intern(f"J-{row * grid_size + col}")
+                j2 = sys.intern(f"J-{row * grid_size + col + 1}")
+                road_id = sys.intern(f"R-{road_idx}")
                 
                 self.junction_graph[j1][j2] = cell_size
                 self.junction_graph[j2][j1] = cell_size
-                self.road_lookup[(j1, j2)] = f"R-{road_idx}"
-                self.road_lookup[(j2, j1)] = f"R-{road_idx}"
+                road_lookup[(j1, j2)] = road_id
+                road_lookup[(j2, j1)] = road_id
                 road_idx += 1
         
         # Add edges (vertical)
         for row in range(grid_size - 1):
             for col in range(grid_size):
-                j1 = f"J-{row * grid_size + col}"
-                j2 = f"J-{(row + 1) * grid_size + col}"
+                j1 = sys.intern(f"J-{row * grid_size + col}")
+                j2 = sys.intern(f"J-{(row + 1) * grid_size + col}")
+                road_id = sys.intern(f"R-{road_idx}")
                 
                 self.junction_graph[j1][j2] = cell_size
                 self.junction_graph[j2][j1] = cell_size
-                self.road_lookup[(j1, j2)] = f"R-{road_idx}"
-                self.road_lookup[(j2, j1)] = f"R-{road_idx}"
+                road_lookup[(j1, j2)] = road_id
+                road_lookup[(j2, j1)] = road_id
                 road_idx += 1
         
+        self._compile_csr(road_lookup)
+        
         print(f"   Mock graph built: {len(self.junction_graph)} junctions")
     
+    def _compile_csr(self, road_lookup: Dict[Tuple[str, str], str]):
+        """
+        Compile the dict adjacency into CSR arrays
+        
+        Edges of node `u` occupy rows indptr[u]:indptr[u+1] of
+        `indices` (neighbor index), `weights` (edge length) and
+        `edge_road_ids` (road ID). Edges to junctions missing from the
+        graph are dropped.
+        """
+        self.idx_to_id = list(self.junction_graph)
+        self.id_to_idx = {jid: i for i, jid in enumerate(self.idx_to_id)}
+        id_to_idx = self.id_to_idx
+        
+        indptr = [0]
+        indices = []
+        weights = []
+        edge_road_ids = []
+        for jid in self.idx_to_id:
+            for neighbor_id, weight in self.junction_graph[jid].items():
+                neighbor_idx = id_to_idx.get(neighbor_id)
+                if neighbor_idx is not None:
+                    indices.append(neighbor_idx)
+                    weights.append(weight)
+                    edge_road_ids.append(road_lookup.get((jid, neighbor_id)))
+            indptr.append(len(indices))
+        
+        self.edge_road_ids = edge_road_ids
+        
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        
+        positions = [self.junction_positions[jid] for jid in self.idx_to_id]
+        self.xs = np.asarray([p[0] for p in positions], dtype=np.float32)
+        self.ys = np.asarray([p[1] for p in positions], dtype=np.float32)
+        
+        self._compile_reverse_csr()
+        self._compile_edge_map()
+    
+    def _compile_reverse_csr(self):
+        """Transpose the CSR graph so incoming edges are contiguous per node"""
+        n = len(self.idx_to_id)
+        sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind='stable')
+        
+        self.rev_indices = sources[order].astype(np.int32)
+        self.rev_weights = self.weights[order]
+        self.rev_indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(self.indices, minlength=n), out=self.rev_indptr[1:])
+    
+    def _compile_edge_map(self):
+        """Index edge rows by packed (source, target) node pair"""
+        sources = np.repeat(
+            np.arange(len(self.idx_to_id), dtype=np.int64), np.diff(self.indptr)
+        )
+        keys = (sources << 32) | self.indices.astype(np.int64)
+        self.edge_map = dict(zip(keys.tolist(), range(len(keys))))
+    
     def find_path(
         self,
         start_junction_id: str,
@@ -238,76 +507,230 @@ class EmergencyPathfinder:
         if start_junction_id == end_junction_id:
             return [start_junction_id]
         
-        # A* algorithm
-        open_set: List[PathNode] = []
-        closed_set: set = set()
-        g_costs: Dict[str, float] = {start_junction_id: 0}
-        parents: Dict[str, str] = {}
+        start_idx = self.id_to_idx[start_junction_id]
+        goal_idx = self.id_to_idx[end_junction_id]
         
-        # Start node
-        h_start = self._heuristic(start_junction_id, end_junction_id)
-        start_node = PathNode(
-            f_cost=h_start,
-            junction_id=start_junction_id,
-            g_cost=0,
-            h_cost=h_start
+        # Heuristic to the goal for every node in one vectorized pass
+        h = self._heuristic_to(goal_idx)
+        
+        if NUMBA_AVAILABLE and self.bucket_width is None:
+            path, iterations = self._astar_compiled(start_idx, goal_idx, h)
+        else:
+            path, iterations = self._astar_python(start_idx, goal_idx, h)
+        
+        elapsed = (time.time() - start_time) * 1000
+        if path:
+            print(f"[OK] Path found: {len(path)} junctions, {iterations} iterations, {elapsed:.1f}ms")
+            return path
+        
+        # No path found
+        print(f"[ERROR] No path found: {start_junction_id} -> {end_junction_id} ({iterations} iterations, {elapsed:.1f}ms)")
+        return None
+    
+    def _astar_compiled(
+        self,
+        start_idx: int,
+        goal_idx: int,
+        h: np.ndarray
+    ) -> Tuple[Optional[List[str]], int]:
+        """Run the compiled A* kernel; returns (path, iterations)"""
+        n = len(self.idx_to_id)
+        g_costs = np.empty(n, dtype=np.float32)
+        parents = np.empty(n, dtype=np.int32)
+        
+        found, iterations = astar_csr(
+            self.indptr, self.indices, self.weights, h,
+            start_idx, goal_idx, g_costs, parents, MAX_ITERATIONS
         )
-        heapq.heappush(open_set, start_node)
+        if not found:
+            return None, iterations
+        
+        # Walk parent array back from goal
+        idx_to_id = self.idx_to_id
+        path = []
+        current = goal_idx
+        while current != -1:
+            path.append(idx_to_id[current])
+            current = parents[current]
+        path.reverse()
+        return path, iterations
+    
+    def _astar_python(
+        self,
+        start_idx: int,
+        goal_idx: int,
+        h: np.ndarray
+    ) -> Tuple[Optional[List[str]], int]:
+        """Pure-Python A* (heap or bucket queue); returns (path, iterations)"""
+        indptr = self.indptr
+        indices = self.indices
+        weights = self.weights
+        h = h.tolist()
+        
+        # Entries are (f_cost, tie_breaker, junction_idx, g_cost)
+        if self.bucket_width:
+            open_set = BucketQueue(self.bucket_width)
+            push, pop = open_set.push, open_set.pop
+        else:
+            open_set = []
+            push = partial(heapq.heappush, open_set)
+            pop = partial(heapq.heappop, open_set)
+        counter = itertools.count()
+        g_costs: Dict[int, float] = {start_idx: 0}
+        parents: Dict[int, int] = {}
+        
+        # Start node
+        push((h[start_idx], next(counter), start_idx, 0.0))
         
         iterations = 0
-        max_iterations = 10000
         
-        while open_set and iterations < max_iterations:
+        while open_set and iterations < MAX_ITERATIONS:
             iterations += 1
             
             # Get node with lowest f_cost
-            current = heapq.heappop(open_set)
+            _, _, current_idx, current_g = pop()
             
             # Goal reached
-            if current.junction_id == end_junction_id:
-                path = self._reconstruct_path(parents, end_junction_id, start_junction_id)
-                elapsed = (time.time() - start_time) * 1000
-                print(f"[OK] Path found: {len(path)} junctions, {iterations} iterations, {elapsed:.1f}ms")
-                return path
+            if current_idx == goal_idx:
+                return self._reconstruct_path(parents, goal_idx, start_idx), iterations
             
-            # Skip if already processed
-            if current.junction_id in closed_set:
+            # Skip stale entry superseded by a cheaper push (lazy decrease-key)
+            if current_g > g_costs[current_idx]:
                 continue
             
-            closed_set.add(current.junction_id)
-            
-            # Explore neighbors
-            neighbors = self.junction_graph.get(current.junction_id, {})
+            # Explore neighbors (contiguous CSR slice)
+            row_start = indptr[current_idx]
+            row_end = indptr[current_idx + 1]
             
-            for neighbor_id, edge_weight in neighbors.items():
-                if neighbor_id in closed_set:
-                    continue
-                
+            for neighbor_idx, edge_weight in zip(
+                indices[row_start:row_end].tolist(),
+                weights[row_start:row_end].tolist()
+            ):
                 # Calculate g_cost
-                tentative_g = current.g_cost + edge_weight
+                tentative_g = current_g + edge_weight
                 
                 # Skip if not better than existing path
-                if neighbor_id in g_costs and tentative_g >= g_costs[neighbor_id]:
+                if tentative_g >= g_costs.get(neighbor_idx, INF):
                     continue
                 
                 # Update best path to neighbor
-                g_costs[neighbor_id] = tentative_g
-                parents[neighbor_id] = current.junction_id
+                g_costs[neighbor_idx] = tentative_g
+                parents[neighbor_idx] = current_idx
                 
                 # Add to open set
-                h_cost = self._heuristic(neighbor_id, end_junction_id)
-                neighbor_node = PathNode(
-                    f_cost=tentative_g + h_cost,
-                    junction_id=neighbor_id,
-                    g_cost=tentative_g,
-                    h_cost=h_cost
+                push((tentative_g + h[neighbor_idx], next(counter), neighbor_idx, tentative_g))
+        
+        return None, iterations
+    
+    def find_path_bidirectional(
+        self,
+        start_junction_id: str,
+        end_junction_id: str
+    ) -> Optional[List[str]]:
+        """
+        Find shortest path using bidirectional A*
+        
+        Runs a forward search from the start (heuristic to the end) and a
+        backward search over incoming edges from the end (heuristic to the
+        start), expanding the smaller frontier each step. Stops once the
+        best meeting cost is no worse than the larger of the two frontier
+        minima, which keeps the result optimal for admissible heuristics.
+        
+        Args:
+            start_junction_id: Starting junction ID
+            end_junction_id: Destination junction ID
+        
+        Returns:
+            List of junction IDs in path, or None if no path found
+        """
+        start_time = time.time()
+        
+        if not self.junction_graph:
+            print("[WARN] No graph loaded, building mock graph")
+            self.build_mock_graph()
+        
+        if start_junction_id not in self.id_to_idx or end_junction_id not in self.id_to_idx:
+            print(f"[ERROR] Junction not found: {start_junction_id} -> {end_junction_id}")
+            return None
+        
+        if start_junction_id == end_junction_id:
+            return [start_junction_id]
+        
+        start_idx = self.id_to_idx[start_junction_id]
+        goal_idx = self.id_to_idx[end_junction_id]
+        
+        # Per direction: (indptr, indices, weights, heuristic, heap, g_costs, parents)
+        forward = (
+            self.indptr, self.indices, self.weights,
+            self._heuristic_to(goal_idx).tolist(), [], {start_idx: 0.0}, {}
+        )
+        backward = (
+            self.rev_indptr, self.rev_indices, self.rev_weights,
+            self._heuristic_to(start_idx).tolist(), [], {goal_idx: 0.0}, {}
+        )
+        counter = itertools.count()
+        heapq.heappush(forward[4], (forward[3][start_idx], next(counter), start_idx, 0.0))
+        heapq.heappush(backward[4], (backward[3][goal_idx], next(counter), goal_idx, 0.0))
+        
+        best_cost = INF
+        meeting_idx = -1
+        iterations = 0
+        
+        while forward[4] and backward[4] and iterations < MAX_ITERATIONS:
+            if best_cost <= max(forward[4][0][0], backward[4][0][0]):
+                break
+            iterations += 1
+            
+            # Expand the smaller frontier
+            if len(forward[4]) <= len(backward[4]):
+                side, other = forward, backward
+            else:
+                side, other = backward, forward
+            indptr, indices, weights, h, open_set, g_costs, parents = side
+            other_g = other[5]
+            
+            _, _, current_idx, current_g = heapq.heappop(open_set)
+            if current_g > g_costs[current_idx]:
+                continue
+            
+            row_start = indptr[current_idx]
+            row_end = indptr[current_idx + 1]
+            for neighbor_idx, edge_weight in zip(
+                indices[row_start:row_end].tolist(),
+                weights[row_start:row_end].tolist()
+            ):
+                tentative_g = current_g + edge_weight
+                if tentative_g >= g_costs.get(neighbor_idx, INF):
+                    continue
+                
+                g_costs[neighbor_idx] = tentative_g
+                parents[neighbor_idx] = current_idx
+                heapq.heappush(
+                    open_set,
+                    (tentative_g + h[neighbor_idx], next(counter), neighbor_idx, tentative_g)
                 )
-                heapq.heappush(open_set, neighbor_node)
+                
+                # Frontiers touch: candidate meeting point
+                if neighbor_idx in other_g:
+                    total = tentative_g + other_g[neighbor_idx]
+                    if total < best_cost:
+                        best_cost = total
+                        meeting_idx = neighbor_idx
         
-        # No path found
         elapsed = (time.time() - start_time) * 1000
-        print(f"[ERROR] No path found: {start_junction_id} -> {end_junction_id} ({iterations} iterations, {elapsed:.1f}ms)")
-        return None
+        if meeting_idx < 0:
+            print(f"[ERROR] No path found: {start_junction_id} -> {end_junction_id} ({iterations} iterations, {elapsed:.1f}ms)")
+            return None
+        
+        # Stitch start -> meeting (forward parents) and meeting -> goal (backward parents)
+        path = self._reconstruct_path(forward[6], meeting_idx, start_idx)
+        current = backward[6].get(meeting_idx)
+        while current is not None:
+            path.append(self.idx_to_id[current])
+            current = backward[6].get(current)
+        
+        print(f"[OK] Path found (bidirectional): {len(path)} junctions, {iterations} iterations, {elapsed:.1f}ms")
+        return path
     
     def _heuristic(self, junction_id: str, goal_id: str) -> float:
         """
@@ -320,27 +743,35 @@ class EmergencyPathfinder:
         Returns:
             Estimated distance to goal
         """
-        if junction_id not in self.junction_positions or goal_id not in self.junction_positions:
+        if junction_id not in self.id_to_idx or goal_id not in self.id_to_idx:
             return 0.0
         
-        x1, y1 = self.junction_positions[junction_id]
-        x2, y2 = self.junction_positions[goal_id]
-        
-        return ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+        return self._heuristic_idx(self.id_to_idx[junction_id], self.id_to_idx[goal_id])
+    
+    def _heuristic_to(self, goal_idx: int) -> np.ndarray:
+        """Euclidean distance from every junction to the goal (float32[N])"""
+        dx = self.xs - self.xs[goal_idx]
+        dy = self.ys - self.ys[goal_idx]
+        return np.sqrt(dx * dx + dy * dy).astype(np.float32)
+    
+    def _heuristic_idx(self, a: int, b: int) -> float:
+        """Euclidean distance between two junctions by graph index"""
+        return math.hypot(float(self.xs[a] - self.xs[b]), float(self.ys[a] - self.ys[b]))
     
     def _reconstruct_path(
         self,
-        parents: Dict[str, str],
-        end_id: str,
-        start_id: str
+        parents: Dict[int, int],
+        end_idx: int,
+        start_idx: int
     ) -> List[str]:
-        """Reconstruct path from goal to start using parent links"""
+        """Reconstruct junction ID path from goal to start using parent links"""
+        idx_to_id = self.idx_to_id
         path = []
-        current = end_id
+        current = end_idx
         
-        while current:
-            path.append(current)
-            if current == start_id:
+        while current is not None:
+            path.append(idx_to_id[current])
+            if current == start_idx:
                 break
             current = parents.get(current)
         
@@ -361,16 +792,23 @@ class EmergencyPathfinder:
         if not junction_path or len(junction_path) < 2:
             return 0.0
         
-        total_distance = 0.0
+        # Unknown junctions map to -1, which never forms a valid edge key
+        idx_path = np.fromiter(
+            (self.id_to_idx.get(jid, -1) for jid in junction_path),
+            dtype=np.int64,
+            count=len(junction_path)
+        )
+        keys = (idx_path[:-1] << 32) | idx_path[1:]
         
-        for i in range(len(junction_path) - 1):
-            j1 = junction_path[i]
-            j2 = junction_path[i + 1]
-            
-            edge_weight = self.junction_graph.get(j1, {}).get(j2, 0)
-            total_distance += edge_weight
+        edge_map = self.edge_map
+        rows = np.fromiter(
+            (edge_map.get(key, -1) for key in keys.tolist()),
+            dtype=np.int64,
+            count=len(keys)
+        )
         
-        return total_distance
+        # Missing edges contribute zero distance
+        return float(self.weights[rows[rows >= 0]].sum(dtype=np.float64))
     
     def get_road_segments_in_path(self, junction_path: List[str]) -> List[str]:
         """
@@ -385,18 +823,26 @@ class EmergencyPathfinder:
         if not junction_path or len(junction_path) < 2:
             return []
         
+        id_to_idx = self.id_to_idx
+        edge_road_ids = self.edge_road_ids
         road_ids = []
         
-        for i in range(len(junction_path) - 1):
-            j1 = junction_path[i]
-            j2 = junction_path[i + 1]
+        for j1, j2 in zip(junction_path, junction_path[1:]):
+            u = id_to_idx.get(j1)
+            v = id_to_idx.get(j2)
+            if u is None or v is None:
+                continue
             
-            road_id = self.road_lookup.get((j1, j2))
-            if road_id:
-                road_ids.append(road_id)
+            edge = self._edge_of(u, v)
+            if edge >= 0 and edge_road_ids[edge]:
+                road_ids.append(edge_road_ids[edge])
         
         return road_ids
     
+    def _edge_of(self, u: int, v: int) -> int:
+        """Find the CSR edge row for u -> v, or -1 if there is no such edge"""
+        return self.edge_map.get((u << 32) | v, -1)
+    
     def estimate_travel_time(
         self,
         junction_path: List[str],
@@ -443,14 +889,33 @@ class EmergencyPathfinder:
         Returns:
             List of upcoming junction IDs
         """
-        if current_junction not in path:
+        current_idx = self._path_positions(path).get(current_junction)
+        if current_idx is None:
             return path[:lookahead]
         
-        try:
-            current_idx = path.index(current_junction)
-            return path[current_idx:current_idx + lookahead + 1]
-        except (ValueError, IndexError):
-            return []
+        return path[current_idx:current_idx + lookahead + 1]
+    
+    def _path_positions(self, path: List[str]) -> Dict[str, int]:
+        """
+        Get (or build) the junction -> position map for a path
+        
+        Maps are cached per path contents, so a path edited in place
+        (rerouted, extended) gets a fresh map. The first occurrence wins,
+        matching list.index().
+        """
+        key = tuple(path)
+        cached = self._path_pos_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        positions = {}
+        for idx, junction_id in enumerate(path):
+            positions.setdefault(junction_id, idx)
+        
+        if len(self._path_pos_cache) >= PATH_POS_CACHE_SIZE:
+            self._path_pos_cache.clear()
+        self._path_pos_cache[key] = positions
+        return positions
 
 
 # Global pathfinder instance
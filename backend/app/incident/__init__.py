@@ -6,6 +6,7 @@ vehicle movement after an incident is reported.
 
 Components:
 - DetectionHistoryLogger: Logs vehicle detections at junctions
+- DetectionStore: Columnar in-memory window of recent detections
 - IncidentManager: Manages incident records and lifecycle
 - VehicleInferenceEngine: Infers probable vehicle locations
 
@@ -43,6 +44,7 @@ from app.incident.detection_logger import (
     get_detection_logger,
     set_detection_logger
 )
+from app.incident.detection_store import DetectionStore
 
 # Incident Manager
 from app.incident.incident_manager import (
@@ -74,6 +76,7 @@ __all__ = [
     'init_detection_logger',
     'get_detection_logger',
     'set_detection_logger',
+    'DetectionStore',
     
     # Incident Manager
     'IncidentManager',
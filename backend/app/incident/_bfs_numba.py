@@ -0,0 +1,58 @@
+"""
+Hop-limited BFS Kernel over CSR Arrays
+
+Breadth-first search used by VehicleInferenceEngine to find junctions
+reachable within a hop budget. The queue is a preallocated int32 array
+with head/tail cursors, so the kernel does no per-node allocation.
+Compiled with Numba when available (see app.utils.jit).
+"""
+
+import numpy as np
+
+from app.utils.jit import njit
+
+
+@njit(cache=True, boundscheck=False)
+def bfs_csr(indptr, indices, start, max_hops):
+    """
+    BFS from `start` on a CSR graph, stopping at `max_hops`
+    
+    Args:
+        indptr: int32[N+1] edge row offsets per node
+        indices: int32[E] neighbor node per edge row
+        start: start node index
+        max_hops: maximum hop distance to expand to
+    
+    Returns:
+        (nodes, dists): int32 arrays of reached node indices in BFS order
+        and their hop distance from `start`
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, -1, dtype=np.int16)
+    queue = np.empty(n, dtype=np.int32)
+    
+    dist[start] = 0
+    queue[0] = start
+    head = 0
+    tail = 1
+    
+    while head < tail:
+        u = queue[head]
+        head += 1
+        
+        next_dist = dist[u] + 1
+        if next_dist > max_hops:
+            continue
+        
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if dist[v] < 0:
+                dist[v] = next_dist
+                queue[tail] = v
+                tail += 1
+    
+    nodes = queue[:tail].copy()
+    dists = np.empty(tail, dtype=np.int32)
+    for i in range(tail):
+        dists[i] = dist[nodes[i]]
+    return nodes, dists
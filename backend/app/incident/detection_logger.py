@@ -14,17 +14,34 @@ Privacy principles:
 - Used only for incident-triggered investigations
 """
 
+import os
 import time
-import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Deque, Iterable, List, Optional
 import asyncio
 
 from app.database.models import DetectionRecord
-from app.database.database import SessionLocal
+from app.database.database import SessionLocal, engine
+from app.incident.detection_store import DetectionStore
 
 
-@dataclass
+# Seconds between retention cleanups
+CLEANUP_INTERVAL = 300.0
+
+# Random bytes per detection record ID (48 bits -> 12 hex chars)
+ID_BYTES = 6
+
+
+def _generate_record_ids(count: int) -> List[str]:
+    """Generate `count` detection record IDs from a single urandom read"""
+    rnd = os.urandom(ID_BYTES * count).hex()
+    width = ID_BYTES * 2
+    return ["det-" + rnd[i:i + width] for i in range(0, width * count, width)]
+
+
+@dataclass(slots=True)
 class VehicleDetectionEvent:
     """Single vehicle detection event at a junction"""
     vehicle_id: str
@@ -48,6 +65,7 @@ class DetectionHistoryLogger:
     - Batch inserts for performance
     - 24-hour retention policy
     - In-memory buffer with periodic flush
+    - Columnar in-memory window for route/summary analytics (store)
     - Statistics tracking
     
     Usage:
@@ -59,7 +77,8 @@ class DetectionHistoryLogger:
         self,
         buffer_size: int = 100,
         flush_interval: float = 5.0,
-        retention_hours: int = 24
+        retention_hours: int = 24,
+        store_window_seconds: float = 3600.0
     ):
         """
         Initialize detection logger
@@ -68,22 +87,40 @@ class DetectionHistoryLogger:
             buffer_size: Number of detections before flush
             flush_interval: Max seconds between flushes
             retention_hours: Hours to retain records
+            store_window_seconds: Seconds of detections kept in memory
         """
         self.buffer_size = buffer_size
         self.flush_interval = flush_interval
         self.retention_hours = retention_hours
         
-        # In-memory buffer for batch inserts
-        self._buffer: List[VehicleDetectionEvent] = []
-        self._buffer_lock = asyncio.Lock()
+        # In-memory buffer for batch inserts. deque.append is atomic, so
+        # producers never lock; flushes swap the deque out wholesale.
+        self._buffer: Deque[VehicleDetectionEvent] = deque()
+        
+        # Recent detections, column-wise, for in-memory analytics
+        self.store = DetectionStore(window_seconds=store_window_seconds)
+        
+        # Serializes DB flushes only (not buffer writes)
+        self._flush_lock = asyncio.Lock()
+        
+        # Set while an overflow flush task is scheduled
+        self._flush_pending = False
+        
+        # Core INSERT compiled once, executed as executemany per flush
+        self._insert_stmt = DetectionRecord.__table__.insert()
         
         # Statistics
         self.total_detections = 0
         self.total_flushes = 0
         self.last_flush_time = time.time()
         
-        # Background task
+        # Single DB worker thread: keeps blocking SQLAlchemy calls off the
+        # event loop and serializes flushes with retention cleanup
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detection-db")
+        
+        # Background tasks
         self._flush_task: Optional[asyncio.Task] = None
+        self._cleanup_task: Optional[asyncio.Task] = None
         self._running = False
         
         print("[OK] Detection History Logger initialized")
@@ -95,18 +132,20 @@ class DetectionHistoryLogger:
         
         self._running = True
         self._flush_task = asyncio.create_task(self._periodic_flush())
+        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
         print("[DETECTION] Background flush task started")
     
     async def stop(self):
         """Stop logger and flush remaining buffer"""
         self._running = False
         
-        if self._flush_task:
-            self._flush_task.cancel()
-            try:
-                await self._flush_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._flush_task, self._cleanup_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         # Final flush
         await self._flush_buffer()
@@ -154,14 +193,22 @@ class DetectionHistoryLogger:
             outgoing_road=outgoing_road
         )
         
-        # Add to buffer (thread-safe for sync context)
+        # Add to buffer (atomic deque append, no lock needed)
         self._buffer.append(detection)
+        self.store.append(number_plate, vehicle_id, junction_id, vehicle_type, speed, detection.timestamp)
         self.total_detections += 1
         
-        # Check if buffer needs flush
-        if len(self._buffer) >= self.buffer_size:
-            # Schedule async flush
-            asyncio.create_task(self._flush_buffer())
+        # Schedule a single async flush on overflow; further detections
+        # just extend the buffer for the pending flush
+        if len(self._buffer) >= self.buffer_size and not self._flush_pending:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop (sync caller); periodic flush picks it up
+                return
+            
+            self._flush_pending = True
+            asyncio.create_task(self._flush_and_clear())
     
     async def log_detection_async(
         self,
@@ -191,12 +238,12 @@ class DetectionHistoryLogger:
             outgoing_road=outgoing_road
         )
         
-        async with self._buffer_lock:
-            self._buffer.append(detection)
-            self.total_detections += 1
-            
-            if len(self._buffer) >= self.buffer_size:
-                await self._flush_buffer()
+        self._buffer.append(detection)
+        self.store.append(number_plate, vehicle_id, junction_id, vehicle_type, speed, detection.timestamp)
+        self.total_detections += 1
+        
+        if len(self._buffer) >= self.buffer_size:
+            await self._flush_buffer()
     
     async def _periodic_flush(self):
         """Background task to periodically flush buffer"""
@@ -207,30 +254,102 @@ class DetectionHistoryLogger:
                 if self._buffer:
                     await self._flush_buffer()
                 
-                # Cleanup old records periodically
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"[DETECTION] Periodic flush error: {e}")
+    
+    async def _periodic_cleanup(self):
+        """Background task to remove expired records every CLEANUP_INTERVAL"""
+        while self._running:
+            try:
+                await asyncio.sleep(CLEANUP_INTERVAL)
                 await self._cleanup_old_records()
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"[DETECTION] Periodic flush error: {e}")
+                print(f"[DETECTION] Periodic cleanup error: {e}")
     
     async def _flush_buffer(self):
         """Flush detection buffer to database"""
-        async with self._buffer_lock:
+        async with self._flush_lock:
             if not self._buffer:
                 return
             
-            buffer_copy = self._buffer.copy()
-            self._buffer = []
+            # Swap buffers (single reference assignment)
+            buffer_copy, self._buffer = self._buffer, deque()
+            
+            loop = asyncio.get_running_loop()
+            flushed = await loop.run_in_executor(self._db_executor, self._do_flush, buffer_copy)
+            
+            if not flushed:
+                # Re-add failed records ahead of newer detections
+                self._buffer.extendleft(reversed(buffer_copy))
+                return
+            
+            self.total_flushes += 1
+            self.last_flush_time = time.time()
+            
+            print(f"📝 [DETECTION] Flushed {len(buffer_copy)} detections to database")
+    
+    async def _flush_and_clear(self):
+        """Run an overflow flush and clear the pending flag"""
+        try:
+            await self._flush_buffer()
+        finally:
+            self._flush_pending = False
+    
+    def _do_flush(self, records: Deque[VehicleDetectionEvent]) -> bool:
+        """Write records to the database (blocking, runs on the DB thread)"""
+        try:
+            self._insert_records(records)
+        except Exception as e:
+            print(f"[WARN] [DETECTION] Batch insert failed, retrying via ORM: {e}")
+            try:
+                self._insert_records_orm(records)
+            except Exception as e:
+                print(f"[ERROR] [DETECTION] Flush error: {e}")
+                return False
+        
+        return True
+    
+    def _insert_records(self, detections: Iterable[VehicleDetectionEvent]):
+        """Insert detections with one executemany in a single transaction"""
+        detections = list(detections)
+        record_ids = _generate_record_ids(len(detections))
+        params = [
+            {
+                'id': record_id,
+                'vehicle_id': d.vehicle_id,
+                'number_plate': d.number_plate,
+                'junction_id': d.junction_id,
+                'direction': d.direction,
+                'timestamp': d.timestamp,
+                'position_x': d.position_x,
+                'position_y': d.position_y,
+                'speed': d.speed,
+                'vehicle_type': d.vehicle_type,
+                'incoming_road': d.incoming_road,
+                'outgoing_road': d.outgoing_road,
+                'violation_detected': False
+            }
+            for record_id, d in zip(record_ids, detections)
+        ]
         
+        with engine.begin() as conn:
+            conn.execute(self._insert_stmt, params)
+    
+    def _insert_records_orm(self, detections: Iterable[VehicleDetectionEvent]):
+        """Fallback insert through ORM bulk_save_objects"""
+        detections = list(detections)
+        record_ids = _generate_record_ids(len(detections))
         db = SessionLocal()
         
         try:
-            # Convert to DB records
             records = [
                 DetectionRecord(
-                    id=f"det-{uuid.uuid4().hex[:12]}",
+                    id=record_id,
                     vehicle_id=d.vehicle_id,
                     number_plate=d.number_plate,
                     junction_id=d.junction_id,
@@ -244,30 +363,26 @@ class DetectionHistoryLogger:
                     outgoing_road=d.outgoing_road,
                     violation_detected=False
                 )
-                for d in buffer_copy
+                for record_id, d in zip(record_ids, detections)
             ]
             
-            # Batch insert
             db.bulk_save_objects(records)
             db.commit()
-            
-            self.total_flushes += 1
-            self.last_flush_time = time.time()
-            
-            print(f"📝 [DETECTION] Flushed {len(records)} detections to database")
-            
-        except Exception as e:
-            print(f"[ERROR] [DETECTION] Flush error: {e}")
+        except Exception:
             db.rollback()
-            
-            # Re-add failed records to buffer
-            async with self._buffer_lock:
-                self._buffer = buffer_copy + self._buffer
+            raise
         finally:
             db.close()
     
     async def _cleanup_old_records(self):
         """Remove records older than retention period"""
+        self.store.prune()
+        
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._db_executor, self._delete_expired_records)
+    
+    def _delete_expired_records(self):
+        """Delete expired records (blocking, runs on the DB thread)"""
         cutoff_time = time.time() - (self.retention_hours * 3600)
         
         db = SessionLocal()
@@ -292,6 +407,7 @@ class DetectionHistoryLogger:
             'totalDetections': self.total_detections,
             'totalFlushes': self.total_flushes,
             'bufferSize': len(self._buffer),
+            'storeSize': len(self.store),
             'lastFlushTime': self.last_flush_time,
             'retentionHours': self.retention_hours
         }
@@ -317,7 +433,8 @@ def init_detection_logger(config: dict = None) -> DetectionHistoryLogger:
     _detection_logger = DetectionHistoryLogger(
         buffer_size=config.get('bufferSize', 100),
         flush_interval=config.get('flushInterval', 5.0),
-        retention_hours=config.get('retentionHours', 24)
+        retention_hours=config.get('retentionHours', 24),
+        store_window_seconds=config.get('storeWindowSeconds', 3600.0)
     )
     
     return _detection_logger
@@ -0,0 +1,265 @@
+"""
+Columnar In-Memory Detection Store (FRD-08)
+
+Keeps the most recent detections as parallel NumPy arrays (one array
+per field) so route reconstruction and summary analytics are vectorized
+filters instead of Python loops over record objects. The database stays
+the system of record; this store only covers a sliding window.
+
+String fields (number plate, vehicle ID, junction ID, vehicle type) are
+interned to integer codes; the code -> string tables live alongside the
+arrays. prune() rebuilds the plate and vehicle tables from the kept rows,
+so they stay bounded by the window rather than the process lifetime.
+
+Pydantic models (VehicleRoute, DetectionSummary) are built only when a
+result is returned.
+
+Usage:
+    store = DetectionStore(window_seconds=3600)
+    store.append("GJ01AB1234", "v-1", "J-5", "CAR", 32.0, time.time())
+    
+    route = store.route("GJ01AB1234")
+    summary = store.summary()
+"""
+
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.models.detection import DetectionSummary, VehicleRoute
+
+
+# Initial row capacity; arrays double when full
+INITIAL_CAPACITY = 1024
+
+
+class _InternTable:
+    """String <-> integer code table"""
+    
+    __slots__ = ("codes", "values")
+    
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+    
+    def intern(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def lookup(self, value: str) -> int:
+        """Code for `value`, or -1 if it was never interned"""
+        return self.codes.get(value, -1)
+    
+    def compact(self, column: np.ndarray) -> np.ndarray:
+        """
+        Drop values no longer referenced by `column`
+        
+        Returns:
+            `column` re-mapped onto the compacted codes
+        """
+        used, remapped = np.unique(column, return_inverse=True)
+        values = self.values
+        self.values = [values[i] for i in used.tolist()]
+        self.codes = {value: i for i, value in enumerate(self.values)}
+        return remapped.astype(column.dtype, copy=False)
+
+
+class DetectionStore:
+    """
+    Sliding window of detections stored column-wise
+    
+    Columns (N = number of stored rows):
+    - timestamps: float64[N]
+    - speeds: float32[N]
+    - plates, vehicles, junctions: int32[N] interned codes
+    - vehicle_types: int8[N] interned codes
+    
+    Not thread-safe; used from the event loop only.
+    """
+    
+    def __init__(self, window_seconds: float = 3600.0, capacity: int = INITIAL_CAPACITY):
+        """
+        Initialize store
+        
+        Args:
+            window_seconds: Age after which prune() drops rows
+            capacity: Initial row capacity
+        """
+        self.window_seconds = window_seconds
+        self._size = 0
+        
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._speeds = np.empty(capacity, dtype=np.float32)
+        self._plates = np.empty(capacity, dtype=np.int32)
+        self._vehicles = np.empty(capacity, dtype=np.int32)
+        self._junctions = np.empty(capacity, dtype=np.int32)
+        self._vehicle_types = np.empty(capacity, dtype=np.int8)
+        
+        self._plate_table = _InternTable()
+        self._vehicle_table = _InternTable()
+        self._junction_table = _InternTable()
+        self._type_table = _InternTable()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    @property
+    def capacity(self) -> int:
+        return self._timestamps.shape[0]
+    
+    def _grow(self):
+        """Double the capacity of every column"""
+        new_capacity = max(self.capacity * 2, INITIAL_CAPACITY)
+        for name in ("_timestamps", "_speeds", "_plates", "_vehicles", "_junctions", "_vehicle_types"):
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+    
+    def append(
+        self,
+        number_plate: str,
+        vehicle_id: str,
+        junction_id: str,
+        vehicle_type: str,
+        speed: float,
+        timestamp: float
+    ):
+        """Append one detection"""
+        if self._size == self.capacity:
+            self._grow()
+        
+        i = self._size
+        self._timestamps[i] = timestamp
+        self._speeds[i] = speed
+        self._plates[i] = self._plate_table.intern(number_plate)
+        self._vehicles[i] = self._vehicle_table.intern(vehicle_id)
+        self._junctions[i] = self._junction_table.intern(junction_id)
+        self._vehicle_types[i] = self._type_table.intern(vehicle_type)
+        self._size = i + 1
+    
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Drop rows older than the window and compact the plate/vehicle tables
+        
+        Returns:
+            Number of rows removed
+        """
+        now = time.time() if now is None else now
+        n = self._size
+        keep = self._timestamps[:n] >= now - self.window_seconds
+        kept = int(np.count_nonzero(keep))
+        if kept == n:
+            return 0
+        
+        for name in ("_timestamps", "_speeds", "_plates", "_vehicles", "_junctions", "_vehicle_types"):
+            column = getattr(self, name)
+            column[:kept] = column[:n][keep]
+        self._size = kept
+        
+        # Plates and vehicle IDs churn with the simulation; junctions and
+        # vehicle types are bounded by the map and never need compacting
+        self._plates[:kept] = self._plate_table.compact(self._plates[:kept])
+        self._vehicles[:kept] = self._vehicle_table.compact(self._vehicles[:kept])
+        return n - kept
+    
+    def _time_mask(self, start_time: Optional[float], end_time: Optional[float]) -> np.ndarray:
+        """Boolean mask over stored rows within [start_time, end_time]"""
+        timestamps = self._timestamps[:self._size]
+        mask = np.ones(self._size, dtype=bool)
+        if start_time is not None:
+            mask &= timestamps >= start_time
+        if end_time is not None:
+            mask &= timestamps <= end_time
+        return mask
+    
+    def route(
+        self,
+        number_plate: str,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None
+    ) -> Optional[VehicleRoute]:
+        """
+        Reconstruct a vehicle's route from stored detections
+        
+        Returns:
+            VehicleRoute in time order, or None if the plate has no
+            detections in the range
+        """
+        code = self._plate_table.lookup(number_plate)
+        if code < 0:
+            return None
+        
+        mask = self._time_mask(start_time, end_time)
+        mask &= self._plates[:self._size] == code
+        idx = np.flatnonzero(mask)
+        if idx.size == 0:
+            return None
+        
+        # Rows are appended in arrival order; sort to be safe
+        idx = idx[np.argsort(self._timestamps[idx], kind="stable")]
+        
+        timestamps = self._timestamps[idx]
+        speeds = self._speeds[idx]
+        junction_values = self._junction_table.values
+        route = [junction_values[j] for j in self._junctions[idx].tolist()]
+        
+        return VehicleRoute(
+            vehicle_id=self._vehicle_table.values[int(self._vehicles[idx[-1]])],
+            number_plate=number_plate,
+            route=route,
+            route_names=route,
+            timestamps=timestamps.tolist(),
+            speeds=speeds.tolist(),
+            total_time=float(timestamps[-1] - timestamps[0]),
+            avg_speed=float(speeds.mean()),
+            start_time=float(timestamps[0]),
+            end_time=float(timestamps[-1])
+        )
+    
+    def summary(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None
+    ) -> DetectionSummary:
+        """Aggregate stored detections within [start_time, end_time]"""
+        idx = np.flatnonzero(self._time_mask(start_time, end_time))
+        
+        if idx.size == 0:
+            return DetectionSummary(
+                total_detections=0,
+                unique_vehicles=0,
+                by_junction={},
+                by_vehicle_type={},
+                avg_speed=0.0,
+                time_range_start=start_time or 0.0,
+                time_range_end=end_time or 0.0
+            )
+        
+        timestamps = self._timestamps[idx]
+        junction_counts = np.bincount(
+            self._junctions[idx], minlength=len(self._junction_table.values)
+        )
+        type_counts = np.bincount(
+            self._vehicle_types[idx], minlength=len(self._type_table.values)
+        )
+        
+        return DetectionSummary(
+            total_detections=int(idx.size),
+            unique_vehicles=int(np.unique(self._plates[idx]).size),
+            by_junction=_counts_by_value(junction_counts, self._junction_table.values),
+            by_vehicle_type=_counts_by_value(type_counts, self._type_table.values),
+            avg_speed=float(self._speeds[idx].mean()),
+            time_range_start=float(timestamps.min()) if start_time is None else start_time,
+            time_range_end=float(timestamps.max()) if end_time is None else end_time
+        )
+
+
+def _counts_by_value(counts: np.ndarray, values: List[str]) -> Dict[str, int]:
+    """Map interned values to their non-zero counts"""
+    nonzero = np.flatnonzero(counts)
+    return {values[i]: int(counts[i]) for i in nonzero.tolist()}
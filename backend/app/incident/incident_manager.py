@@ -13,17 +13,66 @@ Features:
 """
 
 import time
-import uuid
+import secrets
 import asyncio
+import weakref
+from collections import Counter, OrderedDict
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from dataclasses import dataclass, field, asdict
+from typing import Callable, List, Dict, Optional, Any, Sequence
 import json
+import logging
 
-from app.database.database import SessionLocal
+from sqlalchemy import select, update
+
+# orjson is optional: faster (de)serialization of inference result JSON
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from app.database.database import AsyncSessionLocal
 from app.database.models import Incident as IncidentModel, InferenceResult as InferenceResultModel
 
 
+# Core INSERT built once: saves skip ORM unit-of-work flush and per-call
+# statement construction (compiled SQL is reused via the statement cache)
+_INCIDENT_INSERT = IncidentModel.__table__.insert()
+
+logger = logging.getLogger(__name__)
+
+# Number plate normalization: uppercase and drop separators in one pass
+_PLATE_TABLE = str.maketrans(
+    {c: c.upper() for c in 'abcdefghijklmnopqrstuvwxyz'} | {' ': None, '\t': None, '-': None}
+)
+
+# Max incidents kept in the in-memory LRU cache
+INCIDENT_CACHE_SIZE = 1024
+
+
+def _dump_dataclasses(items: Sequence) -> str:
+    """Serialize a list of dataclasses to a JSON array (field names as keys)"""
+    if isinstance(items, LazyJsonList):
+        return items.raw_json
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(items).decode()
+    return json.dumps([asdict(item) for item in items])
+
+
+def _load_json(text: str) -> Any:
+    """Parse a JSON column value"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# WebSocket emit coalescing
+EMIT_QUEUE_SIZE = 10_000
+EMIT_BATCH_SIZE = 50
+EMIT_MAX_DELAY = 0.02  # seconds to let a burst accumulate
+
+
 class IncidentType(str, Enum):
     """Types of traffic incidents"""
     HIT_AND_RUN = "HIT_AND_RUN"
@@ -41,7 +90,13 @@ class IncidentStatus(str, Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+# Value -> member lookups; dict hits instead of Enum.__call__ (and no
+# exception path for unknown incident types)
+_TYPE_BY_NAME: Dict[str, IncidentType] = {m.value: m for m in IncidentType}
+_STATUS_BY_NAME: Dict[str, IncidentStatus] = {m.value: m for m in IncidentStatus}
+
+
+@dataclass(slots=True)
 class ProbableLocation:
     """A probable current location of the vehicle"""
     junction_id: str
@@ -53,7 +108,7 @@ class ProbableLocation:
     estimated_travel_time: float  # seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionHistoryItem:
     """Single detection record in history"""
     junction_id: str
@@ -64,7 +119,7 @@ class DetectionHistoryItem:
     lon: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IncidentInferenceResult:
     """Result of vehicle inference for an incident"""
     incident_id: str
@@ -78,12 +133,12 @@ class IncidentInferenceResult:
     
     time_elapsed: float  # seconds since last detection
     
-    probable_locations: List[ProbableLocation]
+    probable_locations: Sequence[ProbableLocation]
     search_radius: float  # km
     search_center_lat: Optional[float]
     search_center_lon: Optional[float]
     
-    detection_history: List[DetectionHistoryItem]
+    detection_history: Sequence[DetectionHistoryItem]
     detection_count: int
     
     overall_confidence: float  # 0-100
@@ -91,6 +146,8 @@ class IncidentInferenceResult:
     generated_at: float
 
 
+# Not slotted: records must be weak-referenceable for the incident index
+# (weakref_slot needs Python 3.11+)
 @dataclass
 class IncidentRecord:
     """Complete incident record"""
@@ -114,6 +171,103 @@ class IncidentRecord:
     resolution_notes: Optional[str]
     
     inference_result: Optional[IncidentInferenceResult] = None
+    
+    # Last state known to be in the DB (set after each save/load), used to
+    # skip no-op updates. None means unknown, so the next update is full.
+    _db_snapshot: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _db_result: Optional[IncidentInferenceResult] = field(default=None, init=False, repr=False, compare=False)
+    
+    # True for incidents created by this manager, whose status is counted
+    # in IncidentManager._status_counts
+    _counted: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def mutable_columns(self) -> Dict[str, Any]:
+        """Current values of the columns that change after creation"""
+        return {
+            'status': self.status.value,
+            'processed_at': self.processed_at,
+            'resolved_at': self.resolved_at,
+            'resolution_notes': self.resolution_notes
+        }
+    
+    def mark_persisted(self):
+        """Record the current state as matching the DB row"""
+        self._db_snapshot = self.mutable_columns()
+        self._db_result = self.inference_result
+
+
+class LazyJsonList(Sequence):
+    """
+    Read-only list parsed from a stored JSON column on first access
+    
+    Lets inference results loaded from the DB skip parsing the location
+    and history arrays when callers only read scalar fields. The raw JSON
+    is kept so re-saving writes it back without re-serializing.
+    """
+    
+    __slots__ = ('raw_json', '_parse', '_items')
+    
+    def __init__(self, raw_json: str, parse: Callable[[str], list]):
+        self.raw_json = raw_json
+        self._parse = parse
+        self._items: Optional[list] = None
+    
+    def _load(self) -> list:
+        if self._items is None:
+            self._items = self._parse(self.raw_json)
+        return self._items
+    
+    def __getitem__(self, index):
+        return self._load()[index]
+    
+    def __len__(self) -> int:
+        return len(self._load())
+    
+    def __iter__(self):
+        return iter(self._load())
+    
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return f"LazyJsonList({self._load()!r})"
+
+
+def _parse_probable_locations(text: str) -> List[ProbableLocation]:
+    """Parse probable_locations_json (field-name keys, or legacy camelCase)"""
+    probable_locations = []
+    for loc in _load_json(text):
+        if 'junctionId' not in loc:
+            probable_locations.append(ProbableLocation(**loc))
+            continue
+        probable_locations.append(ProbableLocation(
+            junction_id=loc['junctionId'],
+            junction_name=loc.get('junctionName', ''),
+            lat=loc.get('lat', 0),
+            lon=loc.get('lon', 0),
+            confidence=loc['confidence'],
+            distance_from_last=loc.get('distance', 0),
+            estimated_travel_time=loc.get('travelTime', 0)
+        ))
+    return probable_locations
+
+
+def _parse_detection_history(text: str) -> List[DetectionHistoryItem]:
+    """Parse detection_history_json (field-name keys, or legacy camelCase)"""
+    detection_history = []
+    for det in _load_json(text):
+        if 'junctionId' not in det:
+            detection_history.append(DetectionHistoryItem(**det))
+            continue
+        detection_history.append(DetectionHistoryItem(
+            junction_id=det['junctionId'],
+            junction_name=det.get('junctionName'),
+            timestamp=det['timestamp'],
+            direction=det['direction'],
+            lat=det.get('lat'),
+            lon=det.get('lon')
+        ))
+    return detection_history
 
 
 class IncidentManager:
@@ -132,25 +286,43 @@ class IncidentManager:
         result = await manager.get_inference_result(incident_id)
     """
     
-    def __init__(self, inference_engine=None, ws_emitter=None):
+    def __init__(self, inference_engine=None, ws_emitter=None, cache_size: int = INCIDENT_CACHE_SIZE):
         """
         Initialize incident manager
         
         Args:
             inference_engine: VehicleInferenceEngine instance
             ws_emitter: WebSocket emitter for real-time updates
+            cache_size: Max incidents kept in memory (least recently used evicted)
         """
         self.inference_engine = inference_engine
         self.ws_emitter = ws_emitter
         
-        # In-memory cache for active incidents
-        self._active_incidents: Dict[str, IncidentRecord] = {}
+        # In-memory LRU cache for active incidents (oldest first)
+        self._active_incidents: "OrderedDict[str, IncidentRecord]" = OrderedDict()
+        self._cache_max = cache_size
+        
+        # Weak index of every live record, so incidents evicted from the LRU
+        # but still held elsewhere (e.g. in-flight processing) stay findable
+        # without a DB round-trip. Entries vanish once the last ref drops.
+        self._incident_refs: "weakref.WeakValueDictionary[str, IncidentRecord]" = weakref.WeakValueDictionary()
+        
+        # Coalescing queue for incident:* WebSocket events. The drain task
+        # is started lazily on the first emit (needs a running loop).
+        self._emit_queue: asyncio.Queue = asyncio.Queue(maxsize=EMIT_QUEUE_SIZE)
+        self._emit_task: Optional[asyncio.Task] = None
+        self._emit_seq = 0
+        self.dropped_emits = 0
         
         # Statistics
         self.total_incidents = 0
         self.total_resolved = 0
         
-        print("[OK] Incident Manager initialized")
+        # Incidents created this session, by current status. Kept up to date
+        # on every transition so get_statistics never iterates the cache.
+        self._status_counts: Counter = Counter()
+        
+        logger.info("[OK] Incident Manager initialized")
     
     def set_inference_engine(self, engine):
         """Set inference engine after initialization"""
@@ -185,65 +357,152 @@ class IncidentManager:
         Returns:
             incident_id: Unique incident identifier
         """
-        # Generate unique ID
-        incident_id = f"inc-{uuid.uuid4().hex[:12]}"
-        
-        # Parse incident type
-        try:
-            inc_type = IncidentType(incident_type.upper())
-        except ValueError:
-            inc_type = IncidentType.OTHER
-        
-        # Create incident record
-        incident = IncidentRecord(
-            id=incident_id,
-            number_plate=number_plate.upper().replace(" ", ""),
-            incident_type=inc_type,
+        incident = self._build_record(
+            number_plate=number_plate,
             incident_time=incident_time,
+            incident_type=incident_type,
             location_junction=location_junction,
             location_road=location_road,
             location_name=location_name,
             location_lat=location_lat,
             location_lon=location_lon,
-            description=description,
-            status=IncidentStatus.PROCESSING,
-            reported_at=time.time(),
-            processed_at=None,
-            resolved_at=None,
-            resolution_notes=None
+            description=description
         )
+        incident_id = incident.id
+        inc_type = incident.incident_type
         
         # Store in cache
-        self._active_incidents[incident_id] = incident
+        self._cache_incident(incident)
+        self._count_new(incident)
         self.total_incidents += 1
         
-        # Save to database
+        # Queue the WebSocket event first so the emit loop sends it while
+        # the insert is in flight
+        self._queue_emit('incident:created', {
+            'incidentId': incident_id,
+            'numberPlate': number_plate,
+            'type': inc_type.value,
+            'status': 'PROCESSING'
+        })
+        
+        # Save to database (inference updates this row, so it must exist first)
         await self._save_incident_to_db(incident)
         
-        print(f"📋 [INCIDENT] Created: {incident_id}")
-        print(f"   Plate: {number_plate}")
-        print(f"   Type: {inc_type.value}")
-        print(f"   Time: {time.ctime(incident_time)}")
+        logger.info(
+            "📋 [INCIDENT] Created: %s (plate=%s, type=%s, time=%s)",
+            incident_id, number_plate, inc_type.value, time.ctime(incident_time),
+            extra={'incident_id': incident_id, 'number_plate': number_plate, 'incident_type': inc_type.value}
+        )
         
         # Trigger inference asynchronously
         asyncio.create_task(self._process_incident(incident))
         
-        # Emit WebSocket event
-        if self.ws_emitter:
-            await self.ws_emitter.emit('incident:created', {
-                'incidentId': incident_id,
-                'numberPlate': number_plate,
-                'type': inc_type.value,
-                'status': 'PROCESSING'
+        return incident_id
+    
+    async def bulk_create_incidents(
+        self,
+        incidents: List[Dict[str, Any]],
+        process: bool = True
+    ) -> List[str]:
+        """
+        Create many incidents with a single batched INSERT and one commit
+        
+        Intended for bulk ingest (e.g. importing historical incidents).
+        
+        Args:
+            incidents: Dicts of create_incident keyword arguments
+            process: Trigger inference for each created incident
+        
+        Returns:
+            Incident IDs, in input order
+        """
+        records = [self._build_record(**fields) for fields in incidents]
+        if not records:
+            return []
+        
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(
+                    _INCIDENT_INSERT,
+                    [self._record_to_row(incident) for incident in records]
+                )
+                await db.commit()
+            except Exception as e:
+                logger.error("[INCIDENT] Bulk insert error: %s", e)
+                await db.rollback()
+                raise
+        
+        for incident in records:
+            incident.mark_persisted()
+            self._cache_incident(incident)
+            self._count_new(incident)
+            self._queue_emit('incident:created', {
+                'incidentId': incident.id,
+                'numberPlate': incident.number_plate,
+                'type': incident.incident_type.value,
+                'status': incident.status.value
             })
         
-        return incident_id
+        if process:
+            # One batched detection query for the whole set
+            asyncio.create_task(self._process_incident_batch(records))
+        
+        self.total_incidents += len(records)
+        logger.info("📋 [INCIDENT] Bulk created %d incidents", len(records))
+        
+        return [incident.id for incident in records]
+    
+    def _build_record(
+        self,
+        number_plate: str,
+        incident_time: float,
+        incident_type: str = "HIT_AND_RUN",
+        location_junction: Optional[str] = None,
+        location_road: Optional[str] = None,
+        location_name: Optional[str] = None,
+        location_lat: Optional[float] = None,
+        location_lon: Optional[float] = None,
+        description: Optional[str] = None
+    ) -> IncidentRecord:
+        """Build a new PROCESSING incident record with a fresh ID"""
+        # Parse incident type (unknown types fall back to OTHER)
+        inc_type = _TYPE_BY_NAME.get(incident_type.upper(), IncidentType.OTHER)
+        
+        return IncidentRecord(
+            id=f"inc-{secrets.token_hex(6)}",
+            number_plate=number_plate.translate(_PLATE_TABLE),
+            incident_type=inc_type,
+            incident_time=incident_time,
+            location_junction=location_junction,
+            location_road=location_road,
+            location_name=location_name,
+            location_lat=location_lat,
+            location_lon=location_lon,
+            description=description,
+            status=IncidentStatus.PROCESSING,
+            reported_at=time.time(),
+            processed_at=None,
+            resolved_at=None,
+            resolution_notes=None
+        )
+    
+    def _count_new(self, incident: IncidentRecord):
+        """Start counting a newly created incident's status"""
+        incident._counted = True
+        self._status_counts[incident.status] += 1
+    
+    def _set_status(self, incident: IncidentRecord, status: IncidentStatus):
+        """Change incident status, keeping the status counters in sync"""
+        if incident._counted:
+            self._status_counts[incident.status] -= 1
+            self._status_counts[status] += 1
+        incident.status = status
     
     async def _process_incident(self, incident: IncidentRecord):
         """Process incident through inference engine"""
         if not self.inference_engine:
-            print(f"[INCIDENT] No inference engine - skipping {incident.id}")
-            incident.status = IncidentStatus.FAILED
+            logger.warning("[INCIDENT] No inference engine - skipping %s", incident.id)
+            self._set_status(incident, IncidentStatus.FAILED)
             await self._update_incident_in_db(incident)
             return
         
@@ -253,47 +512,104 @@ class IncidentManager:
                 incident_id=incident.id,
                 number_plate=incident.number_plate,
                 incident_time=incident.incident_time,
-                incident_location=(incident.location_lat, incident.location_lon)
-                if incident.location_lat else None
+                incident_location=self._incident_location(incident)
             )
-            
-            if result:
-                incident.inference_result = result
-                incident.status = IncidentStatus.COMPLETED
-                incident.processed_at = time.time()
-                
-                print(f"[OK] [INCIDENT] {incident.id} processed - "
-                      f"{len(result.probable_locations)} locations found")
-                
-                # Emit completion event
-                if self.ws_emitter:
-                    await self.ws_emitter.emit('incident:completed', {
-                        'incidentId': incident.id,
-                        'status': 'COMPLETED',
-                        'lastKnownLocation': result.last_known_junction,
-                        'probableLocationsCount': len(result.probable_locations),
-                        'confidence': result.overall_confidence
-                    })
-            else:
-                incident.status = IncidentStatus.COMPLETED
-                incident.processed_at = time.time()
-                print(f"[WARN] [INCIDENT] {incident.id} - no detection history found")
+            self._apply_inference_result(incident, result)
             
         except Exception as e:
-            print(f"[ERROR] [INCIDENT] Processing error for {incident.id}: {e}")
-            incident.status = IncidentStatus.FAILED
+            logger.error("[ERROR] [INCIDENT] Processing error for %s: %s", incident.id, e)
+            self._set_status(incident, IncidentStatus.FAILED)
         
         # Update in database
         await self._update_incident_in_db(incident)
     
+    async def _process_incident_batch(self, incidents: List[IncidentRecord]):
+        """Process several incidents with one batched detection query"""
+        if not self.inference_engine:
+            for incident in incidents:
+                await self._process_incident(incident)
+            return
+        
+        try:
+            results = await self.inference_engine.process_incident_batch([
+                (incident.id, incident.number_plate, incident.incident_time,
+                 self._incident_location(incident))
+                for incident in incidents
+            ])
+            for incident, result in zip(incidents, results):
+                self._apply_inference_result(incident, result)
+            
+        except Exception as e:
+            logger.error("[ERROR] [INCIDENT] Batch processing error: %s", e)
+            for incident in incidents:
+                self._set_status(incident, IncidentStatus.FAILED)
+        
+        for incident in incidents:
+            await self._update_incident_in_db(incident)
+    
+    @staticmethod
+    def _incident_location(incident: IncidentRecord):
+        """(lat, lon) of the incident if known"""
+        if incident.location_lat:
+            return (incident.location_lat, incident.location_lon)
+        return None
+    
+    def _apply_inference_result(
+        self,
+        incident: IncidentRecord,
+        result: Optional[IncidentInferenceResult]
+    ):
+        """Mark incident completed with its inference result"""
+        if result:
+            incident.inference_result = result
+            self._set_status(incident, IncidentStatus.COMPLETED)
+            incident.processed_at = time.time()
+            
+            logger.info("[OK] [INCIDENT] %s processed - %d locations found",
+                        incident.id, len(result.probable_locations))
+            
+            # Emit completion event
+            self._queue_emit('incident:completed', {
+                'incidentId': incident.id,
+                'status': 'COMPLETED',
+                'lastKnownLocation': result.last_known_junction,
+                'probableLocationsCount': len(result.probable_locations),
+                'confidence': result.overall_confidence
+            })
+        else:
+            self._set_status(incident, IncidentStatus.COMPLETED)
+            incident.processed_at = time.time()
+            logger.warning("[WARN] [INCIDENT] %s - no detection history found", incident.id)
+    
     async def get_incident(self, incident_id: str) -> Optional[IncidentRecord]:
         """Get incident by ID"""
         # Check cache first
-        if incident_id in self._active_incidents:
-            return self._active_incidents[incident_id]
+        incident = self._active_incidents.get(incident_id)
+        if incident is not None:
+            self._active_incidents.move_to_end(incident_id)
+            return incident
+        
+        # Evicted but still referenced elsewhere
+        incident = self._incident_refs.get(incident_id)
+        if incident is not None:
+            self._cache_incident(incident)
+            return incident
         
         # Load from database
-        return await self._load_incident_from_db(incident_id)
+        incident = await self._load_incident_from_db(incident_id)
+        if incident is not None:
+            self._cache_incident(incident)
+        
+        return incident
+    
+    def _cache_incident(self, incident: IncidentRecord):
+        """Insert incident as most recently used, evicting the oldest if full"""
+        self._active_incidents[incident.id] = incident
+        self._active_incidents.move_to_end(incident.id)
+        self._incident_refs[incident.id] = incident
+        
+        if len(self._active_incidents) > self._cache_max:
+            self._active_incidents.popitem(last=False)
     
     async def get_inference_result(self, incident_id: str) -> Optional[IncidentInferenceResult]:
         """Get inference result for incident"""
@@ -315,7 +631,7 @@ class IncidentManager:
         if not incident:
             return False
         
-        incident.status = IncidentStatus.RESOLVED
+        self._set_status(incident, IncidentStatus.RESOLVED)
         incident.resolved_at = time.time()
         incident.resolution_notes = resolution_notes
         
@@ -323,18 +639,76 @@ class IncidentManager:
         
         await self._update_incident_in_db(incident)
         
-        print(f"[OK] [INCIDENT] {incident_id} resolved")
+        logger.info("[OK] [INCIDENT] %s resolved", incident_id)
         
         # Emit event
-        if self.ws_emitter:
-            await self.ws_emitter.emit('incident:resolved', {
-                'incidentId': incident_id,
-                'resolvedAt': incident.resolved_at,
-                'resolution': resolution_notes
-            })
+        self._queue_emit('incident:resolved', {
+            'incidentId': incident_id,
+            'resolvedAt': incident.resolved_at,
+            'resolution': resolution_notes
+        })
         
         return True
     
+    def _queue_emit(self, event: str, data: dict):
+        """
+        Queue an incident:* event for the batched emit loop
+        
+        Each event gets a sequence number so clients can detect drops.
+        Events are dropped (and counted) if the queue is full.
+        """
+        if not self.ws_emitter:
+            return
+        
+        if self._emit_task is None or self._emit_task.done():
+            self._emit_task = asyncio.create_task(self._emit_loop())
+        
+        self._emit_seq += 1
+        try:
+            self._emit_queue.put_nowait((self._emit_seq, event, data))
+        except asyncio.QueueFull:
+            self.dropped_emits += 1
+    
+    async def _emit_loop(self):
+        """Drain the emit queue, sending one incident:batch per event name"""
+        while True:
+            try:
+                batch = [await self._emit_queue.get()]
+                
+                # Give a burst a moment to accumulate, then take what's there
+                await asyncio.sleep(EMIT_MAX_DELAY)
+                while len(batch) < EMIT_BATCH_SIZE and not self._emit_queue.empty():
+                    batch.append(self._emit_queue.get_nowait())
+                
+                # Group by event name, preserving order within each group
+                groups: Dict[str, List[dict]] = {}
+                for seq, event, data in batch:
+                    groups.setdefault(event, []).append({'seq': seq, 'data': data})
+                
+                for event, events in groups.items():
+                    await self.ws_emitter.emit('incident:batch', {
+                        'event': event,
+                        'events': events
+                    })
+                
+                # Yield to the loop between batches
+                await asyncio.sleep(0)
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("[INCIDENT] Emit error: %s", e)
+    
+    async def stop(self):
+        """Stop the background emit task"""
+        if self._emit_task:
+            self._emit_task.cancel()
+            try:
+                await self._emit_task
+            except asyncio.CancelledError:
+                pass
+            self._emit_task = None
+    
     async def list_incidents(
         self,
         status: Optional[str] = None,
@@ -342,172 +716,148 @@ class IncidentManager:
         offset: int = 0
     ) -> List[IncidentRecord]:
         """List incidents with optional status filter"""
-        db = SessionLocal()
+        query = select(IncidentModel)
         
-        try:
-            query = db.query(IncidentModel)
-            
-            if status:
-                query = query.filter(IncidentModel.status == status.upper())
-            
-            query = query.order_by(IncidentModel.reported_at.desc())
-            query = query.offset(offset).limit(limit)
-            
-            db_incidents = query.all()
-            
-            incidents = []
-            for db_inc in db_incidents:
-                incident = self._db_to_record(db_inc)
-                incidents.append(incident)
-            
-            return incidents
-            
-        finally:
-            db.close()
+        if status:
+            query = query.where(IncidentModel.status == status.upper())
+        
+        query = query.order_by(IncidentModel.reported_at.desc())
+        query = query.offset(offset).limit(limit)
+        
+        to_record = self._db_to_record
+        async with AsyncSessionLocal() as db:
+            return [to_record(db_inc) for db_inc in (await db.execute(query)).scalars()]
     
     async def _save_incident_to_db(self, incident: IncidentRecord):
         """Save incident to database"""
-        db = SessionLocal()
-        
-        try:
-            db_incident = IncidentModel(
-                id=incident.id,
-                number_plate=incident.number_plate,
-                incident_type=incident.incident_type.value,
-                incident_time=incident.incident_time,
-                location_junction=incident.location_junction,
-                location_road=incident.location_road,
-                location_name=incident.location_name,
-                location_lat=incident.location_lat,
-                location_lon=incident.location_lon,
-                description=incident.description,
-                status=incident.status.value,
-                reported_at=incident.reported_at
-            )
-            
-            db.add(db_incident)
-            db.commit()
-            
-        except Exception as e:
-            print(f"[INCIDENT] DB save error: {e}")
-            db.rollback()
-        finally:
-            db.close()
+        async with AsyncSessionLocal() as db:
+            try:
+                await db.execute(_INCIDENT_INSERT, self._record_to_row(incident))
+                await db.commit()
+                incident.mark_persisted()
+                
+            except Exception as e:
+                logger.error("[INCIDENT] DB save error: %s", e)
+                await db.rollback()
+    
+    def _record_to_row(self, incident: IncidentRecord) -> Dict[str, Any]:
+        """Column values for inserting a new incident row"""
+        return {
+            'id': incident.id,
+            'number_plate': incident.number_plate,
+            'incident_type': incident.incident_type.value,
+            'incident_time': incident.incident_time,
+            'location_junction': incident.location_junction,
+            'location_road': incident.location_road,
+            'location_name': incident.location_name,
+            'location_lat': incident.location_lat,
+            'location_lon': incident.location_lon,
+            'description': incident.description,
+            'status': incident.status.value,
+            'reported_at': incident.reported_at
+        }
     
     async def _update_incident_in_db(self, incident: IncidentRecord):
-        """Update incident in database"""
-        db = SessionLocal()
+        """Update incident (and its inference result) in one transaction"""
+        values = incident.mutable_columns()
+        
+        # Only write columns that differ from the last persisted state
+        snapshot = incident._db_snapshot
+        if snapshot is not None:
+            values = {column: value for column, value in values.items() if snapshot.get(column) != value}
+        
+        result_changed = (
+            incident.inference_result is not None
+            and incident.inference_result is not incident._db_result
+        )
+        
+        if not values and not result_changed:
+            return
         
         try:
-            db_incident = db.query(IncidentModel).filter_by(id=incident.id).first()
-            
-            if db_incident:
-                db_incident.status = incident.status.value
-                db_incident.processed_at = incident.processed_at
-                db_incident.resolved_at = incident.resolved_at
-                db_incident.resolution_notes = incident.resolution_notes
+            async with AsyncSessionLocal() as db, db.begin():
+                # Save inference result if it changed
+                if result_changed:
+                    values['inference_result_id'] = await self._save_inference_result(
+                        db, incident.inference_result
+                    )
                 
-                # Save inference result if available
-                if incident.inference_result:
-                    await self._save_inference_result(incident.inference_result)
-                    db_incident.inference_result_id = incident.inference_result.incident_id
-                
-                db.commit()
+                await db.execute(
+                    update(IncidentModel)
+                    .where(IncidentModel.id == incident.id)
+                    .values(**values)
+                )
+            
+            incident.mark_persisted()
             
         except Exception as e:
-            print(f"[INCIDENT] DB update error: {e}")
-            db.rollback()
-        finally:
-            db.close()
+            logger.error("[INCIDENT] DB update error: %s", e)
     
-    async def _save_inference_result(self, result: IncidentInferenceResult):
-        """Save inference result to database"""
-        db = SessionLocal()
+    async def _save_inference_result(self, db, result: IncidentInferenceResult) -> str:
+        """
+        Upsert inference result within the caller's session
         
-        try:
-            result_id = f"inf-{result.incident_id}"
-            
-            db_result = InferenceResultModel(
-                id=result_id,
-                incident_id=result.incident_id,
-                number_plate=result.number_plate,
-                last_known_junction=result.last_known_junction,
-                last_seen_time=result.last_seen_time,
-                last_seen_lat=result.last_seen_lat,
-                last_seen_lon=result.last_seen_lon,
-                time_elapsed=result.time_elapsed,
-                probable_locations_json=json.dumps([
-                    {
-                        'junctionId': loc.junction_id,
-                        'junctionName': loc.junction_name,
-                        'lat': loc.lat,
-                        'lon': loc.lon,
-                        'confidence': loc.confidence,
-                        'distance': loc.distance_from_last,
-                        'travelTime': loc.estimated_travel_time
-                    }
-                    for loc in result.probable_locations
-                ]),
-                search_radius=result.search_radius,
-                search_center_lat=result.search_center_lat,
-                search_center_lon=result.search_center_lon,
-                detection_history_json=json.dumps([
-                    {
-                        'junctionId': det.junction_id,
-                        'junctionName': det.junction_name,
-                        'timestamp': det.timestamp,
-                        'direction': det.direction,
-                        'lat': det.lat,
-                        'lon': det.lon
-                    }
-                    for det in result.detection_history
-                ]),
-                detection_count=result.detection_count,
-                overall_confidence=result.overall_confidence,
-                inference_time_ms=result.inference_time_ms,
-                generated_at=result.generated_at
-            )
-            
-            db.merge(db_result)  # Use merge for upsert
-            db.commit()
-            
-        except Exception as e:
-            print(f"[INCIDENT] Inference result save error: {e}")
-            db.rollback()
-        finally:
-            db.close()
+        Returns:
+            Inference result row ID
+        """
+        result_id = f"inf-{result.incident_id}"
+        
+        db_result = InferenceResultModel(
+            id=result_id,
+            incident_id=result.incident_id,
+            number_plate=result.number_plate,
+            last_known_junction=result.last_known_junction,
+            last_seen_time=result.last_seen_time,
+            last_seen_lat=result.last_seen_lat,
+            last_seen_lon=result.last_seen_lon,
+            time_elapsed=result.time_elapsed,
+            probable_locations_json=_dump_dataclasses(result.probable_locations),
+            search_radius=result.search_radius,
+            search_center_lat=result.search_center_lat,
+            search_center_lon=result.search_center_lon,
+            detection_history_json=_dump_dataclasses(result.detection_history),
+            detection_count=result.detection_count,
+            overall_confidence=result.overall_confidence,
+            inference_time_ms=result.inference_time_ms,
+            generated_at=result.generated_at
+        )
+        
+        await db.merge(db_result)  # Use merge for upsert
+        return result_id
     
     async def _load_incident_from_db(self, incident_id: str) -> Optional[IncidentRecord]:
         """Load incident from database"""
-        db = SessionLocal()
+        # Incident and its inference result (if any) in one query
+        stmt = (
+            select(IncidentModel, InferenceResultModel)
+            .outerjoin(
+                InferenceResultModel,
+                IncidentModel.inference_result_id == InferenceResultModel.id
+            )
+            .where(IncidentModel.id == incident_id)
+        )
         
-        try:
-            db_incident = db.query(IncidentModel).filter_by(id=incident_id).first()
-            
-            if db_incident:
-                incident = self._db_to_record(db_incident)
-                
-                # Load inference result if available
-                if db_incident.inference_result_id:
-                    db_result = db.query(InferenceResultModel)\
-                        .filter_by(id=db_incident.inference_result_id).first()
-                    
-                    if db_result:
-                        incident.inference_result = self._db_to_inference_result(db_result)
-                
-                return incident
-            
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(stmt)).first()
+        
+        if row is None:
             return None
-            
-        finally:
-            db.close()
+        
+        db_incident, db_result = row
+        incident = self._db_to_record(db_incident)
+        
+        if db_result is not None:
+            incident.inference_result = self._db_to_inference_result(db_result)
+            incident.mark_persisted()
+        
+        return incident
     
     def _db_to_record(self, db_incident: IncidentModel) -> IncidentRecord:
         """Convert DB model to dataclass"""
-        return IncidentRecord(
+        incident = IncidentRecord(
             id=db_incident.id,
             number_plate=db_incident.number_plate,
-            incident_type=IncidentType(db_incident.incident_type),
+            incident_type=_TYPE_BY_NAME[db_incident.incident_type],
             incident_time=db_incident.incident_time,
             location_junction=db_incident.location_junction,
             location_road=db_incident.location_road,
@@ -515,40 +865,25 @@ class IncidentManager:
             location_lat=db_incident.location_lat,
             location_lon=db_incident.location_lon,
             description=db_incident.description,
-            status=IncidentStatus(db_incident.status),
+            status=_STATUS_BY_NAME[db_incident.status],
             reported_at=db_incident.reported_at,
             processed_at=db_incident.processed_at,
             resolved_at=db_incident.resolved_at,
             resolution_notes=db_incident.resolution_notes
         )
+        incident.mark_persisted()
+        return incident
     
     def _db_to_inference_result(self, db_result: InferenceResultModel) -> IncidentInferenceResult:
         """Convert DB inference result to dataclass"""
-        # Parse JSON fields
+        # JSON fields are parsed lazily, on first access
         probable_locations = []
         if db_result.probable_locations_json:
-            for loc in json.loads(db_result.probable_locations_json):
-                probable_locations.append(ProbableLocation(
-                    junction_id=loc['junctionId'],
-                    junction_name=loc.get('junctionName', ''),
-                    lat=loc.get('lat', 0),
-                    lon=loc.get('lon', 0),
-                    confidence=loc['confidence'],
-                    distance_from_last=loc.get('distance', 0),
-                    estimated_travel_time=loc.get('travelTime', 0)
-                ))
+            probable_locations = LazyJsonList(db_result.probable_locations_json, _parse_probable_locations)
         
         detection_history = []
         if db_result.detection_history_json:
-            for det in json.loads(db_result.detection_history_json):
-                detection_history.append(DetectionHistoryItem(
-                    junction_id=det['junctionId'],
-                    junction_name=det.get('junctionName'),
-                    timestamp=det['timestamp'],
-                    direction=det['direction'],
-                    lat=det.get('lat'),
-                    lon=det.get('lon')
-                ))
+            detection_history = LazyJsonList(db_result.detection_history_json, _parse_detection_history)
         
         return IncidentInferenceResult(
             incident_id=db_result.incident_id,
@@ -575,7 +910,12 @@ class IncidentManager:
         return {
             'totalIncidents': self.total_incidents,
             'totalResolved': self.total_resolved,
+            'processing': self._status_counts[IncidentStatus.PROCESSING],
+            'completed': self._status_counts[IncidentStatus.COMPLETED],
+            'failed': self._status_counts[IncidentStatus.FAILED],
+            'resolved': self._status_counts[IncidentStatus.RESOLVED],
             'activeIncidents': len(self._active_incidents),
+            'droppedEmits': self.dropped_emits,
             'hasInferenceEngine': self.inference_engine is not None
         }
 
@@ -13,22 +13,35 @@ Algorithm:
 6. Return probable locations with confidence scores
 """
 
+import math
 import time
-from collections import deque
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Any
-import networkx as nx
+import logging
+from collections import OrderedDict, deque
+from itertools import groupby
+from dataclasses import dataclass, replace
+from typing import List, Dict, Optional, Tuple, Any, TYPE_CHECKING
+import numpy as np
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.database import SessionLocal
+from app.database.database import AsyncSessionLocal
+from app.utils.jit import NUMBA_AVAILABLE
 from app.database.models import DetectionRecord
 from app.incident.incident_manager import (
     IncidentInferenceResult,
     ProbableLocation,
     DetectionHistoryItem
 )
+from ._bfs_numba import bfs_csr
 
+if TYPE_CHECKING:
+    import networkx as nx
 
-@dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
 class JunctionInfo:
     """Junction information from map"""
     id: str
@@ -37,6 +50,74 @@ class JunctionInfo:
     lon: float
 
 
+@dataclass(slots=True, frozen=True)
+class CSRGraph:
+    """Static directed graph in compressed sparse row form"""
+    indptr: np.ndarray  # int32[n_nodes + 1], edge row offsets per node
+    indices: np.ndarray  # int32[n_edges], target node per edge row
+    n_nodes: int
+    
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+    
+    def neighbors(self, u: int) -> np.ndarray:
+        """Successor node indices of node u"""
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+
+_EMPTY_CSR = CSRGraph(
+    indptr=np.zeros(1, dtype=np.int32),
+    indices=np.zeros(0, dtype=np.int32),
+    n_nodes=0
+)
+
+
+# Assumed average spacing between junctions, used to turn km into hops
+AVG_JUNCTION_DISTANCE_KM = 0.5
+
+# Edge lengths are stored as int16 multiples of this (10 m)
+EDGE_LENGTH_UNIT_KM = 0.01
+
+# Result for a vehicle with no detections; per-incident fields are
+# filled in with dataclasses.replace. Sequences are empty tuples so
+# results never share a mutable list.
+_EMPTY_RESULT = IncidentInferenceResult(
+    incident_id="",
+    number_plate="",
+    last_known_junction=None,
+    last_known_junction_name=None,
+    last_seen_time=None,
+    last_seen_lat=None,
+    last_seen_lon=None,
+    time_elapsed=0,
+    probable_locations=(),
+    search_radius=0,
+    search_center_lat=None,
+    search_center_lon=None,
+    detection_history=(),
+    detection_count=0,
+    overall_confidence=0,
+    inference_time_ms=0,
+    generated_at=0
+)
+
+# Default number of (start junction, max hops) BFS results kept per engine
+BFS_CACHE_SIZE = 1024
+
+# Recent inference latencies kept for percentile stats
+LATENCY_SAMPLE_SIZE = 2048
+
+# Inference results are reused for repeat requests about the same plate
+# and incident minute (dashboard refreshes, retries) for this long
+RESULT_CACHE_TTL = 60.0  # seconds
+RESULT_CACHE_SIZE = 512
+
+# Upper bound on (source, reachable node) pairs in the precomputed
+# reachability table (~6 bytes each); larger graphs use cached BFS instead
+REACH_TABLE_MAX_ENTRIES = 4_000_000
+
+
 class VehicleInferenceEngine:
     """
     Infer vehicle location using graph-based analysis (FRD-08)
@@ -56,7 +137,9 @@ class VehicleInferenceEngine:
         map_service=None,
         avg_city_speed: float = 30.0,  # km/h
         max_search_radius: float = 10.0,  # km
-        detection_time_window: int = 3600  # 1 hour
+        detection_time_window: int = 3600,  # 1 hour
+        bfs_cache_size: int = BFS_CACHE_SIZE,
+        precompute_reachability: bool = True
     ):
         """
         Initialize inference engine
@@ -66,21 +149,67 @@ class VehicleInferenceEngine:
             avg_city_speed: Average city speed (km/h)
             max_search_radius: Maximum search radius (km)
             detection_time_window: Time window for detection query (seconds)
+            bfs_cache_size: Max BFS results cached (the graph is static, so
+                incidents sharing a last-seen junction reuse one search)
+            precompute_reachability: BFS from every junction up to the
+                search radius when the graph is built, so queries are a
+                table lookup (skipped if the table would be too large)
         """
         self.map_service = map_service
         self.avg_city_speed = avg_city_speed
         self.max_search_radius = max_search_radius
         self.detection_time_window = detection_time_window
         
-        # Road network graph (built from map service)
-        self._road_graph: Optional[nx.DiGraph] = None
-        self._junction_cache: Dict[str, JunctionInfo] = {}
+        # Per-hop scoring tables, indexed by integer hop count. Hops never
+        # exceed max_search_radius / AVG_JUNCTION_DISTANCE_KM (at least 1).
+        hop_range = np.arange(max(1, math.ceil(max_search_radius / AVG_JUNCTION_DISTANCE_KM)) + 1)
+        self._conf_lut = 100.0 / (1.0 + hop_range * 0.5)
+        self._travel_lut = hop_range * (AVG_JUNCTION_DISTANCE_KM / avg_city_speed) * 3600
+        self._score_batch = self._make_score_batch(self._conf_lut, self._travel_lut)
+        
+        # Road network, compiled from the map service directly into CSR
+        # adjacency (see to_networkx() for a DiGraph view). Node u is
+        # junction _idx_to_id[u].
+        self._idx_to_id: List[str] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._csr = _EMPTY_CSR
+        
+        # Road lengths parallel to `indices`, in 10 m units. Search and
+        # scoring only use hop counts; the float km lengths are kept on a
+        # cold array for display.
+        self._edge_len_10m = np.zeros(0, dtype=np.int16)
+        self._edge_weight_km = np.zeros(0, dtype=np.float64)
+        
+        # Junction attributes stored SoA, parallel to the CSR node index.
+        # Nodes that only appear as road endpoints have no info (known=False).
+        self._junction_lat = np.zeros(0, dtype=np.float64)
+        self._junction_lon = np.zeros(0, dtype=np.float64)
+        self._junction_name_arr: List[Optional[str]] = []
+        self._junction_known = np.zeros(0, dtype=np.bool_)
+        self._junction_count = 0
+        
+        # LRU of (start_idx, max_hops) -> (nodes, dists); reset on rebuild
+        self._bfs_cache: "OrderedDict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._bfs_cache_max = bfs_cache_size
+        
+        # (plate, incident minute, location) -> (expires_at, result)
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, IncidentInferenceResult]]" = OrderedDict()
+        
+        # Per-source reachability up to _reach_max_hops, in BFS order
+        # (dists non-decreasing). Empty when not precomputed.
+        self.precompute_reachability = precompute_reachability
+        self._reach_max_hops = 0
+        self._reach_nodes: List[np.ndarray] = []
+        self._reach_dists: List[np.ndarray] = []
         
         # Statistics
         self.total_inferences = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.avg_inference_time_ms = 0
+        self._latency_samples: deque = deque(maxlen=LATENCY_SAMPLE_SIZE)
         
-        print("[OK] Vehicle Inference Engine initialized")
+        logger.debug("[OK] Vehicle Inference Engine initialized")
     
     def set_map_service(self, map_service):
         """Set map service after initialization"""
@@ -90,8 +219,8 @@ class VehicleInferenceEngine:
     def _build_road_graph(self):
         """Build road network graph from map service"""
         if not self.map_service:
-            print("[INFERENCE] No map service - using empty graph")
-            self._road_graph = nx.DiGraph()
+            logger.info("[INFERENCE] No map service - using empty graph")
+            self._compile_csr([], {})
             return
         
         try:
@@ -100,53 +229,186 @@ class VehicleInferenceEngine:
             roads = self.map_service.get_roads()
             
             if not junctions:
-                print("[INFERENCE] No junctions found in map")
-                self._road_graph = nx.DiGraph()
+                logger.warning("[INFERENCE] No junctions found in map")
+                self._compile_csr([], {})
                 return
             
-            self._road_graph = nx.DiGraph()
-            
-            # Add junction nodes
+            # Junction nodes (info is compiled into arrays by _compile_csr)
+            nodes = []
             for junction in junctions:
                 junction_id = junction.get('id') or junction.get('junction_id')
-                self._road_graph.add_node(junction_id)
-                
-                # Cache junction info
-                self._junction_cache[junction_id] = JunctionInfo(
-                    id=junction_id,
-                    name=junction.get('name', f'Junction {junction_id}'),
-                    lat=junction.get('lat', 0),
-                    lon=junction.get('lon', 0)
-                )
+                nodes.append((junction_id, {
+                    'name': junction.get('name', f'Junction {junction_id}'),
+                    'lat': junction.get('lat', 0),
+                    'lon': junction.get('lon', 0)
+                }))
             
-            # Add road edges
-            if roads:
-                for road in roads:
-                    from_junction = road.get('from_junction') or road.get('fromJunction')
-                    to_junction = road.get('to_junction') or road.get('toJunction')
+            # Directed edges, deduplicated; a bidirectional road yields both
+            # directions. Insertion order fixes neighbor order per node.
+            edges: Dict[Tuple[str, str], float] = {}
+            for road in roads or ():
+                from_junction = road.get('from_junction') or road.get('fromJunction')
+                to_junction = road.get('to_junction') or road.get('toJunction')
+                
+                if from_junction and to_junction:
+                    # Edge weight (distance in km if available)
+                    weight = road.get('length_km')
+                    if weight is None:
+                        weight = 0.5  # Default 500m
+                    edges[(from_junction, to_junction)] = weight
                     
-                    if from_junction and to_junction:
-                        # Add edge with weight (distance in km if available)
-                        weight = road.get('length_km', 0.5)  # Default 500m
-                        self._road_graph.add_edge(from_junction, to_junction, weight=weight)
-                        
-                        # Add reverse edge if bidirectional
-                        if road.get('bidirectional', True):
-                            self._road_graph.add_edge(to_junction, from_junction, weight=weight)
+                    # Add reverse edge if bidirectional
+                    if road.get('bidirectional', True):
+                        edges[(to_junction, from_junction)] = weight
             
-            print(f"[INFERENCE] Road graph built: {self._road_graph.number_of_nodes()} nodes, "
-                  f"{self._road_graph.number_of_edges()} edges")
+            self._compile_csr(nodes, edges)
+            
+            logger.info("[INFERENCE] Road graph built: %d nodes, %d edges",
+                        self._csr.n_nodes, self._csr.n_edges)
             
         except Exception as e:
-            print(f"[INFERENCE] Error building road graph: {e}")
-            self._road_graph = nx.DiGraph()
+            logger.error("[INFERENCE] Error building road graph: %s", e)
+            self._compile_csr([], {})
+    
+    def _compile_csr(
+        self,
+        nodes: List[Tuple[str, Dict[str, Any]]],
+        edges: Dict[Tuple[str, str], float]
+    ):
+        """
+        Compile junctions and directed edges straight into CSR arrays
+        
+        Node `u` is `self._idx_to_id[u]`; its successors occupy rows
+        indptr[u]:indptr[u+1] of `indices`. Road endpoints that are not
+        listed junctions become nodes without junction info.
+        """
+        idx_to_id = [junction_id for junction_id, _ in nodes]
+        id_to_idx = {jid: i for i, jid in enumerate(idx_to_id)}
+        node_attrs = [attrs for _, attrs in nodes]
+        
+        sources = []
+        targets = []
+        for from_junction, to_junction in edges:
+            for junction_id in (from_junction, to_junction):
+                if junction_id not in id_to_idx:
+                    id_to_idx[junction_id] = len(idx_to_id)
+                    idx_to_id.append(junction_id)
+                    node_attrs.append({})
+            sources.append(id_to_idx[from_junction])
+            targets.append(id_to_idx[to_junction])
+        
+        n = len(idx_to_id)
+        sources = np.asarray(sources, dtype=np.int32)
+        weights = np.fromiter(edges.values(), dtype=np.float64, count=len(edges))
+        
+        # Group edges by source; stable, so each row keeps insertion order
+        order = np.argsort(sources, kind='stable')
+        indices = np.asarray(targets, dtype=np.int32)[order]
+        self._edge_weight_km = weights[order]
+        self._edge_len_10m = np.clip(
+            np.rint(self._edge_weight_km / EDGE_LENGTH_UNIT_KM),
+            0, np.iinfo(np.int16).max
+        ).astype(np.int16)
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        self._csr = CSRGraph(indptr=indptr, indices=indices, n_nodes=n)
+        
+        self._idx_to_id = idx_to_id
+        self._id_to_idx = id_to_idx
+        
+        self._junction_lat = np.array([a.get('lat', 0.0) for a in node_attrs], dtype=np.float64)
+        self._junction_lon = np.array([a.get('lon', 0.0) for a in node_attrs], dtype=np.float64)
+        self._junction_name_arr = [a.get('name') for a in node_attrs]
+        self._junction_known = np.array(['name' in a for a in node_attrs], dtype=np.bool_)
+        self._junction_count = int(self._junction_known.sum())
+        
+        self._bfs_cache.clear()
+        self._result_cache.clear()
+        self._build_reach_table()
+    
+    def to_networkx(self) -> "nx.DiGraph":
+        """Build a NetworkX DiGraph of the road network (diagnostics only)"""
+        import networkx as nx
+        
+        graph = nx.DiGraph()
+        
+        for idx, junction_id in enumerate(self._idx_to_id):
+            if self._junction_known[idx]:
+                graph.add_node(
+                    junction_id,
+                    name=self._junction_name_arr[idx],
+                    lat=float(self._junction_lat[idx]),
+                    lon=float(self._junction_lon[idx])
+                )
+            else:
+                graph.add_node(junction_id)
+        
+        indptr = self._csr.indptr.tolist()
+        indices = self._csr.indices.tolist()
+        weights = self._edge_weight_km.tolist()
+        for u, junction_id in enumerate(self._idx_to_id):
+            for k in range(indptr[u], indptr[u + 1]):
+                graph.add_edge(junction_id, self._idx_to_id[indices[k]], weight=weights[k])
+        
+        return graph
+    
+    def _junction_info(self, junction_id: Optional[str]) -> Optional[JunctionInfo]:
+        """JunctionInfo view of the SoA arrays (None if unknown)"""
+        idx = self._id_to_idx.get(junction_id)
+        if idx is None or not self._junction_known[idx]:
+            return None
+        
+        return JunctionInfo(
+            id=junction_id,
+            name=self._junction_name_arr[idx],
+            lat=float(self._junction_lat[idx]),
+            lon=float(self._junction_lon[idx])
+        )
+    
+    def _build_reach_table(self):
+        """Precompute BFS from every node up to the max search radius"""
+        self._reach_nodes = []
+        self._reach_dists = []
+        self._reach_max_hops = 0
+        
+        n = self._csr.n_nodes
+        if not self.precompute_reachability or n == 0:
+            return
+        
+        max_hops = math.ceil(self.max_search_radius / AVG_JUNCTION_DISTANCE_KM)
+        reach_nodes = []
+        reach_dists = []
+        entries = 0
+        
+        for start_idx in range(n):
+            if NUMBA_AVAILABLE:
+                nodes, dists = bfs_csr(self._csr.indptr, self._csr.indices, start_idx, max_hops)
+            else:
+                nodes, dists = self._bfs_python(start_idx, max_hops)
+            
+            entries += len(nodes)
+            if entries > REACH_TABLE_MAX_ENTRIES:
+                logger.info("[INFERENCE] Reachability table too large (%d junctions) - using BFS", n)
+                return
+            
+            dists = dists.astype(np.int16)
+            nodes.flags.writeable = False
+            dists.flags.writeable = False
+            reach_nodes.append(nodes)
+            reach_dists.append(dists)
+        
+        self._reach_nodes = reach_nodes
+        self._reach_dists = reach_dists
+        self._reach_max_hops = max_hops
+        logger.info("[INFERENCE] Reachability table built: %d entries, %d hops", entries, max_hops)
     
     async def process_incident(
         self,
         incident_id: str,
         number_plate: str,
         incident_time: float,
-        incident_location: Optional[Tuple[float, float]] = None
+        incident_location: Optional[Tuple[float, float]] = None,
+        session: Optional[AsyncSession] = None
     ) -> Optional[IncidentInferenceResult]:
         """
         Process incident and generate location inference
@@ -156,47 +418,144 @@ class VehicleInferenceEngine:
             number_plate: Vehicle number plate
             incident_time: When incident occurred
             incident_location: Known incident location (lat, lon)
+            session: Caller's async session to query with (e.g. from
+                Depends(get_async_db)); a new one is opened if omitted
         
         Returns:
             IncidentInferenceResult with probable locations
         """
         start_time = time.time()
         
-        print(f"[INFERENCE] Processing incident {incident_id}")
-        print(f"   Plate: {number_plate}")
-        print(f"   Incident time: {time.ctime(incident_time)}")
+        cache_key = self._result_cache_key(number_plate, incident_time, incident_location)
+        cached = self._cached_result(cache_key, incident_id)
+        if cached is not None:
+            return cached
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[INFERENCE] Processing incident %s (plate=%s, time=%s)",
+                         incident_id, number_plate, time.ctime(incident_time))
         
         # 1. Query detection history
-        detections = await self._query_detections(number_plate, incident_time)
+        detections = await self._query_detections(number_plate, incident_time, session)
+        
+        result = self._infer(
+            incident_id, number_plate, incident_location, detections, start_time
+        )
+        self._store_result(cache_key, result)
+        return result
+    
+    async def process_incident_batch(
+        self,
+        items: List[Tuple[str, str, float, Optional[Tuple[float, float]]]],
+        session: Optional[AsyncSession] = None
+    ) -> List[Optional[IncidentInferenceResult]]:
+        """
+        Process several incidents with one batched detection query
+        
+        Args:
+            items: (incident_id, number_plate, incident_time, incident_location)
+            session: Caller's async session to query with; a new one is
+                opened if omitted
         
+        Returns:
+            Inference results in the same order as `items`
+        """
+        if not items:
+            return []
+        
+        start_time = time.time()
+        
+        results: List[Optional[IncidentInferenceResult]] = [None] * len(items)
+        misses = []
+        for i, (incident_id, number_plate, incident_time, incident_location) in enumerate(items):
+            cache_key = self._result_cache_key(number_plate, incident_time, incident_location)
+            results[i] = self._cached_result(cache_key, incident_id)
+            if results[i] is None:
+                misses.append((i, cache_key))
+        
+        if not misses:
+            return results
+        
+        logger.debug("[INFERENCE] Processing batch of %d incidents", len(misses))
+        
+        detections_by_query = await self._query_detections_batch(
+            [(items[i][1], items[i][2]) for i, _ in misses],
+            session
+        )
+        
+        for (i, cache_key), detections in zip(misses, detections_by_query):
+            incident_id, number_plate, _, incident_location = items[i]
+            results[i] = self._infer(
+                incident_id, number_plate, incident_location, detections, start_time
+            )
+            self._store_result(cache_key, results[i])
+        
+        return results
+    
+    @staticmethod
+    def _result_cache_key(
+        number_plate: str,
+        incident_time: float,
+        incident_location: Optional[Tuple[float, float]]
+    ) -> Tuple:
+        """Result cache key: plate, incident minute and location"""
+        return (number_plate, int(incident_time // 60), incident_location)
+    
+    def _cached_result(
+        self,
+        cache_key: Tuple,
+        incident_id: str
+    ) -> Optional[IncidentInferenceResult]:
+        """Unexpired cached result re-labelled for `incident_id`, if any"""
+        entry = self._result_cache.get(cache_key)
+        if entry is None or entry[0] < time.time():
+            self.cache_misses += 1
+            return None
+        
+        self.cache_hits += 1
+        self._result_cache.move_to_end(cache_key)
+        
+        result = entry[1]
+        if result.incident_id != incident_id:
+            result = replace(result, incident_id=incident_id)
+        return result
+    
+    def _store_result(self, cache_key: Tuple, result: IncidentInferenceResult):
+        """Cache a fresh result for RESULT_CACHE_TTL seconds"""
+        self._result_cache[cache_key] = (time.time() + RESULT_CACHE_TTL, result)
+        self._result_cache.move_to_end(cache_key)
+        
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    def _infer(
+        self,
+        incident_id: str,
+        number_plate: str,
+        incident_location: Optional[Tuple[float, float]],
+        detections: List[DetectionRecord],
+        start_time: float
+    ) -> IncidentInferenceResult:
+        """Build the inference result from a vehicle's detection history"""
         if not detections:
-            print(f"[INFERENCE] No detections found for {number_plate}")
+            logger.debug("[INFERENCE] No detections found for %s", number_plate)
             
             # Return result with no data
-            inference_time_ms = (time.time() - start_time) * 1000
+            now = time.time()
+            inference_time_ms = (now - start_time) * 1000
             self._update_stats(inference_time_ms)
             
-            return IncidentInferenceResult(
+            return replace(
+                _EMPTY_RESULT,
                 incident_id=incident_id,
                 number_plate=number_plate,
-                last_known_junction=None,
-                last_known_junction_name=None,
-                last_seen_time=None,
-                last_seen_lat=None,
-                last_seen_lon=None,
-                time_elapsed=0,
-                probable_locations=[],
-                search_radius=0,
                 search_center_lat=incident_location[0] if incident_location else None,
                 search_center_lon=incident_location[1] if incident_location else None,
-                detection_history=[],
-                detection_count=0,
-                overall_confidence=0,
                 inference_time_ms=inference_time_ms,
-                generated_at=time.time()
+                generated_at=now
             )
         
-        print(f"[INFERENCE] Found {len(detections)} detections")
+        logger.debug("[INFERENCE] Found %d detections", len(detections))
         
         # 2. Get last known location
         last_detection = detections[-1]  # Most recent
@@ -222,7 +581,7 @@ class VehicleInferenceEngine:
         )
         
         # Get last junction info
-        last_junction_info = self._junction_cache.get(last_detection.junction_id)
+        last_junction_info = self._junction_info(last_detection.junction_id)
         
         inference_time_ms = (time.time() - start_time) * 1000
         self._update_stats(inference_time_ms)
@@ -247,61 +606,147 @@ class VehicleInferenceEngine:
             generated_at=time.time()
         )
         
-        print(f"[INFERENCE] Complete: {len(probable_locations)} probable locations")
-        print(f"   Last seen: {last_detection.junction_id} at {time.ctime(last_detection.timestamp)}")
-        print(f"   Time elapsed: {time_elapsed/60:.1f} minutes")
-        print(f"   Confidence: {overall_confidence:.1f}%")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[INFERENCE] Complete: %d probable locations (last seen %s at %s, "
+                "%.1f minutes ago, confidence %.1f%%)",
+                len(probable_locations), last_detection.junction_id,
+                time.ctime(last_detection.timestamp), time_elapsed / 60, overall_confidence
+            )
         
         return result
     
     async def _query_detections(
         self,
         number_plate: str,
-        incident_time: float
+        incident_time: float,
+        session: Optional[AsyncSession] = None
     ) -> List[DetectionRecord]:
         """Query detection records for vehicle"""
-        db = SessionLocal()
+        return (await self._query_detections_batch([(number_plate, incident_time)], session))[0]
+    
+    async def _query_detections_batch(
+        self,
+        queries: List[Tuple[str, float]],
+        session: Optional[AsyncSession] = None
+    ) -> List[List[DetectionRecord]]:
+        """
+        Batched detection query (one async session, one SELECT ... IN)
+        
+        Each query gets detections from `detection_time_window` before its
+        incident up to now, oldest first. Runs on `session` when given
+        (left open for the caller), otherwise on a new session.
+        
+        Returns:
+            Detection lists in the same order as `queries`
+        """
+        if not queries:
+            return []
+        
+        plates = {number_plate for number_plate, _ in queries}
+        min_start = min(incident_time for _, incident_time in queries) - self.detection_time_window
+        stmt = self._detection_query(plates, min_start, time.time())
         
         try:
-            # Query detections from 1 hour before incident to now
-            start_time = incident_time - self.detection_time_window
-            end_time = time.time()
-            
-            detections = db.query(DetectionRecord)\
-                .filter(DetectionRecord.number_plate == number_plate)\
-                .filter(DetectionRecord.timestamp >= start_time)\
-                .filter(DetectionRecord.timestamp <= end_time)\
-                .order_by(DetectionRecord.timestamp.asc())\
-                .all()
-            
-            return list(detections)
-            
+            if session is not None:
+                rows = (await session.execute(stmt)).scalars().all()
+            else:
+                async with AsyncSessionLocal() as db:
+                    rows = (await db.execute(stmt)).scalars().all()
         except Exception as e:
-            print(f"[INFERENCE] Detection query error: {e}")
-            return []
-        finally:
-            db.close()
+            logger.error("[INFERENCE] Detection query error: %s", e)
+            return [[] for _ in queries]
+        
+        by_plate = {
+            plate: list(group)
+            for plate, group in groupby(rows, key=lambda row: row.number_plate)
+        }
+        
+        # Trim each plate's rows to its own incident window
+        results = []
+        for number_plate, incident_time in queries:
+            start_time = incident_time - self.detection_time_window
+            results.append([
+                det for det in by_plate.get(number_plate, ())
+                if det.timestamp >= start_time
+            ])
+        
+        return results
+    
+    @staticmethod
+    def _detection_query(plates, start_time: float, end_time: float):
+        """
+        SELECT for plates' detections in a time range, by plate then time
+        
+        Shaped to be served by idx_detection_plate_time (number_plate,
+        timestamp): an index range seek per plate that already yields rows
+        in ORDER BY order, so no separate sort.
+        """
+        return (
+            select(DetectionRecord)
+            .where(DetectionRecord.number_plate.in_(plates))
+            .where(DetectionRecord.timestamp >= start_time)
+            .where(DetectionRecord.timestamp <= end_time)
+            .order_by(DetectionRecord.number_plate, DetectionRecord.timestamp.asc())
+        )
+    
+    def explain_detection_query(self, db) -> List[str]:
+        """
+        Query plan for the detection lookup (diagnostics)
+        
+        Use to confirm the composite (number_plate, timestamp) index is
+        used, e.g. after schema changes or on a new database backend.
+        
+        Args:
+            db: Sync SQLAlchemy session
+        
+        Returns:
+            Plan lines as reported by the database
+        """
+        dialect = db.get_bind().dialect
+        stmt = self._detection_query(["EXPLAIN"], 0.0, time.time())
+        sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN "
+        
+        rows = db.execute(text(prefix + sql)).all()
+        return [" ".join(str(col) for col in row) for row in rows]
     
     def _build_detection_history(
         self,
         detections: List[DetectionRecord]
     ) -> List[DetectionHistoryItem]:
         """Build detection history from records"""
-        history = []
+        count = len(detections)
         
-        for det in detections:
-            junction_info = self._junction_cache.get(det.junction_id)
-            
-            history.append(DetectionHistoryItem(
+        # Resolve every junction id once, then gather junction info
+        get_idx = self._id_to_idx.get
+        idxs = np.fromiter(
+            (get_idx(det.junction_id, -1) for det in detections),
+            dtype=np.int32, count=count
+        )
+        found = idxs >= 0
+        if found.any():
+            found[found] = self._junction_known[idxs[found]]
+            safe = np.where(found, idxs, 0)
+            idx_list = safe.tolist()
+            lat_list = self._junction_lat[safe].tolist()
+            lon_list = self._junction_lon[safe].tolist()
+        else:
+            idx_list = lat_list = lon_list = [None] * count
+        
+        # Unknown junctions fall back to the recorded position
+        names = self._junction_name_arr
+        return [
+            DetectionHistoryItem(
                 junction_id=det.junction_id,
-                junction_name=junction_info.name if junction_info else None,
+                junction_name=names[i] if ok else None,
                 timestamp=det.timestamp,
                 direction=det.direction or 'N',
-                lat=junction_info.lat if junction_info else det.position_y,
-                lon=junction_info.lon if junction_info else det.position_x
-            ))
-        
-        return history
+                lat=lat if ok else det.position_y,
+                lon=lon if ok else det.position_x
+            )
+            for det, ok, i, lat, lon in zip(detections, found.tolist(), idx_list, lat_list, lon_list)
+        ]
     
     def _calculate_probable_locations(
         self,
@@ -316,73 +761,77 @@ class VehicleInferenceEngine:
         2. Find all reachable junctions within time window
         3. Calculate probability based on distance
         """
-        if not self._road_graph or not last_junction:
+        if not self._id_to_idx or not last_junction:
             return []
         
-        if last_junction not in self._road_graph:
-            # Junction not in graph - return just the last known
-            junction_info = self._junction_cache.get(last_junction)
-            if junction_info:
-                return [ProbableLocation(
-                    junction_id=last_junction,
-                    junction_name=junction_info.name,
-                    lat=junction_info.lat,
-                    lon=junction_info.lon,
-                    confidence=100.0,
-                    distance_from_last=0,
-                    estimated_travel_time=0
-                )]
+        if last_junction not in self._id_to_idx:
+            # Junction not in graph - nothing known about it
             return []
         
-        # Calculate max reachable distance based on time
-        max_distance_km = (self.avg_city_speed * time_elapsed) / 3600
-        max_distance_km = min(max_distance_km, self.max_search_radius)
+        try:
+            # Calculate max reachable distance based on time
+            max_distance_km = (self.avg_city_speed * time_elapsed) / 3600
+            max_distance_km = min(max_distance_km, self.max_search_radius)
+            
+            # Estimate max junction hops (assuming avg 0.5km between junctions)
+            max_hops = max(1, int(max_distance_km / AVG_JUNCTION_DISTANCE_KM))
+            
+            # BFS to find reachable junctions
+            nodes, dists = self._reachable(self._id_to_idx[last_junction], max_hops)
+        except Exception:
+            logger.exception(
+                "[INFERENCE] Reachability search failed (junction=%s, elapsed=%s)",
+                last_junction, time_elapsed
+            )
+            return []
         
-        # Estimate max junction hops (assuming avg 0.5km between junctions)
-        avg_junction_distance = 0.5  # km
-        max_hops = max(1, int(max_distance_km / avg_junction_distance))
+        # Top 10 junctions with junction info. Confidence never increases
+        # with hop count and BFS order never decreases it, so these are
+        # the first 10 known nodes (ties keep BFS order); only they are
+        # scored and materialized.
+        top = np.flatnonzero(self._junction_known[nodes])[:10]
+        nodes = nodes[top]
+        dists = dists[top]
         
-        # BFS to find reachable junctions
-        reachable = self._bfs_reachable_junctions(last_junction, max_hops)
+        # Probability inversely proportional to distance, reduced for
+        # older detections (decay over an hour)
+        time_factor = max(0.3, 1 - (time_elapsed / 3600))
+        confidence, travel_time = self._score_batch(dists, time_factor)
         
-        # Calculate probability for each reachable junction
-        probable_locations = []
+        idx_to_id = self._idx_to_id
+        names = self._junction_name_arr
+        lats = self._junction_lat
+        lons = self._junction_lon
+        return [
+            ProbableLocation(
+                junction_id=idx_to_id[node],
+                junction_name=names[node],
+                lat=lat,
+                lon=lon,
+                confidence=round(conf, 1),
+                distance_from_last=hops,
+                estimated_travel_time=round(travel, 0)
+            )
+            for node, lat, lon, conf, hops, travel in zip(
+                nodes.tolist(), lats[nodes].tolist(), lons[nodes].tolist(),
+                confidence.tolist(), dists.tolist(), travel_time.tolist()
+            )
+        ]
+    
+    @staticmethod
+    def _make_score_batch(conf_lut: np.ndarray, travel_lut: np.ndarray):
+        """
+        Build the per-hop scoring function with its tables bound in
         
-        for junction_id, distance in reachable.items():
-            junction_info = self._junction_cache.get(junction_id)
-            
-            if not junction_info:
-                continue
-            
-            # Probability inversely proportional to distance
-            # Also factor in time - closer in time = higher probability
-            base_confidence = 100 / (1 + distance * 0.5)
-            
-            # Reduce confidence for older detections
-            time_factor = max(0.3, 1 - (time_elapsed / 3600))  # Decay over an hour
-            confidence = base_confidence * time_factor
-            
-            # Clamp confidence
-            confidence = min(100, max(5, confidence))
-            
-            # Estimated travel time (simple calculation)
-            travel_time = (distance * avg_junction_distance / self.avg_city_speed) * 3600
-            
-            probable_locations.append(ProbableLocation(
-                junction_id=junction_id,
-                junction_name=junction_info.name,
-                lat=junction_info.lat,
-                lon=junction_info.lon,
-                confidence=round(confidence, 1),
-                distance_from_last=distance,
-                estimated_travel_time=round(travel_time, 0)
-            ))
-        
-        # Sort by confidence (highest first)
-        probable_locations.sort(key=lambda x: x.confidence, reverse=True)
-        
-        # Return top 10
-        return probable_locations[:10]
+        The returned f(dists, time_factor) gives (confidence, travel_time)
+        arrays: confidence clamped to [5, 100], travel time in seconds.
+        """
+        clip = np.clip
+        
+        def score_batch(dists: np.ndarray, time_factor: float) -> Tuple[np.ndarray, np.ndarray]:
+            return clip(conf_lut[dists] * time_factor, 5.0, 100.0), travel_lut[dists]
+        
+        return score_batch
     
     def _bfs_reachable_junctions(
         self,
@@ -395,26 +844,83 @@ class VehicleInferenceEngine:
         Returns:
             Dict of junction_id -> distance (hops)
         """
-        visited = {start: 0}
-        queue = deque([(start, 0)])
+        start_idx = self._id_to_idx.get(start)
+        if start_idx is None:
+            return {start: 0}
+        
+        nodes, dists = self._reachable(start_idx, max_hops)
+        
+        idx_to_id = self._idx_to_id
+        return {idx_to_id[i]: d for i, d in zip(nodes.tolist(), dists.tolist())}
+    
+    def _reachable(self, start_idx: int, max_hops: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Junctions reachable from a node index within max_hops
+        
+        Served from the precomputed table when it covers max_hops,
+        otherwise from the BFS cache.
+        
+        Returns:
+            Read-only (nodes, dists) arrays in BFS order
+        
+        Raises:
+            IndexError: start_idx is not a node of the compiled graph
+        """
+        # Checked once here: the kernel itself runs without bounds checks
+        if not 0 <= start_idx < self._csr.n_nodes:
+            raise IndexError(f"Junction index {start_idx} out of range")
+        
+        if max_hops <= self._reach_max_hops:
+            # BFS order means dists are sorted: truncate with a view
+            dists = self._reach_dists[start_idx]
+            end = int(np.searchsorted(dists, max_hops, side='right'))
+            return self._reach_nodes[start_idx][:end], dists[:end]
+        
+        key = (start_idx, max_hops)
+        cached = self._bfs_cache.get(key)
+        if cached is not None:
+            self._bfs_cache.move_to_end(key)
+            return cached
+        
+        if NUMBA_AVAILABLE:
+            nodes, dists = bfs_csr(self._csr.indptr, self._csr.indices, start_idx, max_hops)
+        else:
+            nodes, dists = self._bfs_python(start_idx, max_hops)
+        
+        # Shared between callers, so freeze them
+        nodes.flags.writeable = False
+        dists.flags.writeable = False
+        
+        result = (nodes, dists)
+        self._bfs_cache[key] = result
+        if len(self._bfs_cache) > self._bfs_cache_max:
+            self._bfs_cache.popitem(last=False)
+        
+        return result
+    
+    def _bfs_python(self, start_idx: int, max_hops: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Interpreter BFS over the CSR arrays; same output as bfs_csr"""
+        indptr = self._csr.indptr
+        indices = self._csr.indices
+        dist = {start_idx: 0}
+        queue = deque([start_idx])
         
         while queue:
-            current, dist = queue.popleft()
+            current = queue.popleft()
+            next_dist = dist[current] + 1
             
-            if dist >= max_hops:
+            if next_dist > max_hops:
                 continue
             
-            try:
-                neighbors = self._road_graph.neighbors(current)
-                
-                for neighbor in neighbors:
-                    if neighbor not in visited:
-                        visited[neighbor] = dist + 1
-                        queue.append((neighbor, dist + 1))
-            except Exception:
-                continue
+            for neighbor in indices[indptr[current]:indptr[current + 1]].tolist():
+                if neighbor not in dist:
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
         
-        return visited
+        # dict preserves insertion (BFS) order
+        nodes = np.fromiter(dist.keys(), dtype=np.int32, count=len(dist))
+        dists = np.fromiter(dist.values(), dtype=np.int32, count=len(dist))
+        return nodes, dists
     
     def _calculate_search_radius(self, time_elapsed: float) -> float:
         """Calculate search radius in km based on elapsed time"""
@@ -450,26 +956,40 @@ class VehicleInferenceEngine:
         return round(min(100, max(0, confidence)), 1)
     
     def _update_stats(self, inference_time_ms: float):
-        """Update running statistics"""
-        self.total_inferences += 1
+        """
+        Update running statistics
         
-        # Running average
-        self.avg_inference_time_ms = (
-            (self.avg_inference_time_ms * (self.total_inferences - 1) + inference_time_ms)
-            / self.total_inferences
-        )
+        Incremental (Welford) mean, so precision doesn't degrade as the
+        count grows. Called synchronously between awaits, so concurrent
+        incidents on the event loop can't interleave the update.
+        """
+        self.total_inferences += 1
+        self.avg_inference_time_ms += (inference_time_ms - self.avg_inference_time_ms) / self.total_inferences
+        self._latency_samples.append(inference_time_ms)
     
     def get_statistics(self) -> dict:
         """Get inference engine statistics"""
+        if self._latency_samples:
+            p50, p95, p99 = np.percentile(np.fromiter(self._latency_samples, dtype=np.float64), [50, 95, 99])
+        else:
+            p50 = p95 = p99 = 0.0
+        
         return {
             'totalInferences': self.total_inferences,
             'avgInferenceTimeMs': round(self.avg_inference_time_ms, 2),
+            'p50InferenceTimeMs': round(float(p50), 2),
+            'p95InferenceTimeMs': round(float(p95), 2),
+            'p99InferenceTimeMs': round(float(p99), 2),
             'avgCitySpeed': self.avg_city_speed,
             'maxSearchRadius': self.max_search_radius,
             'detectionTimeWindow': self.detection_time_window,
-            'graphNodes': self._road_graph.number_of_nodes() if self._road_graph else 0,
-            'graphEdges': self._road_graph.number_of_edges() if self._road_graph else 0,
-            'cachedJunctions': len(self._junction_cache)
+            'graphNodes': self._csr.n_nodes,
+            'graphEdges': self._csr.n_edges,
+            'cachedJunctions': self._junction_count,
+            'bfsCacheEntries': len(self._bfs_cache),
+            'reachTableHops': self._reach_max_hops,
+            'cacheHits': self.cache_hits,
+            'cacheMisses': self.cache_misses
         }
 
 
@@ -493,7 +1013,9 @@ def init_inference_engine(
         map_service=map_service,
         avg_city_speed=config.get('avgCitySpeed', 30.0),
         max_search_radius=config.get('maxSearchRadius', 10.0),
-        detection_time_window=config.get('detectionTimeWindow', 3600)
+        detection_time_window=config.get('detectionTimeWindow', 3600),
+        bfs_cache_size=config.get('bfsCacheSize', BFS_CACHE_SIZE),
+        precompute_reachability=config.get('precomputeReachability', True)
     )
     
     return _inference_engine
@@ -7,20 +7,53 @@ It initializes FastAPI, Socket.IO, database, and all core components.
 """
 
 import os
+import json
 import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 import socketio
 from dotenv import load_dotenv
 
+from app.utils.json_codec import socketio_json
+from app.utils.responses import FastJSONResponse
+
 # Load environment variables
 load_dotenv()
 
+# Open-file soft limit requested at startup (one fd per WebSocket client)
+FD_LIMIT_TARGET = 65535
+
+# Seconds an idle HTTP keep-alive connection is held open (REST and the
+# Socket.IO polling transport share the port)
+KEEP_ALIVE_TIMEOUT = 5
+
+
+def _create_client_manager():
+    """
+    Socket.IO client manager shared across worker processes
+    
+    Set SOCKETIO_REDIS_URL (e.g. redis://redis:6379/0) to fan out emits
+    from any uvicorn worker to clients on every worker. Without it, or
+    without the redis package, client sessions stay in-process.
+    """
+    redis_url = os.getenv("SOCKETIO_REDIS_URL")
+    if not redis_url:
+        return None
+    
+    try:
+        return socketio.AsyncRedisManager(redis_url)
+    except RuntimeError as e:
+        print(f"[WARN] Socket.IO Redis manager unavailable: {e}")
+        return None
+
+
 # Create Socket.IO server
 sio = socketio.AsyncServer(
     async_mode='asgi',
+    client_manager=_create_client_manager(),
+    json=socketio_json,  # orjson packet encoding when installed
     cors_allowed_origins='*',
     logger=False,  # Reduce noise in production
     engineio_logger=False,
@@ -28,10 +61,14 @@ sio = socketio.AsyncServer(
     ping_timeout=60
 )
 
-# Global instances for WebSocket
+# Global instances for WebSocket (bound in lifespan; read directly by the
+# health and stats endpoints)
 ws_emitter = None
 ws_handlers = None
 
+# Process start time, for uptime reporting
+_STARTED_AT = time.time()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -39,6 +76,12 @@ async def lifespan(app: FastAPI):
     global ws_emitter, ws_handlers
     
     # Startup
+    from app.utils.logging_queue import start_queue_logging, stop_queue_logging
+    start_queue_logging()
+    
+    from app.utils.access_log import install_access_log_filter
+    install_access_log_filter()
+    
     print("=" * 60)
     print("[STARTUP] Autonomous City Traffic Intelligence System")
     print("=" * 60)
@@ -62,6 +105,9 @@ async def lifespan(app: FastAPI):
     set_emitter(ws_emitter)
     set_handlers(ws_handlers)
     
+    # Flush queued vehicle updates as one batch frame per 100ms tick
+    await ws_emitter.start_vehicle_ticker()
+    
     print("[OK] WebSocket emitter and handlers initialized")
     
     # Initialize Density Tracker (FRD-02)
@@ -228,6 +274,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[SHUTDOWN] Error stopping prediction broadcast: {e}")
     
+    # Stop vehicle update ticker
+    if ws_emitter:
+        await ws_emitter.stop_vehicle_ticker()
+    
     # Stop agent if running
     from app.agent import get_agent
     agent = get_agent()
@@ -243,7 +293,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[SHUTDOWN] Error stopping watchdog: {e}")
     
+    # Close pooled async DB connections
+    from app.database.database import async_engine
+    await async_engine.dispose()
+    
     print("[SHUTDOWN] Complete")
+    stop_queue_logging()
 
 
 # Create FastAPI application
@@ -252,6 +307,7 @@ app = FastAPI(
     description="Autonomous City Traffic Intelligence System - AutonomousHacks 2026",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -328,52 +384,60 @@ app.include_router(rl_router)
 from app.api.safety_routes import router as safety_router
 app.include_router(safety_router)
 
+# Raw WebSocket telemetry: /ws/telemetry (vehicle and density batches)
+from app.websocket.telemetry import telemetry_endpoint
+app.add_api_websocket_route("/ws/telemetry", telemetry_endpoint)
+
 
 # ============================================
 # Root Endpoints
 # ============================================
 
+# Static API information, serialized once at import (same compact
+# encoding as JSONResponse)
+_ROOT_BODY = json.dumps({
+    "name": "Autonomous City Traffic Intelligence System",
+    "version": "1.0.0",
+    "status": "operational",
+    "documentation": "/docs",
+    "websocket": "ws://localhost:8000",
+    "endpoints": {
+        "system": "/api/state",
+        "vehicles": "/api/vehicles",
+        "junctions": "/api/junctions",
+        "roads": "/api/roads",
+        "density": "/api/density",
+        "agent": "/api/agent/*",
+        "simulation": "/api/simulation/*",
+        "traffic_control": "/api/traffic/*",
+        "map": "/api/map/*",
+        "emergency": "/api/emergency/*",
+        "incident": "/api/incident/*",
+        "violations": "/api/violations",
+        "challans": "/api/challans",
+        "predictions": "/api/predictions",
+        "rl": "/api/rl/*"
+    }
+}, separators=(",", ":")).encode()
+
+
 @app.get("/", tags=["root"])
 async def root():
     """Root endpoint - API information"""
-    return {
-        "name": "Autonomous City Traffic Intelligence System",
-        "version": "1.0.0",
-        "status": "operational",
-        "documentation": "/docs",
-        "websocket": "ws://localhost:8000",
-        "endpoints": {
-            "system": "/api/state",
-            "vehicles": "/api/vehicles",
-            "junctions": "/api/junctions",
-            "roads": "/api/roads",
-            "density": "/api/density",
-            "agent": "/api/agent/*",
-            "simulation": "/api/simulation/*",
-            "traffic_control": "/api/traffic/*",
-            "map": "/api/map/*",
-            "emergency": "/api/emergency/*",
-            "incident": "/api/incident/*",
-            "violations": "/api/violations",
-            "challans": "/api/challans",
-            "predictions": "/api/predictions",
-            "rl": "/api/rl/*"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["health"])
 async def health_check():
     """Health check endpoint"""
-    from app.websocket import get_handlers
-    
-    handlers = get_handlers()
+    handlers = ws_handlers
     ws_clients = handlers.get_client_count() if handlers else 0
+    now = time.time()
     
     return {
         "status": "healthy",
-        "timestamp": time.time(),
-        "uptime": time.time(),
+        "timestamp": now,
+        "uptime": now - _STARTED_AT,
         "websocket": {
             "connected_clients": ws_clients,
             "status": "ready"
@@ -384,10 +448,8 @@ async def health_check():
 @app.get("/ws/stats", tags=["websocket"])
 async def websocket_stats():
     """Get WebSocket statistics"""
-    from app.websocket import get_emitter, get_handlers
-    
-    emitter = get_emitter()
-    handlers = get_handlers()
+    emitter = ws_emitter
+    handlers = ws_handlers
     
     return {
         "emitter": emitter.get_stats() if emitter else None,
@@ -410,7 +472,8 @@ sio_app = socketio.ASGIApp(sio, app)
 # WebSocket Event Reference (handled by WebSocketHandlers)
 # ============================================
 # 
-# Server → Client Events:
+# Server → Client Events (vehicles:batch_update and density:batch_update
+# are also streamed on the raw WebSocket at /ws/telemetry):
 #   - connection:success      : Connection established
 #   - vehicle:update          : Vehicle position update (10 Hz)
 #   - vehicle:spawned         : New vehicle spawned
@@ -449,7 +512,8 @@ sio_app = socketio.ASGIApp(sio, app)
 #   - traffic:mode:change     : Change traffic data mode
 #   - traffic:override:set    : Set manual traffic override
 #   - traffic:override:clear  : Clear traffic override
-#   - subscribe:updates       : Subscribe to update channels
+#   - subscribe:updates       : Subscribe to update channels (optional area/bbox
+#                               limits vehicle updates to a map area or viewport)
 #   - unsubscribe:updates     : Unsubscribe from channels
 
 
@@ -457,13 +521,52 @@ sio_app = socketio.ASGIApp(sio, app)
 # Entry Point
 # ============================================
 
+def _raise_fd_limit(target: int = FD_LIMIT_TARGET):
+    """
+    Raise the open-file soft limit toward `target` (capped at the hard limit)
+    
+    Every WebSocket client holds a file descriptor; the common default
+    soft limit of 1024 is reached long before CPU is.
+    """
+    try:
+        import resource
+    except ImportError:
+        # Not POSIX (Windows): no RLIMIT_NOFILE
+        return
+    
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard != resource.RLIM_INFINITY:
+        target = min(target, hard)
+    if soft != resource.RLIM_INFINITY and soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError) as e:
+            print(f"[WARN] Could not raise open-file limit: {e}")
+
+
 if __name__ == "__main__":
     import uvicorn
     
+    _raise_fd_limit()
+    
+    # UVICORN_RELOAD=1 enables auto-reload for development (single
+    # process, file watcher); it is off unless asked for. WEB_CONCURRENCY
+    # sets the worker count; simulation and agent state live in each
+    # worker, so more than one worker also needs SOCKETIO_REDIS_URL.
+    reload = os.getenv("UVICORN_RELOAD", "0") == "1"
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", "1"))
+    
+    # "auto" selects uvloop and httptools when installed (uvicorn[standard],
+    # not available on Windows) and falls back to asyncio / h11 otherwise
     uvicorn.run(
         "app.main:sio_app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        access_log=os.getenv("ACCESS_LOG", "1") != "0",
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
         log_level="info"
     )
@@ -3,251 +3,162 @@ Pydantic Models Package
 
 All data models for the Traffic Intelligence System.
 Import from here for convenience.
-"""
-
-# Vehicle models
-from .vehicle import (
-    Position,
-    Vehicle,
-    VehicleSpawnRequest,
-    VehicleUpdate,
-)
-
-# Junction and Signal models
-from .junction import (
-    SignalColor,
-    SignalState,
-    JunctionSignals,
-    ConnectedRoads,
-    JunctionMetrics,
-    Junction,
-    SignalChangeRequest,
-    SignalOverride,
-    create_default_signals,
-)
-
-# Road models
-from .road import (
-    RoadGeometry,
-    RoadTraffic,
-    RoadSegment,
-    RealRoad,
-)
-
-# Live Traffic API models
-from .live_traffic import (
-    TrafficIncident,
-    LiveTrafficData,
-    TomTomFlowData,
-    TrafficAPIConfig,
-)
-
-# Coordinate models
-from .coordinates import (
-    MapBounds,
-    GPSCoordinate,
-    CanvasCoordinate,
-    CoordinateConverter,
-    GANDHINAGAR_BOUNDS,
-    GIFT_CITY_BOUNDS,
-    SECTOR_5_BOUNDS,
-)
-
-# Traffic Control models
-from .traffic_control import (
-    TrafficDataMode,
-    TrafficDataSource,
-    ManualTrafficOverride,
-    MapAreaMetadata,
-    MapArea,
-    PREDEFINED_MAP_AREAS,
-    TrafficModeChangeRequest,
-    LoadMapAreaRequest,
-)
 
-# Real Map (OSM) models
-from .real_map import (
-    RealJunction,
-    OSMLoadResult,
-    OSMNodeData,
-    OSMWayData,
-)
-
-# Detection models
-from .detection import (
-    DetectionRecord,
-    DetectionQuery,
-    DetectionSummary,
-    VehicleRoute,
-)
-
-# Violation models
-from .violation import (
-    ViolationEvidence,
-    TrafficViolation,
-    ViolationDetectionResult,
-    ViolationStats,
-    VIOLATION_CONFIG,
-)
-
-# Challan models
-from .challan import (
-    VehicleOwner,
-    Challan,
-    ChallanTransaction,
-    ChallanStats,
-    PayChallanRequest,
-    IssueChallanRequest,
-    MOCK_OWNERS,
-)
-
-# Emergency models
-from .emergency import (
-    EmergencyVehicle,
-    EmergencyCorridor,
-    EmergencyRequest,
-    EmergencyStatus,
-    CorridorCalculation,
-)
-
-# Incident models
-from .incident import (
-    Incident,
-    RouteInference,
-    IncidentReport,
-    IncidentStatus,
-    VehicleTrackingQuery,
-)
-
-# Prediction models
-from .prediction import (
-    CongestionPrediction,
-    PredictionAlert,
-    DensityTrend,
-    PredictionConfig,
-    CityPredictionSummary,
-)
+Submodules are loaded lazily (PEP 562): `from app.models import Vehicle`
+imports only app.models.vehicle, on first access.
+"""
 
-# System State models
-from .system_state import (
-    SimulationState,
-    AgentState,
-    PerformanceMetrics,
-    SystemMode,
-    SystemState,
-    AgentLog,
-    SystemEvent,
-    HealthCheck,
-    SystemStats,
-)
+import importlib
+
+# Submodule -> names it provides
+_EXPORTS = {
+    # Vehicle models
+    "vehicle": (
+        "Position",
+        "MovingPosition",
+        "Vehicle",
+        "VehicleSpawnRequest",
+        "VehicleUpdate",
+    ),
+    # Junction and Signal models
+    "junction": (
+        "SignalColor",
+        "SignalState",
+        "JunctionSignals",
+        "ConnectedRoads",
+        "JunctionMetrics",
+        "Junction",
+        "SignalChangeRequest",
+        "SignalOverride",
+        "create_default_signals",
+    ),
+    # Road models
+    "road": (
+        "DirectionVector",
+        "RoadGeometry",
+        "RoadTraffic",
+        "RoadSegment",
+        "RealRoad",
+    ),
+    # Live Traffic API models
+    "live_traffic": (
+        "TrafficIncident",
+        "LiveTrafficData",
+        "TomTomFlowData",
+        "TrafficAPIConfig",
+    ),
+    # Coordinate models
+    "coordinates": (
+        "MapBounds",
+        "GPSCoordinate",
+        "CanvasCoordinate",
+        "CoordinateConverter",
+        "GANDHINAGAR_BOUNDS",
+        "GIFT_CITY_BOUNDS",
+        "SECTOR_5_BOUNDS",
+    ),
+    # Traffic Control models
+    "traffic_control": (
+        "TrafficDataMode",
+        "TrafficDataSource",
+        "ManualTrafficOverride",
+        "MapAreaMetadata",
+        "MapArea",
+        "PREDEFINED_MAP_AREAS",
+        "TrafficModeChangeRequest",
+        "LoadMapAreaRequest",
+    ),
+    # Real Map (OSM) models
+    "real_map": (
+        "RealJunction",
+        "OSMLoadResult",
+        "OSMNodeData",
+        "OSMWayData",
+    ),
+    # Detection models
+    "detection": (
+        "DetectionRecord",
+        "DetectionQuery",
+        "DetectionSummary",
+        "VehicleRoute",
+    ),
+    # Violation models
+    "violation": (
+        "ViolationEvidence",
+        "TrafficViolation",
+        "ViolationDetectionResult",
+        "ViolationStats",
+        "VIOLATION_CONFIG",
+    ),
+    # Challan models
+    "challan": (
+        "VehicleOwner",
+        "Challan",
+        "ChallanTransaction",
+        "ChallanStats",
+        "PayChallanRequest",
+        "IssueChallanRequest",
+        "MOCK_OWNERS",
+        "MOCK_OWNERS_BY_PLATE",
+    ),
+    # Emergency models
+    "emergency": (
+        "EmergencyVehicle",
+        "EmergencyCorridor",
+        "EmergencyRequest",
+        "EmergencyStatus",
+        "CorridorCalculation",
+    ),
+    # Incident models
+    "incident": (
+        "Incident",
+        "RouteInference",
+        "IncidentReport",
+        "IncidentStatus",
+        "VehicleTrackingQuery",
+    ),
+    # Prediction models
+    "prediction": (
+        "CongestionPrediction",
+        "PredictionAlert",
+        "DensityTrend",
+        "PredictionConfig",
+        "CityPredictionSummary",
+    ),
+    # System State models
+    "system_state": (
+        "SimulationState",
+        "AgentState",
+        "PerformanceMetrics",
+        "SystemMode",
+        "SystemState",
+        "AgentLog",
+        "SystemEvent",
+        "HealthCheck",
+        "SystemStats",
+    ),
+}
+
+# Name -> submodule
+_MODULE_FOR = {
+    name: module
+    for module, names in _EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_MODULE_FOR)
+
+
+def __getattr__(name: str):
+    """Import the providing submodule on first access and cache the name"""
+    module = _MODULE_FOR.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
 
-__all__ = [
-    # Vehicle
-    "Position",
-    "Vehicle",
-    "VehicleSpawnRequest",
-    "VehicleUpdate",
-    
-    # Junction
-    "SignalColor",
-    "SignalState",
-    "JunctionSignals",
-    "ConnectedRoads",
-    "JunctionMetrics",
-    "Junction",
-    "SignalChangeRequest",
-    "SignalOverride",
-    "create_default_signals",
-    
-    # Road
-    "RoadGeometry",
-    "RoadTraffic",
-    "RoadSegment",
-    "RealRoad",
-    
-    # Live Traffic
-    "TrafficIncident",
-    "LiveTrafficData",
-    "TomTomFlowData",
-    "TrafficAPIConfig",
-    
-    # Coordinates
-    "MapBounds",
-    "GPSCoordinate",
-    "CanvasCoordinate",
-    "CoordinateConverter",
-    "GANDHINAGAR_BOUNDS",
-    "GIFT_CITY_BOUNDS",
-    "SECTOR_5_BOUNDS",
-    
-    # Traffic Control
-    "TrafficDataMode",
-    "TrafficDataSource",
-    "ManualTrafficOverride",
-    "MapAreaMetadata",
-    "MapArea",
-    "PREDEFINED_MAP_AREAS",
-    "TrafficModeChangeRequest",
-    "LoadMapAreaRequest",
-    
-    # Real Map
-    "RealJunction",
-    "OSMLoadResult",
-    "OSMNodeData",
-    "OSMWayData",
-    
-    # Detection
-    "DetectionRecord",
-    "DetectionQuery",
-    "DetectionSummary",
-    "VehicleRoute",
-    
-    # Violation
-    "ViolationEvidence",
-    "TrafficViolation",
-    "ViolationDetectionResult",
-    "ViolationStats",
-    "VIOLATION_CONFIG",
-    
-    # Challan
-    "VehicleOwner",
-    "Challan",
-    "ChallanTransaction",
-    "ChallanStats",
-    "PayChallanRequest",
-    "IssueChallanRequest",
-    "MOCK_OWNERS",
-    
-    # Emergency
-    "EmergencyVehicle",
-    "EmergencyCorridor",
-    "EmergencyRequest",
-    "EmergencyStatus",
-    "CorridorCalculation",
-    
-    # Incident
-    "Incident",
-    "RouteInference",
-    "IncidentReport",
-    "IncidentStatus",
-    "VehicleTrackingQuery",
-    
-    # Prediction
-    "CongestionPrediction",
-    "PredictionAlert",
-    "DensityTrend",
-    "PredictionConfig",
-    "CityPredictionSummary",
-    
-    # System State
-    "SimulationState",
-    "AgentState",
-    "PerformanceMetrics",
-    "SystemMode",
-    "SystemState",
-    "AgentLog",
-    "SystemEvent",
-    "HealthCheck",
-    "SystemStats",
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
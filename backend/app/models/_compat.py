@@ -0,0 +1,24 @@
+"""
+Model Helpers
+
+`fast_dataclass` builds plain slotted dataclasses for internal state that
+is created and mutated every simulation tick. They skip Pydantic
+validation on construction and assignment; Pydantic models that contain
+them still validate and serialize them at the API boundary.
+"""
+
+import sys
+from dataclasses import dataclass
+
+
+if sys.version_info >= (3, 10):
+    def fast_dataclass(cls=None, **kwargs):
+        """dataclass(slots=True)"""
+        return dataclass(cls, slots=True, **kwargs) if cls is not None else dataclass(slots=True, **kwargs)
+else:
+    def fast_dataclass(cls=None, **kwargs):
+        """dataclass without slots (slots=True needs Python 3.10)"""
+        return dataclass(cls, **kwargs) if cls is not None else dataclass(**kwargs)
+
+
+__all__ = ["fast_dataclass"]
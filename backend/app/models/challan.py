@@ -4,11 +4,13 @@ Challan (Traffic Fine) Models
 Models for digital challan generation, payment, and tracking.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
-from uuid import uuid4
+import sys
 import time
 
+from app.utils.ids import sequential_id_factory
+
 
 class VehicleOwner(BaseModel):
     """
@@ -26,8 +28,8 @@ class VehicleOwner(BaseModel):
     total_fines_paid: float = 0.0
     registration_date: Optional[float] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "number_plate": "GJ18AB1234",
                 "owner_name": "John Doe",
@@ -36,6 +38,7 @@ class VehicleOwner(BaseModel):
                 "total_challans": 2
             }
         }
+    )
 
 
 class Challan(BaseModel):
@@ -44,7 +47,7 @@ class Challan(BaseModel):
     
     Represents a traffic fine issued for a violation.
     """
-    challan_id: str = Field(default_factory=lambda: f"CH-{uuid4().hex[:10].upper()}")
+    challan_id: str = Field(default_factory=sequential_id_factory("CH-", upper=True))
     violation_id: str
     
     # Vehicle & Owner
@@ -71,8 +74,8 @@ class Challan(BaseModel):
     paid_at: Optional[float] = None
     transaction_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "challan_id": "CH-ABC1234567",
                 "violation_id": "vio-xyz789",
@@ -84,6 +87,7 @@ class Challan(BaseModel):
                 "status": "ISSUED"
             }
         }
+    )
 
 
 class ChallanTransaction(BaseModel):
@@ -92,7 +96,7 @@ class ChallanTransaction(BaseModel):
     
     Records payment attempts and wallet deductions.
     """
-    transaction_id: str = Field(default_factory=lambda: f"TXN-{uuid4().hex[:10].upper()}")
+    transaction_id: str = Field(default_factory=sequential_id_factory("TXN-", upper=True))
     challan_id: str
     number_plate: str
     
@@ -104,8 +108,8 @@ class ChallanTransaction(BaseModel):
     status: Literal['SUCCESS', 'FAILED', 'PENDING'] = 'SUCCESS'
     failure_reason: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "transaction_id": "TXN-ABC1234567",
                 "challan_id": "CH-XYZ789",
@@ -116,6 +120,7 @@ class ChallanTransaction(BaseModel):
                 "status": "SUCCESS"
             }
         }
+    )
 
 
 class ChallanStats(BaseModel):
@@ -128,8 +133,8 @@ class ChallanStats(BaseModel):
     pending_amount: float
     by_violation_type: dict[str, int]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_challans": 150,
                 "paid_count": 120,
@@ -139,6 +144,7 @@ class ChallanStats(BaseModel):
                 "pending_amount": 35000.0
             }
         }
+    )
 
 
 class PayChallanRequest(BaseModel):
@@ -186,3 +192,8 @@ MOCK_OWNERS = [
     )
 ]
 
+# Owner lookup by number plate (plates interned: they recur on every
+# violation and challan for the same vehicle)
+MOCK_OWNERS_BY_PLATE: dict[str, VehicleOwner] = {
+    sys.intern(owner.number_plate): owner for owner in MOCK_OWNERS
+}
@@ -5,10 +5,31 @@ Models for GPS coordinates, canvas coordinates, and coordinate conversion.
 Used for mapping between real-world GPS positions and canvas pixels.
 """
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
+def _round_like_builtin(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Round an array to `ndigits` decimals, matching built-in round()
+    
+    np.round scales by 10**ndigits before rounding, so values near a
+    half-way point can land on the other side of it from round(), which
+    rounds the exact binary value. Those few values are re-rounded with
+    round() so batch and scalar conversions agree exactly.
+    """
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        flat = rounded.reshape(-1)
+        for i in np.flatnonzero(near_tie).tolist():
+            flat[i] = round(float(values.flat[i]), ndigits)
+    return rounded
+
+
 class MapBounds(BaseModel):
     """
     Geographic bounding box
@@ -20,8 +41,8 @@ class MapBounds(BaseModel):
     east: float                           # Maximum longitude
     west: float                           # Minimum longitude
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "north": 23.2500,
                 "south": 23.2000,
@@ -29,6 +50,7 @@ class MapBounds(BaseModel):
                 "west": 72.6000
             }
         }
+    )
     
     @property
     def lat_range(self) -> float:
@@ -61,10 +83,11 @@ class GPSCoordinate(BaseModel):
     lat: float                            # Latitude (-90 to 90)
     lon: float                            # Longitude (-180 to 180)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"lat": 23.2156, "lon": 72.6369}
         }
+    )
 
 
 class CanvasCoordinate(BaseModel):
@@ -72,10 +95,11 @@ class CanvasCoordinate(BaseModel):
     x: float
     y: float
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {"x": 600, "y": 400}
         }
+    )
 
 
 class CoordinateConverter:
@@ -114,6 +138,25 @@ class CoordinateConverter:
         # Usable canvas area
         self.usable_width = canvas_width - 2 * padding
         self.usable_height = canvas_height - 2 * padding
+        
+        # Pixels per degree, so conversions multiply instead of divide
+        # (a zero-size extent maps every point onto the padding edge)
+        self._x_per_lon = self.usable_width / self.lon_range if self.lon_range else 0.0
+        self._y_per_lat = self.usable_height / self.lat_range if self.lat_range else 0.0
+        
+        # Affine coefficients: x = ax*lon + bx, y = ay*lat + by
+        # (Y is inverted because canvas Y increases downward)
+        self._ax = self._x_per_lon
+        self._bx = padding - self._ax * map_bounds.west
+        self._ay = -self._y_per_lat
+        self._by = padding - self._ay * map_bounds.north
+        
+        # Inverse: lon = alon*x + blon, lat = alat*y + blat (a zero-size
+        # extent maps every pixel onto that edge)
+        self._alon = 1.0 / self._ax if self._ax else 0.0
+        self._blon = map_bounds.west - self._alon * padding
+        self._alat = 1.0 / self._ay if self._ay else 0.0
+        self._blat = map_bounds.north - self._alat * padding
     
     def gps_to_canvas(self, lat: float, lon: float) -> CanvasCoordinate:
         """
@@ -126,16 +169,10 @@ class CoordinateConverter:
         Returns:
             CanvasCoordinate with x, y in pixels
         """
-        # Normalize to 0-1 range
-        x_normalized = (lon - self.map_bounds.west) / self.lon_range
-        # Note: Y is inverted because canvas Y increases downward
-        y_normalized = (self.map_bounds.north - lat) / self.lat_range
-        
-        # Scale to canvas with padding
-        x = self.padding + x_normalized * self.usable_width
-        y = self.padding + y_normalized * self.usable_height
-        
-        return CanvasCoordinate(x=round(x, 2), y=round(y, 2))
+        return CanvasCoordinate(
+            x=round(self._ax * lon + self._bx, 2),
+            y=round(self._ay * lat + self._by, 2)
+        )
     
     def canvas_to_gps(self, x: float, y: float) -> GPSCoordinate:
         """
@@ -148,23 +185,44 @@ class CoordinateConverter:
         Returns:
             GPSCoordinate with lat, lon
         """
-        # Normalize from canvas space
-        x_normalized = (x - self.padding) / self.usable_width
-        y_normalized = (y - self.padding) / self.usable_height
+        return GPSCoordinate(
+            lat=round(self._alat * y + self._blat, 6),
+            lon=round(self._alon * x + self._blon, 6)
+        )
+    
+    def gps_to_canvas_batch(self, points) -> np.ndarray:
+        """
+        Convert multiple GPS points to canvas coordinates
         
-        # Convert to GPS
-        lon = self.map_bounds.west + x_normalized * self.lon_range
-        lat = self.map_bounds.north - y_normalized * self.lat_range
+        Args:
+            points: (lat, lon) pairs, as a sequence or an (N, 2) array
+            
+        Returns:
+            (N, 2) float64 array of (x, y) pixels, equal to gps_to_canvas
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
         
-        return GPSCoordinate(lat=round(lat, 6), lon=round(lon, 6))
-    
-    def gps_to_canvas_batch(self, points: list[tuple[float, float]]) -> list[CanvasCoordinate]:
-        """Convert multiple GPS points to canvas coordinates"""
-        return [self.gps_to_canvas(lat, lon) for lat, lon in points]
+        canvas = np.empty_like(pts)
+        canvas[:, 0] = self._ax * pts[:, 1] + self._bx
+        canvas[:, 1] = self._ay * pts[:, 0] + self._by
+        return _round_like_builtin(canvas, 2)
     
-    def canvas_to_gps_batch(self, points: list[tuple[float, float]]) -> list[GPSCoordinate]:
-        """Convert multiple canvas points to GPS coordinates"""
-        return [self.canvas_to_gps(x, y) for x, y in points]
+    def canvas_to_gps_batch(self, points) -> np.ndarray:
+        """
+        Convert multiple canvas points to GPS coordinates
+        
+        Args:
+            points: (x, y) pairs, as a sequence or an (N, 2) array
+            
+        Returns:
+            (N, 2) float64 array of (lat, lon), equal to canvas_to_gps
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        
+        gps = np.empty_like(pts)
+        gps[:, 0] = self._alat * pts[:, 1] + self._blat
+        gps[:, 1] = self._alon * pts[:, 0] + self._blon
+        return _round_like_builtin(gps, 6)
 
 
 # Pre-defined map areas for Gandhinagar
@@ -5,11 +5,12 @@ Models for vehicle detection at junctions.
 Used for tracking vehicle movements and post-incident reconstruction.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
-from uuid import uuid4
 import time
 
+from app.utils.ids import sequential_id_factory
+
 
 class DetectionRecord(BaseModel):
     """
@@ -18,7 +19,7 @@ class DetectionRecord(BaseModel):
     Records each time a vehicle passes through a junction.
     Used for route reconstruction and traffic analysis.
     """
-    id: str = Field(default_factory=lambda: f"det-{uuid4().hex[:8]}")
+    id: str = Field(default_factory=sequential_id_factory("det-"))
     
     # Vehicle info
     vehicle_id: str
@@ -42,8 +43,8 @@ class DetectionRecord(BaseModel):
     lon: Optional[float] = None
     junction_name: Optional[str] = None   # Human-readable junction name
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "det-abc12345",
                 "vehicle_id": "v-xyz789",
@@ -56,6 +57,7 @@ class DetectionRecord(BaseModel):
                 "speed": 35.5
             }
         }
+    )
 
 
 class DetectionQuery(BaseModel):
@@ -4,11 +4,12 @@ Emergency Vehicle Models
 Models for emergency vehicles and green corridor management.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
-from uuid import uuid4
 import time
 
+from app.utils.ids import sequential_id_factory
+
 from .vehicle import Position
 
 
@@ -18,7 +19,7 @@ class EmergencyVehicle(BaseModel):
     
     Extended vehicle model with emergency-specific properties.
     """
-    id: str = Field(default_factory=lambda: f"emv-{uuid4().hex[:8]}")
+    id: str = Field(default_factory=sequential_id_factory("emv-"))
     type: Literal['ambulance', 'fire_truck', 'police'] = 'ambulance'
     number_plate: str
     
@@ -41,8 +42,8 @@ class EmergencyVehicle(BaseModel):
     # ETA
     eta_seconds: Optional[float] = None   # Estimated time to destination
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "emv-abc12345",
                 "type": "ambulance",
@@ -55,6 +56,7 @@ class EmergencyVehicle(BaseModel):
                 "corridor_active": True
             }
         }
+    )
 
 
 class EmergencyCorridor(BaseModel):
@@ -63,7 +65,7 @@ class EmergencyCorridor(BaseModel):
     
     Represents the active corridor with affected signals.
     """
-    id: str = Field(default_factory=lambda: f"cor-{uuid4().hex[:8]}")
+    id: str = Field(default_factory=sequential_id_factory("cor-"))
     vehicle_id: str
     
     path: list[str]                       # Junction IDs in corridor
@@ -77,8 +79,8 @@ class EmergencyCorridor(BaseModel):
     
     status: Literal['ACTIVE', 'COMPLETED', 'CANCELLED'] = 'ACTIVE'
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "cor-xyz789",
                 "vehicle_id": "emv-abc123",
@@ -92,6 +94,7 @@ class EmergencyCorridor(BaseModel):
                 "status": "ACTIVE"
             }
         }
+    )
 
 
 class EmergencyRequest(BaseModel):
@@ -4,7 +4,7 @@ Incident Models
 Models for post-incident vehicle tracking and route reconstruction.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 from uuid import uuid4
 import time
@@ -41,8 +41,8 @@ class Incident(BaseModel):
     status: Literal['PROCESSING', 'COMPLETED', 'CANCELLED'] = 'PROCESSING'
     inference_result_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "inc-abc12345",
                 "number_plate": "GJ18AB1234",
@@ -53,6 +53,7 @@ class Incident(BaseModel):
                 "status": "PROCESSING"
             }
         }
+    )
 
 
 class RouteInference(BaseModel):
@@ -88,8 +89,8 @@ class RouteInference(BaseModel):
     # Status
     status: Literal['COMPLETE', 'PARTIAL', 'NO_DATA'] = 'PARTIAL'
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "inf-xyz789",
                 "incident_id": "inc-abc123",
@@ -100,6 +101,7 @@ class RouteInference(BaseModel):
                 "status": "COMPLETE"
             }
         }
+    )
 
 
 class IncidentReport(BaseModel):
@@ -5,11 +5,12 @@ Models for traffic junctions, signal states, and signal control.
 Supports both simulated grid junctions and real OSM junctions.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 from enum import Enum
 import time
 
+from ._compat import fast_dataclass
 from .vehicle import Position
 
 
@@ -20,19 +21,26 @@ class SignalColor(str, Enum):
     GREEN = "GREEN"
 
 
-class SignalState(BaseModel):
+# Member alias for identity checks on the tick path
+_GREEN = SignalColor.GREEN
+
+
+@fast_dataclass
+class SignalState:
     """
     State of a single traffic signal
     
     Tracks the current color, time remaining, and fairness metrics.
+    Mutated every tick, so a plain dataclass (validated where it is
+    embedded in a Junction).
     """
     current: SignalColor
     duration: float                       # seconds remaining in current state
     last_change: float                    # timestamp of last change
     time_since_green: float = 0.0         # seconds since last green (for fairness)
     
-    class Config:
-        json_schema_extra = {
+    __pydantic_config__ = ConfigDict(
+        json_schema_extra={
             "example": {
                 "current": "GREEN",
                 "duration": 30.0,
@@ -40,9 +48,16 @@ class SignalState(BaseModel):
                 "time_since_green": 0.0
             }
         }
+    )
+    
+    def __post_init__(self):
+        # Store the enum member itself (also for "GREEN"-style strings),
+        # so colors can be compared by identity
+        self.current = SignalColor(self.current)
 
 
-class JunctionSignals(BaseModel):
+@fast_dataclass
+class JunctionSignals:
     """
     All four signals at a junction
     
@@ -55,13 +70,13 @@ class JunctionSignals(BaseModel):
     
     def get_green_direction(self) -> Optional[str]:
         """Get the direction with green signal, if any"""
-        if self.north.current == SignalColor.GREEN:
+        if self.north.current is _GREEN:
             return "north"
-        if self.east.current == SignalColor.GREEN:
+        if self.east.current is _GREEN:
             return "east"
-        if self.south.current == SignalColor.GREEN:
+        if self.south.current is _GREEN:
             return "south"
-        if self.west.current == SignalColor.GREEN:
+        if self.west.current is _GREEN:
             return "west"
         return None
     
@@ -75,7 +90,8 @@ class JunctionSignals(BaseModel):
         }
 
 
-class ConnectedRoads(BaseModel):
+@fast_dataclass
+class ConnectedRoads:
     """Roads connected to a junction in each direction"""
     north: Optional[str] = None
     east: Optional[str] = None
@@ -96,7 +112,8 @@ class ConnectedRoads(BaseModel):
         return roads
 
 
-class JunctionMetrics(BaseModel):
+@fast_dataclass
+class JunctionMetrics:
     """Real-time metrics for a junction"""
     vehicle_count: int = 0                # vehicles currently at junction
     avg_wait_time: float = 0.0            # average waiting time in seconds
@@ -127,14 +144,15 @@ class Junction(BaseModel):
     lat: Optional[float] = None
     lon: Optional[float] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "J-1",
                 "position": {"x": 200, "y": 200},
                 "mode": "NORMAL"
             }
         }
+    )
 
 
 class SignalChangeRequest(BaseModel):
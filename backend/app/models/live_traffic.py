@@ -5,7 +5,7 @@ Models for handling real-time traffic data from external APIs
 like TomTom, Google Maps, and HERE.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 from datetime import datetime
 
@@ -16,14 +16,15 @@ class TrafficIncident(BaseModel):
     description: str
     severity: str                         # 'LOW', 'MEDIUM', 'HIGH', 'CRITICAL'
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "type": "ACCIDENT",
                 "description": "Minor collision blocking one lane",
                 "severity": "MEDIUM"
             }
         }
+    )
 
 
 class LiveTrafficData(BaseModel):
@@ -53,8 +54,8 @@ class LiveTrafficData(BaseModel):
     incidents: list[TrafficIncident] = Field(default_factory=list)
     road_closure: bool = False
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "road_id": "R-1-2",
                 "current_speed": 25.0,
@@ -66,6 +67,7 @@ class LiveTrafficData(BaseModel):
                 "provider": "tomtom"
             }
         }
+    )
     
     @property
     def speed_ratio(self) -> float:
@@ -113,8 +115,7 @@ class TomTomFlowData(BaseModel):
     confidence: float = 0.5
     road_closure: bool = Field(False, alias='roadClosure')
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
     
     def to_live_traffic_data(self, road_id: str) -> LiveTrafficData:
         """Convert to our internal LiveTrafficData format"""
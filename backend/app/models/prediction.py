@@ -4,7 +4,7 @@ Congestion Prediction Models
 Models for traffic congestion prediction and alerts.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 import time
 
@@ -38,8 +38,8 @@ class CongestionPrediction(BaseModel):
     prediction_horizon: int = 5           # minutes (3, 5, or 10)
     algorithm: str = "exponential_smoothing"
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "location_id": "R-1-2",
                 "location_type": "ROAD",
@@ -53,6 +53,7 @@ class CongestionPrediction(BaseModel):
                 "prediction_horizon": 10
             }
         }
+    )
 
 
 class PredictionAlert(BaseModel):
@@ -79,8 +80,8 @@ class PredictionAlert(BaseModel):
     timestamp: float = Field(default_factory=time.time)
     acknowledged: bool = False
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "alert-1704067200",
                 "location_id": "J-5",
@@ -93,6 +94,7 @@ class PredictionAlert(BaseModel):
                 "time_to_event": 5.0
             }
         }
+    )
 
 
 class DensityTrend(BaseModel):
@@ -5,7 +5,8 @@ Models for real-world geographic data from OpenStreetMap.
 Extends the base junction and road models with GPS coordinates.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from functools import cached_property
 from typing import Optional
 import time
 
@@ -44,8 +45,8 @@ class RealJunction(BaseModel):
     
     last_signal_change: float = Field(default_factory=time.time)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "J-OSM-123456",
                 "osm_id": 123456789,
@@ -57,6 +58,7 @@ class RealJunction(BaseModel):
                 "connected_roads": ["R-1", "R-2", "R-3", "R-4"]
             }
         }
+    )
 
 
 class RealRoad(BaseModel):
@@ -99,8 +101,8 @@ class RealRoad(BaseModel):
     
     last_update: float = Field(default_factory=time.time)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "R-OSM-987654",
                 "osm_id": "987654321",
@@ -117,6 +119,7 @@ class RealRoad(BaseModel):
                 "road_type": "primary"
             }
         }
+    )
 
 
 class OSMLoadResult(BaseModel):
@@ -138,8 +141,8 @@ class OSMLoadResult(BaseModel):
     load_time_ms: float
     cached: bool = False
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "area_id": "sector-5",
                 "area_name": "Sector 5, Gandhinagar",
@@ -149,6 +152,7 @@ class OSMLoadResult(BaseModel):
                 "cached": False
             }
         }
+    )
 
 
 class OSMNodeData(BaseModel):
@@ -160,16 +164,21 @@ class OSMNodeData(BaseModel):
 
 
 class OSMWayData(BaseModel):
-    """Raw OSM way data (for parsing)"""
+    """
+    Raw OSM way data (for parsing)
+    
+    Tag-derived values are parsed on first access and cached; tags are
+    not expected to change after parsing.
+    """
     id: int
     nodes: list[int]
     tags: dict = Field(default_factory=dict)
     
-    @property
+    @cached_property
     def name(self) -> str:
         return self.tags.get('name', f'Way {self.id}')
     
-    @property
+    @cached_property
     def max_speed(self) -> float:
         speed_str = self.tags.get('maxspeed', '50')
         try:
@@ -177,14 +186,14 @@ class OSMWayData(BaseModel):
         except ValueError:
             return 50.0
     
-    @property
+    @cached_property
     def lanes(self) -> int:
         try:
             return int(self.tags.get('lanes', '2'))
         except ValueError:
             return 2
     
-    @property
+    @cached_property
     def road_type(self) -> str:
         return self.tags.get('highway', 'unclassified')
 
@@ -5,33 +5,57 @@ Models for road segments connecting junctions.
 Includes traffic state, geometry, and density tracking.
 """
 
-from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+from dataclasses import field
+from typing import Annotated, Literal, NamedTuple, Optional
 import time
 
+from app.utils.tick_clock import tick_time
+
+from ._compat import fast_dataclass
 from .vehicle import Position
 
 
-class RoadGeometry(BaseModel):
-    """Physical geometry of a road segment"""
+# Vehicle ID set, serialized as a sorted list (stable JSON output)
+VehicleIdSet = Annotated[set[str], PlainSerializer(sorted, return_type=list[str])]
+
+
+class DirectionVector(NamedTuple):
+    """Unit direction of a road segment, (0, 0) for a zero-length road"""
+    x: float
+    y: float
+
+
+@fast_dataclass
+class RoadGeometry:
+    """
+    Physical geometry of a road segment
+    
+    Geometry does not change after load, so the unit direction vector is
+    computed once at construction.
+    """
     start_pos: Position
     end_pos: Position
     length: float                         # length in pixels (or meters for real roads)
     lanes: int = 2                        # number of lanes
+    _direction: DirectionVector = field(init=False, repr=False, compare=False)
     
-    def get_direction_vector(self) -> tuple[float, float]:
-        """Get normalized direction vector from start to end"""
-        dx = self.end_pos.x - self.start_pos.x
-        dy = self.end_pos.y - self.start_pos.y
+    def __post_init__(self):
+        (x1, y1), (x2, y2) = self.start_pos, self.end_pos
+        dx = x2 - x1
+        dy = y2 - y1
         mag = (dx**2 + dy**2) ** 0.5
-        if mag == 0:
-            return (0, 0)
-        return (dx / mag, dy / mag)
+        self._direction = DirectionVector(dx / mag, dy / mag) if mag else DirectionVector(0.0, 0.0)
+    
+    def get_direction_vector(self) -> DirectionVector:
+        """Get normalized direction vector from start to end"""
+        return self._direction
 
 
-class RoadTraffic(BaseModel):
-    """Traffic state of a road segment"""
-    current_vehicles: list[str] = Field(default_factory=list)  # Vehicle IDs
+@fast_dataclass
+class RoadTraffic:
+    """Traffic state of a road segment (mutated on every vehicle move)"""
+    current_vehicles: VehicleIdSet = field(default_factory=set)  # Vehicle IDs
     capacity: int = 20                    # Max vehicles before congestion
     density: Literal['LOW', 'MEDIUM', 'HIGH'] = 'LOW'
     density_score: float = 0.0            # 0-100 score
@@ -76,8 +100,8 @@ class RoadSegment(BaseModel):
     end_lat: Optional[float] = None
     end_lon: Optional[float] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "R-1-2",
                 "start_junction": "J-1",
@@ -90,17 +114,22 @@ class RoadSegment(BaseModel):
                 }
             }
         }
+    )
     
     def add_vehicle(self, vehicle_id: str):
         """Add a vehicle to this road"""
-        if vehicle_id not in self.traffic.current_vehicles:
-            self.traffic.current_vehicles.append(vehicle_id)
+        vehicles = self.traffic.current_vehicles
+        count = len(vehicles)
+        vehicles.add(vehicle_id)
+        if len(vehicles) != count:
             self._update_density()
     
     def remove_vehicle(self, vehicle_id: str):
         """Remove a vehicle from this road"""
-        if vehicle_id in self.traffic.current_vehicles:
-            self.traffic.current_vehicles.remove(vehicle_id)
+        vehicles = self.traffic.current_vehicles
+        count = len(vehicles)
+        vehicles.discard(vehicle_id)
+        if len(vehicles) != count:
             self._update_density()
     
     def _update_density(self):
@@ -115,7 +144,7 @@ class RoadSegment(BaseModel):
         else:
             self.traffic.density = 'HIGH'
         
-        self.last_update = time.time()
+        self.last_update = tick_time()
 
 
 class RealRoad(BaseModel):
@@ -4,7 +4,7 @@ System State Models
 Models for overall system state, agent status, and performance metrics.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 import time
 
@@ -80,8 +80,8 @@ class SystemState(BaseModel):
     # Timestamp
     last_update: float = Field(default_factory=time.time)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "mode": "NORMAL",
                 "simulation": {
@@ -105,6 +105,7 @@ class SystemState(BaseModel):
                 "active_emergency": False
             }
         }
+    )
 
 
 class AgentLog(BaseModel):
@@ -5,7 +5,7 @@ Models for traffic data source management, manual overrides,
 and map area configuration.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional
 from enum import Enum
 import time
@@ -35,8 +35,8 @@ class TrafficDataSource(BaseModel):
     global_multiplier: float = 1.0        # Traffic volume multiplier
     cache_hit_rate: Optional[float] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "mode": "HYBRID",
                 "api_provider": "tomtom",
@@ -47,6 +47,7 @@ class TrafficDataSource(BaseModel):
                 "cache_hit_rate": 0.85
             }
         }
+    )
 
 
 class ManualTrafficOverride(BaseModel):
@@ -64,8 +65,8 @@ class ManualTrafficOverride(BaseModel):
     created_at: float = Field(default_factory=time.time)
     created_by: str = "system"            # User or system that created override
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "road_id": "R-1-2",
                 "congestion_level": "HIGH",
@@ -73,6 +74,7 @@ class ManualTrafficOverride(BaseModel):
                 "reason": "Demo: Simulating rush hour"
             }
         }
+    )
     
     @property
     def is_expired(self) -> bool:
@@ -110,8 +112,8 @@ class MapArea(BaseModel):
     
     metadata: Optional[MapAreaMetadata] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "sector-5",
                 "name": "Sector 5, Gandhinagar",
@@ -127,6 +129,7 @@ class MapArea(BaseModel):
                 "cached": True
             }
         }
+    )
 
 
 # Pre-defined map areas
@@ -5,21 +5,72 @@ Core vehicle model for the traffic simulation system.
 Includes both simulated and live API vehicle representations.
 """
 
-from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler, GetJsonSchemaHandler, field_validator
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+from typing import Any, Literal, NamedTuple, Optional
 from uuid import uuid4
 import time
 
+from app.utils.tick_clock import tick_time
 
-class Position(BaseModel):
-    """2D position in canvas coordinates"""
+from ._compat import fast_dataclass
+
+
+# {"x": float, "y": float}: wire format of both position types
+_XY_SCHEMA = core_schema.typed_dict_schema({
+    "x": core_schema.typed_dict_field(core_schema.float_schema()),
+    "y": core_schema.typed_dict_field(core_schema.float_schema()),
+})
+
+
+def _xy_dict(value: Any) -> Any:
+    """Coerce an (x, y) pair or object with x / y to an {"x", "y"} dict"""
+    if isinstance(value, (tuple, list)) and len(value) == 2:
+        return {"x": value[0], "y": value[1]}
+    if hasattr(value, "x") and hasattr(value, "y"):
+        return {"x": value.x, "y": value.y}
+    return value
+
+
+def _dump_xy(position: Any) -> dict:
+    return {"x": position.x, "y": position.y}
+
+
+class Position(NamedTuple):
+    """
+    2D position in canvas coordinates (immutable)
+    
+    Used for fixed points: junctions, road endpoints, spawn requests.
+    Validates from {"x": .., "y": ..}, an (x, y) pair or any object with
+    x / y, and serializes as {"x": .., "y": ..} like the former model.
+    """
     x: float
     y: float
     
-    class Config:
-        json_schema_extra = {
-            "example": {"x": 100.0, "y": 200.0}
-        }
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_before_validator_function(
+            _xy_dict,
+            core_schema.no_info_after_validator_function(lambda xy: cls(xy["x"], xy["y"]), _XY_SCHEMA),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _dump_xy, return_schema=_XY_SCHEMA
+            ),
+            ref="Position"
+        )
+    
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        json_schema = handler.resolve_ref_schema(handler(schema))
+        json_schema.update(title="Position", example={"x": 100.0, "y": 200.0})
+        return json_schema
+
+
+@fast_dataclass
+class MovingPosition:
+    """2D position in canvas coordinates of a moving vehicle (mutable)"""
+    x: float
+    y: float
 
 
 class Vehicle(BaseModel):
@@ -35,7 +86,7 @@ class Vehicle(BaseModel):
     type: Literal['car', 'bike', 'ambulance']
     
     # Position & Movement
-    position: Position
+    position: MovingPosition
     speed: float = 0.0                    # km/h
     acceleration: float = 0.0             # m/s^2
     heading: float = 0.0                  # degrees 0-360
@@ -63,8 +114,8 @@ class Vehicle(BaseModel):
     # Source tracking
     source: Optional[Literal['SIMULATION', 'LIVE_TRAFFIC_API']] = 'SIMULATION'
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "v-abc12345",
                 "number_plate": "GJ18AB1234",
@@ -77,12 +128,21 @@ class Vehicle(BaseModel):
                 "is_emergency": False
             }
         }
+    )
+    
+    @field_validator("position", mode="before")
+    @classmethod
+    def _copy_fixed_position(cls, value: Any) -> Any:
+        # A fixed Position (e.g. the spawn junction's) is copied, never shared
+        if isinstance(value, Position):
+            return MovingPosition(float(value.x), float(value.y))
+        return value
     
     def update_position(self, new_x: float, new_y: float):
         """Update vehicle position and timestamp"""
         self.position.x = new_x
         self.position.y = new_y
-        self.last_update = time.time()
+        self.last_update = tick_time()
     
     def increment_waiting_time(self, delta: float):
         """Increment waiting time when stopped at signal"""
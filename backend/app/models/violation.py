@@ -4,7 +4,7 @@ Traffic Violation Models
 Models for detecting and recording traffic violations.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional, Any
 from uuid import uuid4
 import time
@@ -17,14 +17,15 @@ class ViolationEvidence(BaseModel):
     signal_state: Optional[str] = None    # Signal state at time of violation
     snapshot: Optional[dict] = None       # Additional evidence data
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "speed": 72.5,
                 "speed_limit": 50.0,
                 "signal_state": "RED"
             }
         }
+    )
 
 
 class TrafficViolation(BaseModel):
@@ -63,8 +64,8 @@ class TrafficViolation(BaseModel):
     processed: bool = False
     challan_id: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "vio-abc12345",
                 "vehicle_id": "v-xyz789",
@@ -75,6 +76,7 @@ class TrafficViolation(BaseModel):
                 "processed": False
             }
         }
+    )
 
 
 class ViolationDetectionResult(BaseModel):
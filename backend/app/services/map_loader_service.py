@@ -20,7 +20,8 @@ import time
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from dataclasses import dataclass
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, TypeAdapter
 
 # OSMnx may not be installed in all environments
 try:
@@ -122,6 +123,12 @@ class RealRoad(BaseModel):
     last_update: float = Field(default_factory=time.time)
 
 
+# Whole-list validators for cached map data: one pydantic-core call per
+# list instead of one model construction per row
+_JUNCTION_LIST = TypeAdapter(List[RealJunction])
+_ROAD_LIST = TypeAdapter(List[RealRoad])
+
+
 class OSMLoadResult(BaseModel):
     """Result of loading map from OpenStreetMap"""
     map_area: MapArea
@@ -917,14 +924,20 @@ class MapLoaderService:
         # Create node to junction ID mapping
         self._node_to_junction: Dict[int, str] = {}
         
-        idx = 0
-        for node_id, node_data in self.graph.nodes(data=True):
+        nodes = list(self.graph.nodes(data=True))
+        now = time.time()
+        
+        # Project all nodes to canvas coordinates in one vectorized call
+        lat_lon = np.array(
+            [(node_data.get('y', 0), node_data.get('x', 0)) for _, node_data in nodes],
+            dtype=np.float64
+        )
+        canvas = self.converter.gps_to_canvas_batch(lat_lon).tolist()
+        
+        for idx, ((node_id, node_data), (x, y)) in enumerate(zip(nodes, canvas)):
             lat = node_data.get('y', 0)
             lon = node_data.get('x', 0)
             
-            # Convert to canvas coordinates
-            canvas = self.converter.gps_to_canvas(lat, lon)
-            
             junction_id = f"J-{idx}"
             self._node_to_junction[node_id] = junction_id
             
@@ -937,15 +950,14 @@ class MapLoaderService:
                 osm_id=int(node_id),
                 lat=lat,
                 lon=lon,
-                x=canvas.x,
-                y=canvas.y,
+                x=x,
+                y=y,
                 street_count=street_count,
                 signals=create_default_signals('north'),  # Default signals
-                last_signal_change=time.time()
+                last_signal_change=now
             )
             
             self.junctions.append(junction)
-            idx += 1
     
     def _extract_roads(self):
         """Extract road data from the loaded graph"""
@@ -954,6 +966,10 @@ class MapLoaderService:
         if not self.graph or not self.converter or not hasattr(self, '_node_to_junction'):
             return
         
+        # Road endpoints are junctions: reuse their projected coordinates
+        junction_lookup: Dict[str, RealJunction] = {j.id: j for j in self.junctions}
+        now = time.time()
+        
         idx = 0
         for u, v, edge_data in self.graph.edges(data=True):
             # Get junction IDs
@@ -963,18 +979,8 @@ class MapLoaderService:
             if not start_junction or not end_junction:
                 continue
             
-            # Get node coordinates
-            u_node = self.graph.nodes[u]
-            v_node = self.graph.nodes[v]
-            
-            start_lat = u_node.get('y', 0)
-            start_lon = u_node.get('x', 0)
-            end_lat = v_node.get('y', 0)
-            end_lon = v_node.get('x', 0)
-            
-            # Convert to canvas coordinates
-            start_canvas = self.converter.gps_to_canvas(start_lat, start_lon)
-            end_canvas = self.converter.gps_to_canvas(end_lat, end_lon)
+            start_j = junction_lookup[start_junction]
+            end_j = junction_lookup[end_junction]
             
             # Extract road metadata from OSM
             road_name = edge_data.get('name', 'Unnamed Road')
@@ -1018,31 +1024,29 @@ class MapLoaderService:
                 osm_id=str(edge_data.get('osmid', idx)),
                 start_junction_id=start_junction,
                 end_junction_id=end_junction,
-                start_lat=start_lat,
-                start_lon=start_lon,
-                end_lat=end_lat,
-                end_lon=end_lon,
-                start_x=start_canvas.x,
-                start_y=start_canvas.y,
-                end_x=end_canvas.x,
-                end_y=end_canvas.y,
+                start_lat=start_j.lat,
+                start_lon=start_j.lon,
+                end_lat=end_j.lat,
+                end_lon=end_j.lon,
+                start_x=start_j.x,
+                start_y=start_j.y,
+                end_x=end_j.x,
+                end_y=end_j.y,
                 name=road_name,
                 length=length,
                 max_speed=max_speed,
                 lanes=lanes,
                 road_type=road_type,
                 oneway=oneway,
-                last_update=time.time()
+                last_update=now
             )
             
             self.roads.append(road)
             
             # Add road to junction's connected_roads
-            for junction in self.junctions:
-                if junction.id == start_junction:
-                    junction.connected_roads.append(road_id)
-                elif junction.id == end_junction:
-                    junction.connected_roads.append(road_id)
+            start_j.connected_roads.append(road_id)
+            if end_j is not start_j:
+                end_j.connected_roads.append(road_id)
             
             idx += 1
     
@@ -1086,8 +1090,8 @@ class MapLoaderService:
                 return None
             
             # Reconstruct result
-            junctions = [RealJunction(**j) for j in cache_data.get('junctions', [])]
-            roads = [RealRoad(**r) for r in cache_data.get('roads', [])]
+            junctions = _JUNCTION_LIST.validate_python(cache_data.get('junctions', []))
+            roads = _ROAD_LIST.validate_python(cache_data.get('roads', []))
             bounds = MapBounds(**cache_data.get('bounds', {}))
             
             # Update internal state
@@ -1149,6 +1153,7 @@ class MapLoaderService:
         lon_step = (bounds.east - bounds.west) / (grid_size + 1)
         
         junction_grid = {}  # (row, col) -> junction_id
+        now = time.time()
         
         for row in range(grid_size):
             for col in range(grid_size):
@@ -1173,7 +1178,7 @@ class MapLoaderService:
                     name=f"Junction {idx + 1}",
                     street_count=4,
                     signals=create_default_signals(green_dir),
-                    last_signal_change=time.time()
+                    last_signal_change=now
                 )
                 
                 self.junctions.append(junction)
@@ -14,6 +14,7 @@ import math
 
 from app.models.vehicle import Vehicle, Position, VehicleSpawnRequest
 from app.services.map_loader_service import get_map_loader_service
+from app.utils.tick_clock import advance_tick, stop_ticks
 
 
 class SimulationState(Enum):
@@ -120,6 +121,7 @@ class SimulationManager:
 
         if self.simulation_thread:
             self.simulation_thread.join(timeout=1.0)
+        stop_ticks()
 
         print("[SimulationManager] Simulation stopped")
 
@@ -127,6 +129,7 @@ class SimulationManager:
         """Pause the simulation"""
         if self.state == SimulationState.RUNNING:
             self.state = SimulationState.PAUSED
+            stop_ticks()
             print("[SimulationManager] Simulation paused")
 
     def resume(self):
@@ -243,24 +246,32 @@ class SimulationManager:
 
     def _simulation_loop(self):
         """Main simulation loop"""
-        while not self.stop_event.is_set():
-            if self.state == SimulationState.RUNNING:
-                current_time = time.time()
-                delta_time = (current_time - self.last_update) * self.time_multiplier
-                self.current_time += delta_time
-                self.last_update = current_time
-
-                # Update all vehicles
-                self._update_vehicles(delta_time)
-
-                # Spawn new vehicles occasionally
-                if random.random() < 0.02:  # 2% chance per update
-                    try:
-                        self.spawn_vehicle()
-                    except Exception as e:
-                        pass  # Silently ignore spawn failures
-
-            time.sleep(0.1)  # 10 FPS update rate
+        try:
+            while not self.stop_event.is_set():
+                if self.state == SimulationState.RUNNING:
+                    # One timestamp per tick, shared by per-vehicle/per-road updates
+                    current_time = advance_tick()
+                    delta_time = (current_time - self.last_update) * self.time_multiplier
+                    self.current_time += delta_time
+                    self.last_update = current_time
+
+                    # Update all vehicles
+                    self._update_vehicles(delta_time)
+
+                    # Spawn new vehicles occasionally
+                    if random.random() < 0.02:  # 2% chance per update
+                        try:
+                            self.spawn_vehicle()
+                        except Exception as e:
+                            pass  # Silently ignore spawn failures
+                else:
+                    # Paused: a tick racing pause() must not stay current
+                    stop_ticks()
+
+                time.sleep(0.1)  # 10 FPS update rate
+        finally:
+            # Stamps fall back to the wall clock once no tick is running
+            stop_ticks()
 
     def _update_vehicles(self, delta_time: float):
         """Update all vehicles in the simulation"""
@@ -0,0 +1,51 @@
+"""
+Access Log Filtering
+
+Polled endpoints (dashboard state, health checks, stats scrapers) would
+otherwise write one uvicorn access-log line per request. This filter
+drops those lines and keeps every other request logged.
+
+Usage:
+    from app.utils.access_log import install_access_log_filter
+    
+    install_access_log_filter()   # on startup, in each worker
+"""
+
+import logging
+from typing import Iterable
+
+# Paths whose successful requests are not access-logged
+QUIET_PATHS = frozenset({"/health", "/api/state", "/ws/stats"})
+
+
+class QuietPathFilter(logging.Filter):
+    """Drop uvicorn access records for quiet paths (errors are kept)"""
+    
+    def __init__(self, paths: Iterable[str] = QUIET_PATHS):
+        super().__init__()
+        self.paths = frozenset(paths)
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        # uvicorn.access args: (client_addr, method, full_path, http_version, status_code)
+        args = record.args
+        if not isinstance(args, tuple) or len(args) < 5:
+            return True
+        
+        path = str(args[2]).split("?", 1)[0]
+        return path not in self.paths or args[4] >= 400
+
+
+def install_access_log_filter(paths: Iterable[str] = QUIET_PATHS) -> QuietPathFilter:
+    """Attach a QuietPathFilter to the uvicorn access logger (idempotent)"""
+    access_logger = logging.getLogger("uvicorn.access")
+    
+    for existing in access_logger.filters:
+        if isinstance(existing, QuietPathFilter):
+            return existing
+    
+    quiet = QuietPathFilter(paths)
+    access_logger.addFilter(quiet)
+    return quiet
+
+
+__all__ = ["QUIET_PATHS", "QuietPathFilter", "install_access_log_filter"]
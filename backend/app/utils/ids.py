@@ -0,0 +1,45 @@
+"""
+Cheap Unique IDs
+
+Model IDs only need to be unique, not unpredictable, so instead of
+drawing from os.urandom for every instance (uuid4) each ID is a
+per-process random tag followed by a monotonically increasing counter.
+The tag is drawn once at import, which keeps IDs from different worker
+processes apart.
+
+Usage:
+    from app.utils.ids import sequential_id_factory
+    
+    id: str = Field(default_factory=sequential_id_factory("det-"))
+"""
+
+import itertools
+import secrets
+from typing import Callable
+
+# Drawn once per process
+WORKER_TAG = secrets.token_hex(3)
+
+
+def sequential_id_factory(prefix: str, upper: bool = False) -> Callable[[], str]:
+    """
+    Build an ID generator: prefix + worker tag + 8-hex-digit counter
+    
+    Args:
+        prefix: ID prefix, e.g. "det-"
+        upper: Upper-case the hex part (challan-style IDs)
+    
+    Returns:
+        Zero-argument callable usable as a Field default_factory
+    """
+    counter = itertools.count()
+    tag = WORKER_TAG.upper() if upper else WORKER_TAG
+    hex_format = "08X" if upper else "08x"
+    
+    def next_id() -> str:
+        return f"{prefix}{tag}{next(counter):{hex_format}}"
+    
+    return next_id
+
+
+__all__ = ["WORKER_TAG", "sequential_id_factory"]
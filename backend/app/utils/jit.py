@@ -0,0 +1,27 @@
+"""
+Optional Numba JIT support
+
+Numba is an optional accelerator. When it is installed, `njit` compiles
+numeric kernels to machine code; otherwise it is a no-op decorator and
+the kernels run as plain Python over the same NumPy arrays.
+"""
+
+# Numba may not be installed in all environments
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
+
+
+__all__ = ["njit", "NUMBA_AVAILABLE"]
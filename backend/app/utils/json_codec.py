@@ -0,0 +1,47 @@
+"""
+orjson-backed JSON Codec for Socket.IO
+
+python-socketio / python-engineio accept a `json` module replacement
+(anything with `dumps` and `loads`). Socket.IO already encodes a
+broadcast packet once and reuses it for every recipient; this codec makes
+that single encode run through orjson instead of the stdlib.
+
+Usage:
+    from app.utils.json_codec import socketio_json
+    
+    sio = socketio.AsyncServer(..., json=socketio_json)   # None without orjson
+"""
+
+from typing import Any
+
+# orjson is optional: faster Socket.IO packet encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class OrjsonCodec:
+    """json-module stand-in backed by orjson"""
+    
+    # Non-str keys and NumPy values are accepted, like json.dumps does
+    # for int keys
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if ORJSON_AVAILABLE else 0
+    
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        # json.dumps keyword arguments (separators, ...) are ignored:
+        # orjson output is always compact
+        return orjson.dumps(obj, option=OrjsonCodec.OPTIONS).decode()
+    
+    @staticmethod
+    def loads(s: Any) -> Any:
+        return orjson.loads(s)
+
+
+# Codec to pass as AsyncServer(json=...); None keeps the stdlib default
+socketio_json = OrjsonCodec if ORJSON_AVAILABLE else None
+
+
+__all__ = ["ORJSON_AVAILABLE", "OrjsonCodec", "socketio_json"]
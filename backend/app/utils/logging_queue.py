@@ -0,0 +1,72 @@
+"""
+Queued Logging
+
+Routes records from the `app` logger hierarchy through a QueueHandler so
+that formatting and stdout writes happen on a background listener thread
+instead of on the asyncio event loop.
+
+Usage:
+    from app.utils.logging_queue import start_queue_logging, stop_queue_logging
+    
+    start_queue_logging()   # on startup
+    stop_queue_logging()    # on shutdown (flushes pending records)
+"""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+_listener: Optional[QueueListener] = None
+
+
+def start_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Attach a QueueHandler to the `app` logger and start its listener
+    
+    Args:
+        level: Minimum level for `app.*` loggers
+    
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    
+    if _listener is not None:
+        return _listener
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
+    
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_queue_logging():
+    """Stop the listener, flushing any queued records"""
+    global _listener
+    
+    if _listener is None:
+        return
+    
+    _listener.stop()
+    _listener = None
+    
+    app_logger = logging.getLogger("app")
+    for handler in list(app_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            app_logger.removeHandler(handler)
+    app_logger.propagate = True
+
+
+__all__ = ["start_queue_logging", "stop_queue_logging"]
@@ -0,0 +1,35 @@
+"""
+Fast JSON Responses
+
+`FastJSONResponse` renders with orjson when it is installed and falls
+back to Starlette's stdlib-json rendering otherwise. Used as the app's
+default response class.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+# orjson is optional: faster response serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available"""
+    
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            # Non-str keys and NumPy values are accepted, like json.dumps
+            # does for int keys
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        return super().render(content)
+
+
+__all__ = ["FastJSONResponse", "ORJSON_AVAILABLE"]
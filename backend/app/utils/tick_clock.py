@@ -0,0 +1,56 @@
+"""
+Simulation Tick Clock
+
+One wall-clock timestamp per simulation step. Per-vehicle and per-road
+mutations (density recalculation, position updates) stamp themselves
+with the current tick's time instead of calling time.time() each; their
+timestamps are only read at serialization / staleness checks, where tick
+resolution (100 ms) is enough.
+
+The tick time is only used while a driver is ticking. Once the driver
+calls stop_ticks() (simulation paused or stopped), and before the first
+tick, tick_time() falls back to time.time() so stamps are never stale.
+
+Usage:
+    from app.utils import tick_clock
+    
+    now = tick_clock.advance_tick()      # tick driver, once per step
+    record.timestamp = tick_clock.tick_time()
+    tick_clock.stop_ticks()              # tick driver paused/stopped
+"""
+
+import time
+
+# Wall-clock time of the current simulation tick, valid while TICKING
+CURRENT_TICK_TS: float = time.time()
+TICKING: bool = False
+
+
+def advance_tick(now: float = None) -> float:
+    """
+    Start a new tick
+    
+    Args:
+        now: Tick timestamp (defaults to time.time())
+    
+    Returns:
+        The new tick timestamp
+    """
+    global CURRENT_TICK_TS, TICKING
+    CURRENT_TICK_TS = time.time() if now is None else now
+    TICKING = True
+    return CURRENT_TICK_TS
+
+
+def stop_ticks():
+    """Mark the tick driver idle; tick_time() reads the wall clock until the next tick"""
+    global TICKING
+    TICKING = False
+
+
+def tick_time() -> float:
+    """Timestamp of the current tick, or time.time() when no driver is ticking"""
+    return CURRENT_TICK_TS if TICKING else time.time()
+
+
+__all__ = ["advance_tick", "stop_ticks", "tick_time"]
@@ -8,6 +8,7 @@ Components:
 - events: Event type definitions and data models
 - emitter: Server→Client event emission
 - handlers: Client→Server event handling
+- telemetry: Raw WebSocket channel for high-rate batch telemetry
 
 Usage:
     from app.websocket import WebSocketEmitter, WebSocketHandlers
@@ -20,6 +21,7 @@ Usage:
 from .events import ServerEvent, ClientEvent
 from .emitter import WebSocketEmitter, get_emitter, set_emitter
 from .handlers import WebSocketHandlers, get_handlers, set_handlers
+from .telemetry import TelemetryHub, get_telemetry_hub, telemetry_endpoint
 
 __all__ = [
     "ServerEvent",
@@ -30,4 +32,7 @@ __all__ = [
     "set_emitter",
     "get_handlers",
     "set_handlers",
+    "TelemetryHub",
+    "get_telemetry_hub",
+    "telemetry_endpoint",
 ]
@@ -48,6 +48,62 @@ from .events import (
     DataModeChangedData,
     SystemStateUpdateData,
 )
+from .telemetry import TelemetryHub, get_telemetry_hub
+from app.models.coordinates import (
+    GANDHINAGAR_BOUNDS,
+    GIFT_CITY_BOUNDS,
+    SECTOR_5_BOUNDS,
+)
+
+
+# Wire precision for vehicle updates: canvas positions to 0.01 px, GPS
+# to 6 decimals (~0.1 m), speed and heading to 0.1
+POSITION_DECIMALS = 2
+GPS_DECIMALS = 6
+MOTION_DECIMALS = 1
+
+
+def _round_or_none(value: Optional[float], ndigits: int) -> Optional[float]:
+    """Round a numeric field to wire precision; None passes through"""
+    return None if value is None else round(value, ndigits)
+
+
+def _quantize_position(position: Dict[str, Any]) -> Dict[str, float]:
+    """Round a canvas {x, y} position to wire precision"""
+    return {axis: round(value, POSITION_DECIMALS) for axis, value in position.items()}
+
+
+# Viewport subscriptions: canvas tile edge (pixels) and named GPS areas
+TILE_SIZE = 250.0
+MAX_VIEWPORT_TILES = 64
+AREA_BOUNDS = {
+    "gandhinagar": GANDHINAGAR_BOUNDS,
+    "gift_city": GIFT_CITY_BOUNDS,
+    "sector5": SECTOR_5_BOUNDS,
+}
+
+
+def _tile_of(x: float, y: float) -> str:
+    """Room of the canvas tile containing (x, y)"""
+    return f"tile:{int(x // TILE_SIZE)}:{int(y // TILE_SIZE)}"
+
+
+def _tile_rooms_for_bbox(bbox: List[float]) -> List[str]:
+    """Rooms of every canvas tile overlapping [min_x, min_y, max_x, max_y]"""
+    min_x, min_y, max_x, max_y = (float(v) for v in bbox)
+    if max_x < min_x or max_y < min_y:
+        raise ValueError(f"Invalid bbox: {bbox}")
+    
+    tiles_x = int(max_x // TILE_SIZE) - int(min_x // TILE_SIZE) + 1
+    tiles_y = int(max_y // TILE_SIZE) - int(min_y // TILE_SIZE) + 1
+    if tiles_x * tiles_y > MAX_VIEWPORT_TILES:
+        raise ValueError(f"Viewport spans more than {MAX_VIEWPORT_TILES} tiles")
+    
+    return [
+        f"tile:{tx}:{ty}"
+        for tx in range(int(min_x // TILE_SIZE), int(max_x // TILE_SIZE) + 1)
+        for ty in range(int(min_y // TILE_SIZE), int(max_y // TILE_SIZE) + 1)
+    ]
 
 
 class WebSocketEmitter:
@@ -61,20 +117,27 @@ class WebSocketEmitter:
     - Error handling and logging
     """
     
-    def __init__(self, sio):
+    def __init__(self, sio, telemetry: Optional[TelemetryHub] = None):
         """
         Initialize the WebSocket emitter
         
         Args:
             sio: Socket.IO AsyncServer instance
+            telemetry: Raw WebSocket hub that also receives batch
+                telemetry (default: the global /ws/telemetry hub)
         """
         self.sio = sio
+        self.telemetry = telemetry if telemetry is not None else get_telemetry_hub()
         
         # Throttling state
         self._last_vehicle_batch = 0
         self._vehicle_update_interval = 0.1  # 10 Hz
         self._pending_vehicle_updates: Dict[str, Dict[str, Any]] = {}
         
+        # Vehicle flush task (see start_vehicle_ticker)
+        self._ticker_running = False
+        self._ticker_task: Optional[asyncio.Task] = None
+        
         self._last_density_update = 0
         self._density_update_interval = 1.0  # 1 Hz
         self._pending_density_updates: Dict[str, Dict[str, Any]] = {}
@@ -82,6 +145,10 @@ class WebSocketEmitter:
         # Subscription tracking
         self._subscriptions: Dict[str, Set[str]] = defaultdict(set)  # channel -> {sid, ...}
         
+        # Viewport subscriptions: sid -> rooms, and members per room
+        self._viewport_rooms: Dict[str, List[str]] = {}
+        self._room_members: Dict[str, int] = defaultdict(int)
+        
         # Statistics
         self._emit_count = 0
         self._error_count = 0
@@ -120,17 +187,17 @@ class WebSocketEmitter:
         """
         data = {
             "vehicleId": vehicle_data.get("id"),
-            "position": vehicle_data.get("position", {}),
-            "speed": vehicle_data.get("speed", 0),
-            "heading": vehicle_data.get("heading", 0),
+            "position": _quantize_position(vehicle_data.get("position", {})),
+            "speed": _round_or_none(vehicle_data.get("speed", 0), MOTION_DECIMALS),
+            "heading": _round_or_none(vehicle_data.get("heading", 0), MOTION_DECIMALS),
             "timestamp": vehicle_data.get("last_update", time.time()),
         }
         
         # Add GPS coordinates if available
         if "lat" in vehicle_data:
-            data["lat"] = vehicle_data["lat"]
+            data["lat"] = _round_or_none(vehicle_data["lat"], GPS_DECIMALS)
         if "lon" in vehicle_data:
-            data["lon"] = vehicle_data["lon"]
+            data["lon"] = _round_or_none(vehicle_data["lon"], GPS_DECIMALS)
         
         await self._emit(ServerEvent.VEHICLE_UPDATE.value, data, room)
     
@@ -143,33 +210,119 @@ class WebSocketEmitter:
         """
         now = time.time()
         
+        # Include in pending updates (newer data for a vehicle replaces older)
+        for v in vehicles:
+            self._pending_vehicle_updates[v.get("id")] = v
+        
         # Throttle to 10 Hz
         if now - self._last_vehicle_batch < self._vehicle_update_interval:
-            # Store pending updates
-            for v in vehicles:
-                self._pending_vehicle_updates[v.get("id")] = v
             return
         
-        # Include any pending updates
-        for v in vehicles:
-            self._pending_vehicle_updates[v.get("id")] = v
+        await self._flush_vehicle_updates(now)
+    
+    def queue_vehicle_update(self, vehicle_data: Dict[str, Any]):
+        """
+        Queue a vehicle update for the next ticker flush
+        
+        Updates for the same vehicle within one tick are conflated: only the
+        latest is sent, as part of a single vehicles:batch_update frame.
+        """
+        self._pending_vehicle_updates[vehicle_data.get("id")] = vehicle_data
+    
+    async def start_vehicle_ticker(self):
+        """Start flushing queued vehicle updates every tick (10 Hz)"""
+        if self._ticker_running:
+            return
+        
+        self._ticker_running = True
+        self._ticker_task = asyncio.create_task(self._vehicle_ticker_loop())
+    
+    async def stop_vehicle_ticker(self):
+        """Stop the vehicle flush task"""
+        self._ticker_running = False
+        
+        if self._ticker_task:
+            self._ticker_task.cancel()
+            try:
+                await self._ticker_task
+            except asyncio.CancelledError:
+                pass
+            self._ticker_task = None
+    
+    async def _vehicle_ticker_loop(self):
+        """Emit one batch frame per tick while updates are pending"""
+        while self._ticker_running:
+            try:
+                await asyncio.sleep(self._vehicle_update_interval)
+                if self._pending_vehicle_updates:
+                    await self._flush_vehicle_updates(time.time())
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Drop the failed tick's batch (retrying it would fail again)
+                self._error_count += 1
+                print(f"[WS ERROR] Vehicle ticker flush failed: {e}")
+    
+    async def _flush_vehicle_updates(self, now: float):
+        """Emit all pending vehicle updates as one vehicles:batch_update"""
+        pending = self._pending_vehicle_updates
+        self._pending_vehicle_updates = {}
+        self._last_vehicle_batch = now
         
-        # Emit all pending updates
         updates = [
             {
                 "vehicleId": v.get("id"),
-                "position": v.get("position", {}),
-                "speed": v.get("speed", 0),
-                "heading": v.get("heading", 0),
+                "position": _quantize_position(v.get("position", {})),
+                "speed": _round_or_none(v.get("speed", 0), MOTION_DECIMALS),
+                "heading": _round_or_none(v.get("heading", 0), MOTION_DECIMALS),
                 "timestamp": v.get("last_update", now),
             }
-            for v in self._pending_vehicle_updates.values()
+            for v in pending.values()
         ]
         
-        await self._emit("vehicles:batch_update", {"vehicles": updates, "count": len(updates)})
+        payload = {"vehicles": updates, "count": len(updates)}
         
-        self._pending_vehicle_updates.clear()
-        self._last_vehicle_batch = now
+        # Clients with a viewport get per-room frames instead. Each frame
+        # is encoded once; the sends for this tick run concurrently.
+        sends = [
+            self._emit("vehicles:batch_update", payload, skip_sid=list(self._viewport_rooms) or None),
+            self.telemetry.broadcast("vehicles:batch_update", payload),
+        ]
+        if self._room_members:
+            sends.extend(self._viewport_emits(list(pending.values()), updates))
+        
+        await asyncio.gather(*sends)
+    
+    def _viewport_emits(self, vehicles: List[Dict[str, Any]], updates: List[Dict[str, Any]]) -> list:
+        """Build one vehicles:batch_update emit per viewport room, with only its vehicles"""
+        members = self._room_members
+        areas = [
+            (room, AREA_BOUNDS[room[5:]])
+            for room in members if room.startswith("area:")
+        ]
+        by_room: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        
+        for vehicle, update in zip(vehicles, updates):
+            position = update["position"]
+            room = _tile_of(position.get("x", 0.0), position.get("y", 0.0))
+            if room in members:
+                by_room[room].append(update)
+            
+            lat = vehicle.get("lat")
+            lon = vehicle.get("lon")
+            if lat is not None and lon is not None:
+                for area_room, bounds in areas:
+                    if bounds.contains(lat, lon):
+                        by_room[area_room].append(update)
+        
+        return [
+            self._emit(
+                "vehicles:batch_update",
+                {"vehicles": room_updates, "count": len(room_updates)},
+                room=room
+            )
+            for room, room_updates in by_room.items()
+        ]
     
     async def emit_vehicle_spawned(self, vehicle_data: Dict[str, Any]):
         """Emit vehicle spawned event"""
@@ -280,11 +433,15 @@ class WebSocketEmitter:
                 "color": color_map.get(classification, "#22c55e")
             })
         
-        await self._emit("density:batch_update", {
+        payload = {
             "roads": updates,
             "count": len(updates),
             "timestamp": now
-        })
+        }
+        await asyncio.gather(
+            self._emit("density:batch_update", payload),
+            self.telemetry.broadcast("density:batch_update", payload)
+        )
         
         self._pending_density_updates.clear()
         self._last_density_update = now
@@ -306,7 +463,11 @@ class WebSocketEmitter:
             nextUpdate=time.time() + 5.0,
             modelVersion="1.0.0"
         )
-        await self._emit(ServerEvent.PREDICTION_UPDATE.value, data.model_dump())
+        payload = data.model_dump()
+        await asyncio.gather(
+            self._emit(ServerEvent.PREDICTION_UPDATE.value, payload),
+            self.telemetry.broadcast(ServerEvent.PREDICTION_UPDATE.value, payload)
+        )
     
     # ============================================
     # Agent Events
@@ -643,19 +804,75 @@ class WebSocketEmitter:
         if channel:
             self._subscriptions[channel].discard(sid)
         else:
-            # Remove from all channels
+            # Remove from all channels (Socket.IO drops its rooms itself)
             for ch in self._subscriptions:
                 self._subscriptions[ch].discard(sid)
+            self._forget_viewport(sid)
     
     def get_subscribers(self, channel: str) -> Set[str]:
         """Get subscribers for a channel"""
         return self._subscriptions.get(channel, set())
     
+    async def set_viewport(
+        self,
+        sid: str,
+        area: Optional[str] = None,
+        bbox: Optional[List[float]] = None
+    ) -> List[str]:
+        """
+        Limit a client's vehicle updates to a map area or canvas viewport
+        
+        Args:
+            sid: Session ID
+            area: Named GPS area (see AREA_BOUNDS)
+            bbox: Canvas viewport [min_x, min_y, max_x, max_y]
+        
+        At most one of area/bbox may be given; a client in both an area
+        room and tile rooms would receive overlapping vehicles twice. With
+        neither given, the client goes back to receiving every vehicle.
+        
+        Returns:
+            Rooms the client is now in
+        
+        Raises:
+            ValueError: Unknown area, malformed bbox, or both given
+        """
+        if area is not None and bbox is not None:
+            raise ValueError("Subscribe with either area or bbox, not both")
+        
+        rooms: List[str] = []
+        if area is not None:
+            if area not in AREA_BOUNDS:
+                raise ValueError(f"Unknown area: {area}")
+            rooms.append(f"area:{area}")
+        if bbox is not None:
+            rooms.extend(_tile_rooms_for_bbox(bbox))
+        
+        for room in self._forget_viewport(sid):
+            await self.sio.leave_room(sid, room)
+        
+        for room in rooms:
+            await self.sio.enter_room(sid, room)
+            self._room_members[room] += 1
+        if rooms:
+            self._viewport_rooms[sid] = rooms
+        
+        return rooms
+    
+    def _forget_viewport(self, sid: str) -> List[str]:
+        """Drop a client's viewport bookkeeping; returns the rooms it was in"""
+        rooms = self._viewport_rooms.pop(sid, [])
+        for room in rooms:
+            self._room_members[room] -= 1
+            if self._room_members[room] <= 0:
+                del self._room_members[room]
+        return rooms
+    
     # ============================================
     # Internal Methods
     # ============================================
     
-    async def _emit(self, event: str, data: Any, room: str = None):
+    async def _emit(self, event: str, data: Any, room: str = None, skip_sid: Optional[List[str]] = None):
         """
         Internal emit with error handling and statistics
         
@@ -663,10 +880,13 @@ class WebSocketEmitter:
             event: Event name
             data: Event data
             room: Optional room to emit to
+            skip_sid: Optional session IDs to leave out
         """
         try:
             if room:
                 await self.sio.emit(event, data, room=room)
+            elif skip_sid:
+                await self.sio.emit(event, data, skip_sid=skip_sid)
             else:
                 await self.sio.emit(event, data)
             
@@ -684,9 +904,12 @@ class WebSocketEmitter:
             "errorCount": self._error_count,
             "lastEmitTime": self._last_emit_time,
             "pendingVehicleUpdates": len(self._pending_vehicle_updates),
+            "vehicleTickerRunning": self._ticker_running,
             "pendingDensityUpdates": len(self._pending_density_updates),
             "subscriptionChannels": len(self._subscriptions),
-            "totalSubscribers": sum(len(s) for s in self._subscriptions.values())
+            "totalSubscribers": sum(len(s) for s in self._subscriptions.values()),
+            "viewportClients": len(self._viewport_rooms),
+            "telemetry": self.telemetry.get_stats()
         }
 
 
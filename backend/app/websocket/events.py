@@ -390,4 +390,6 @@ class TrafficOverrideSetRequest(BaseModel):
 class SubscribeRequest(BaseModel):
     """Request for subscribe:updates event"""
     channels: List[str]  # e.g., ["vehicles", "signals", "density"]
+    area: Optional[str] = None  # Named map area for vehicle updates, e.g. "sector5"
+    bbox: Optional[List[float]] = None  # Canvas viewport [minX, minY, maxX, maxY]
 
@@ -559,7 +559,10 @@ class WebSocketHandlers:
         
         Args:
             sid: Session ID
-            data: {channels: ['vehicles', 'signals', 'density', ...]}
+            data: {channels: ['vehicles', 'signals', 'density', ...],
+                   area: 'sector5', bbox: [minX, minY, maxX, maxY]}
+                  area/bbox (optional) limit vehicle updates to that map
+                  area or canvas viewport; null for both resets to all
         """
         channels = data.get("channels", [])
         
@@ -571,13 +574,26 @@ class WebSocketHandlers:
         if sid in self._clients:
             self._clients[sid]["subscriptions"] = channels
         
-        print(f"[WS] Client {sid} subscribed to: {channels}")
-        
-        await self.sio.emit("subscribe:response", {
+        response = {
             "status": "success",
             "channels": channels,
             "timestamp": time.time()
-        }, room=sid)
+        }
+        
+        if "area" in data or "bbox" in data:
+            try:
+                response["rooms"] = await self.emitter.set_viewport(
+                    sid,
+                    area=data.get("area"),
+                    bbox=data.get("bbox")
+                )
+            except (ValueError, TypeError) as e:
+                response["status"] = "error"
+                response["message"] = str(e)
+        
+        print(f"[WS] Client {sid} subscribed to: {channels}")
+        
+        await self.sio.emit("subscribe:response", response, room=sid)
     
     async def handle_unsubscribe(self, sid: str, data: Dict):
         """
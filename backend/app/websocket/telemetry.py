@@ -0,0 +1,183 @@
+"""
+Raw WebSocket Telemetry Channel
+
+High-rate telemetry (vehicle and density batch updates) is also served
+on a plain WebSocket at /ws/telemetry, without Socket.IO / engine.io
+packet framing. Each broadcast is encoded once and the same frame is
+sent to every connected client.
+
+Frame format (binary): {"event": <event name>, "data": <payload>},
+encoded as JSON by default or as MessagePack for clients connecting with
+?format=msgpack (requires the msgpack package).
+
+Clients connecting with ?compress=deflate get every frame prefixed with
+one flag byte: 0x00 = frame follows as-is, 0x01 = frame follows zlib
+deflated (browsers: DecompressionStream("deflate")). Only frames of at
+least COMPRESS_MIN_BYTES are deflated, so large, infrequent payloads
+(prediction:update) shrink while small 10 Hz frames skip the CPU cost.
+
+Socket.IO stays in use for signaling and low-rate events.
+
+Usage:
+    from app.websocket.telemetry import telemetry_endpoint
+    
+    app.add_api_websocket_route("/ws/telemetry", telemetry_endpoint)
+"""
+
+import asyncio
+import json
+import zlib
+from typing import Any, Dict, Tuple
+
+from starlette.websockets import WebSocket
+
+# orjson is optional: faster frame encoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# msgpack is optional: compact binary frames for clients that ask for them
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Frame encodings a client can request with ?format=
+FORMAT_JSON = "json"
+FORMAT_MSGPACK = "msgpack"
+
+# Frame compression a client can request with ?compress=
+COMPRESS_DEFLATE = "deflate"
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 6
+FLAG_PLAIN = b"\x00"
+FLAG_DEFLATE = b"\x01"
+
+
+def encode_frame(event: str, data: Any, fmt: str = FORMAT_JSON) -> bytes:
+    """Encode one telemetry frame as JSON or MessagePack"""
+    frame = {"event": event, "data": data}
+    if fmt == FORMAT_MSGPACK:
+        return msgpack.packb(frame)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(frame)
+    return json.dumps(frame, separators=(",", ":")).encode()
+
+
+def compress_frame(frame: bytes) -> bytes:
+    """Prefix a frame with its flag byte, deflating it if large enough"""
+    if len(frame) >= COMPRESS_MIN_BYTES:
+        return FLAG_DEFLATE + zlib.compress(frame, COMPRESS_LEVEL)
+    return FLAG_PLAIN + frame
+
+
+class TelemetryHub:
+    """
+    Connected raw WebSocket clients and fan-out
+    
+    Clients whose send fails are dropped.
+    """
+    
+    def __init__(self):
+        # client -> (requested frame format, compression on)
+        self._clients: Dict[WebSocket, Tuple[str, bool]] = {}
+        
+        # Statistics
+        self._frame_count = 0
+        self._error_count = 0
+    
+    def __len__(self) -> int:
+        return len(self._clients)
+    
+    def add(self, websocket: WebSocket, fmt: str = FORMAT_JSON, compress: bool = False):
+        """Register a connected client, its frame format and compression"""
+        self._clients[websocket] = (fmt, compress)
+    
+    def discard(self, websocket: WebSocket):
+        """Unregister a client"""
+        self._clients.pop(websocket, None)
+    
+    async def broadcast(self, event: str, data: Any):
+        """
+        Send an event to every client
+        
+        The frame is encoded (and compressed) once per variant in use;
+        nothing is encoded when no client is connected.
+        """
+        if not self._clients:
+            return
+        
+        frames: Dict[Any, bytes] = {}
+        sends = []
+        clients = []
+        for client, variant in self._clients.items():
+            frame = frames.get(variant)
+            if frame is None:
+                fmt, compress = variant
+                frame = frames.get(fmt)
+                if frame is None:
+                    frame = frames[fmt] = encode_frame(event, data, fmt)
+                if compress:
+                    frame = compress_frame(frame)
+                frames[variant] = frame
+            sends.append(client.send_bytes(frame))
+            clients.append(client)
+        
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        self._frame_count += 1
+        
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                self._error_count += 1
+                self._clients.pop(client, None)
+    
+    def get_stats(self):
+        """Get telemetry statistics"""
+        return {
+            "clients": len(self._clients),
+            "framesSent": self._frame_count,
+            "errorCount": self._error_count
+        }
+
+
+# Global hub instance
+telemetry_hub = TelemetryHub()
+
+
+def get_telemetry_hub() -> TelemetryHub:
+    """Get the global telemetry hub"""
+    return telemetry_hub
+
+
+async def telemetry_endpoint(websocket: WebSocket):
+    """
+    /ws/telemetry: push-only stream of telemetry frames
+    
+    Query parameter `format` selects the frame encoding: "json" (default)
+    or "msgpack"; `compress=deflate` turns on flagged frame compression.
+    Client messages are read (and ignored) only to notice disconnects.
+    """
+    fmt = websocket.query_params.get("format", FORMAT_JSON)
+    compress = websocket.query_params.get("compress")
+    supported = (
+        (fmt == FORMAT_JSON or (fmt == FORMAT_MSGPACK and MSGPACK_AVAILABLE))
+        and compress in (None, COMPRESS_DEFLATE)
+    )
+    if not supported:
+        # Unsupported encoding: refuse the handshake
+        await websocket.close(code=1003)
+        return
+    
+    await websocket.accept()
+    telemetry_hub.add(websocket, fmt, compress=compress == COMPRESS_DEFLATE)
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        telemetry_hub.discard(websocket)
@@ -38,6 +38,8 @@ class TestRootEndpoints:
         assert "version" in data
         assert "status" in data
         assert data["status"] == "operational"
+        assert response.headers["content-type"] == "application/json"
+        assert data["endpoints"]["incident"] == "/api/incident/*"
     
     def test_health_check(self):
         """Test GET /health"""
@@ -46,6 +48,101 @@ class TestRootEndpoints:
         data = response.json()
         assert data["status"] == "healthy"
         assert "timestamp" in data
+        # Seconds since startup, not a wall-clock timestamp
+        assert 0 <= data["uptime"] < 3600
+    
+    def test_ws_stats_uses_bound_handlers(self):
+        """Test /health and /ws/stats read the handlers bound at startup"""
+        from unittest.mock import Mock, patch
+        
+        handlers = Mock()
+        handlers.get_client_count.return_value = 3
+        handlers.get_connected_clients.return_value = {"sid-1": {}}
+        
+        with patch("app.main.ws_handlers", handlers), patch("app.main.ws_emitter", None):
+            stats = client.get("/ws/stats").json()
+            health = client.get("/health").json()
+        
+        assert stats["clients"] == {"count": 3, "connected": ["sid-1"]}
+        assert stats["emitter"] is None
+        assert health["websocket"]["connected_clients"] == 3
+    
+    def test_socketio_client_manager_from_env(self, monkeypatch):
+        """Test SOCKETIO_REDIS_URL selects the Redis client manager"""
+        from unittest.mock import patch
+        from app.main import _create_client_manager
+        
+        monkeypatch.delenv("SOCKETIO_REDIS_URL", raising=False)
+        assert _create_client_manager() is None
+        
+        monkeypatch.setenv("SOCKETIO_REDIS_URL", "redis://redis:6379/0")
+        with patch("socketio.AsyncRedisManager") as manager:
+            assert _create_client_manager() is manager.return_value
+        manager.assert_called_once_with("redis://redis:6379/0")
+        
+        # redis package missing: fall back to the in-process manager
+        with patch("socketio.AsyncRedisManager", side_effect=RuntimeError("no redis")):
+            assert _create_client_manager() is None
+    
+    def test_raise_fd_limit_capped_at_hard_limit(self):
+        """Test the open-file soft limit is raised but never past the hard limit"""
+        from unittest.mock import patch
+        
+        resource = pytest.importorskip("resource")
+        from app.main import _raise_fd_limit
+        
+        with patch.object(resource, "getrlimit", return_value=(1024, 4096)), \
+                patch.object(resource, "setrlimit") as setrlimit:
+            _raise_fd_limit(target=65535)
+        setrlimit.assert_called_once_with(resource.RLIMIT_NOFILE, (4096, 4096))
+        
+        # Already high enough: left alone
+        with patch.object(resource, "getrlimit", return_value=(65535, 65535)), \
+                patch.object(resource, "setrlimit") as setrlimit:
+            _raise_fd_limit(target=65535)
+        setrlimit.assert_not_called()
+    
+    def test_access_log_skips_quiet_paths(self):
+        """Test polled endpoints are not access-logged unless they fail"""
+        import logging
+        from app.utils.access_log import QuietPathFilter, install_access_log_filter
+        
+        def record(path, status):
+            return logging.LogRecord(
+                "uvicorn.access", logging.INFO, __file__, 0,
+                '%s - "%s %s HTTP/%s" %d', ("127.0.0.1:1", "GET", path, "1.1", status), None
+            )
+        
+        quiet = QuietPathFilter()
+        assert not quiet.filter(record("/api/state", 200))
+        assert not quiet.filter(record("/health?probe=1", 200))
+        assert quiet.filter(record("/api/state", 500))
+        assert quiet.filter(record("/api/vehicles", 200))
+        
+        assert install_access_log_filter() is install_access_log_filter()
+    
+    def test_socketio_json_codec(self):
+        """Test the Socket.IO codec encodes compactly and round-trips"""
+        import numpy as np
+        from socketio import packet
+        from app.utils.json_codec import OrjsonCodec
+        
+        pytest.importorskip("orjson")
+        assert OrjsonCodec.dumps({"a": [1, 2]}, separators=(",", ":")) == '{"a":[1,2]}'
+        assert OrjsonCodec.dumps({1: np.float64(0.5)}) == '{"1":0.5}'
+        assert OrjsonCodec.loads('{"a":1}') == {"a": 1}
+        
+        # Installed on the app's Socket.IO server
+        assert packet.Packet.json is OrjsonCodec
+    
+    def test_fast_json_response_render(self):
+        """Test the default response class accepts int keys and NumPy values"""
+        import json
+        import numpy as np
+        from app.utils.responses import FastJSONResponse
+        
+        response = FastJSONResponse({"counts": {1: 2}, "mean": np.float64(0.5)})
+        assert json.loads(response.body) == {"counts": {"1": 2}, "mean": 0.5}
 
 
 # ============================================
@@ -278,6 +278,13 @@ class TestVehicleOwnerDatabase:
         assert owner is not None
         assert owner.number_plate == "GJ18TEST456"
     
+    def test_get_owner_by_vehicle_id(self, vehicle_owner_db):
+        """Test vehicle ID lookup uses the index kept on registration"""
+        owner = vehicle_owner_db.register_vehicle("GJ18TEST789")
+        
+        assert vehicle_owner_db.get_owner_by_vehicle_id(owner.vehicle_id) is owner
+        assert vehicle_owner_db.get_owner_by_vehicle_id("missing") is None
+    
     def test_auto_register_on_lookup(self, vehicle_owner_db):
         """Test auto-registration on lookup"""
         # Lookup without registering
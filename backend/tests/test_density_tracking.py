@@ -233,6 +233,34 @@ class TestDensityTracker:
         assert data.vehicle_count == 1
         assert 'v-1' not in data.vehicle_ids
     
+    def test_update_scores_and_classifies_roads(self):
+        """Test a full update matches the calculator for every road"""
+        tracker = DensityTracker({'density': {'updateInterval': 0}})
+        roads = [{'id': f'R-{i}', 'traffic': {'capacity': 10}} for i in range(4)]
+        roads.append({'id': 'R-geo', 'traffic': {'capacity': 0}, 'geometry': {'length': 150, 'lanes': 2}})
+        tracker.initialize_roads(roads)
+        
+        # 0, 5, 12 and 20 vehicles on R-0..R-3, 3 on R-geo
+        vehicles = []
+        for road_idx, count in enumerate([0, 5, 12, 20]):
+            vehicles += [{'id': f'v-{road_idx}-{k}', 'current_road': f'R-{road_idx}'} for k in range(count)]
+        vehicles += [{'id': f'v-geo-{k}', 'current_road': 'R-geo'} for k in range(3)]
+        
+        tracker.update(vehicles, roads, [], 100.0)
+        
+        calculator = tracker.calculator
+        for road in roads:
+            data = tracker.get_road_density(road['id'])
+            assert data.density_score == calculator.calculate_density_score(data.vehicle_count, data.capacity)
+            assert data.classification == calculator.classify_density(data.vehicle_count)
+            assert data.timestamp == 100.0
+        
+        assert [tracker.get_road_density(f'R-{i}').classification for i in range(4)] == [
+            DensityLevel.LOW, DensityLevel.MEDIUM, DensityLevel.HIGH, DensityLevel.HIGH
+        ]
+        assert tracker.get_road_density('R-3').density_score == 100.0
+        assert tracker.get_road_density('R-geo').capacity == 10
+    
     def test_data_source_mode_change(self):
         """Test changing traffic data source mode"""
         assert self.tracker.data_source_mode == TrafficDataSource.SIMULATION
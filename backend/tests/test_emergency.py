@@ -153,6 +153,21 @@ class TestEmergencyTracker:
         assert session.calculated_route == route
         assert session.total_distance == 1000
         assert session.estimated_time == 60
+        assert session.is_on_route("J-5")
+        assert not session.is_on_route("J-4")
+    
+    def test_corridor_junction_membership(self):
+        """Test corridor junction set view tracks updates"""
+        tracker = EmergencyTracker()
+        
+        session_id = tracker.activate_emergency("J-0", "J-8")
+        session = tracker.get_session(session_id)
+        assert not session.is_corridor_junction("J-2")
+        
+        tracker.update_corridor_junctions(session_id, ["J-1", "J-2"])
+        
+        assert session.is_corridor_junction("J-2")
+        assert not session.is_corridor_junction("J-8")
     
     def test_get_progress(self):
         """Test progress calculation"""
@@ -171,6 +186,52 @@ class TestEmergencyTracker:
         assert progress['currentJunction'] == "J-1"
         assert progress['totalJunctions'] == 5
         assert progress['progress'] == 25.0  # 1 of 4 segments
+    
+    def test_session_to_dict_serializes_enums(self):
+        """Test session dict carries enum values as plain strings"""
+        import json
+        
+        tracker = EmergencyTracker()
+        session_id = tracker.activate_emergency("J-0", "J-8")
+        
+        data = json.loads(json.dumps(tracker.get_session(session_id).to_dict()))
+        
+        assert data['vehicleType'] == "AMBULANCE"
+        assert data['status'] == "ACTIVE"
+    
+    def test_tick_completes_arrived_vehicles(self):
+        """Test batched position updates complete arrived vehicles"""
+        tracker = EmergencyTracker()
+        
+        session_id = tracker.activate_emergency("J-0", "J-8")
+        
+        # Still en route
+        arrived = tracker.update_vehicle_positions({
+            session_id: {'position': (400, 400), 'speed': 12.0}
+        })
+        assert arrived == []
+        assert tracker.is_emergency_active()
+        
+        # Within arrival radius of J-8 (700, 700)
+        arrived = tracker.update_vehicle_positions({
+            session_id: {'position': (690, 695), 'current_junction': 'J-8'}
+        })
+        assert arrived == [session_id]
+        assert not tracker.is_emergency_active()
+        assert tracker.get_session(session_id).status == EmergencyStatus.COMPLETED
+    
+    def test_single_update_uses_kernel_arrival_radius(self):
+        """Test the scalar arrival check agrees with ARRIVAL_RADIUS"""
+        from app.emergency._tick_numba import ARRIVAL_RADIUS
+        
+        tracker = EmergencyTracker()
+        session_id = tracker.activate_emergency("J-0", "J-8")
+        
+        # Just outside, then just inside the radius of J-8 (700, 700)
+        tracker.update_vehicle_position(session_id, (700 - ARRIVAL_RADIUS, 700))
+        assert tracker.is_emergency_active()
+        tracker.update_vehicle_position(session_id, (700 - ARRIVAL_RADIUS + 0.5, 700))
+        assert tracker.get_session(session_id).status == EmergencyStatus.COMPLETED
 
 
 # ============================================
@@ -289,6 +350,186 @@ class TestEmergencyPathfinder:
         
         assert next_junctions[0] == "J-1"
         assert len(next_junctions) <= 4  # current + 3 lookahead
+    
+    def test_get_next_junctions_tracks_path_changes(self):
+        """Test cached path positions follow in-place path edits"""
+        pathfinder = EmergencyPathfinder()
+        
+        path = ["J-0", "J-1", "J-2"]
+        assert pathfinder.get_next_junctions("J-2", path, lookahead=2) == ["J-2"]
+        assert pathfinder.get_next_junctions("J-9", path, lookahead=2) == ["J-0", "J-1"]
+        
+        path.append("J-9")
+        assert pathfinder.get_next_junctions("J-9", path, lookahead=2) == ["J-9"]
+        
+        # Same-length in-place reroute
+        path[1:3] = ["J-5", "J-6"]
+        assert pathfinder.get_next_junctions("J-5", path, lookahead=1) == ["J-5", "J-6"]
+        assert pathfinder.get_next_junctions("J-1", path, lookahead=1) == ["J-0"]
+    
+    def test_csr_graph_matches_adjacency(self):
+        """Test CSR arrays mirror the junction adjacency"""
+        pathfinder = EmergencyPathfinder()
+        pathfinder.build_mock_graph()
+        
+        center = pathfinder.id_to_idx["J-4"]
+        row = slice(pathfinder.indptr[center], pathfinder.indptr[center + 1])
+        neighbors = {pathfinder.idx_to_id[i] for i in pathfinder.indices[row]}
+        
+        assert len(pathfinder.indptr) == 10
+        assert neighbors == {"J-1", "J-3", "J-5", "J-7"}
+        assert all(w == 300 for w in pathfinder.weights[row])
+    
+    def test_find_path_prefers_shorter_detour(self):
+        """Test A* returns the cheapest route, not the fewest hops"""
+        pathfinder = EmergencyPathfinder()
+        pathfinder.build_graph_from_data(
+            junctions=[
+                {'id': 'A', 'x': 0, 'y': 0},
+                {'id': 'B', 'x': 100, 'y': 0},
+                {'id': 'C', 'x': 50, 'y': 10},
+                {'id': 'D', 'x': 75, 'y': 10},
+            ],
+            roads=[
+                {'id': 'R-AB', 'start_junction_id': 'A', 'end_junction_id': 'B', 'length': 500},
+                {'id': 'R-AC', 'start_junction_id': 'A', 'end_junction_id': 'C', 'length': 60},
+                {'id': 'R-CD', 'start_junction_id': 'C', 'end_junction_id': 'D', 'length': 30},
+                {'id': 'R-DB', 'start_junction_id': 'D', 'end_junction_id': 'B', 'length': 30},
+            ]
+        )
+        
+        path = pathfinder.find_path("A", "B")
+        
+        assert path == ["A", "C", "D", "B"]
+        assert pathfinder.get_path_distance(path) == 120
+        assert pathfinder.get_road_segments_in_path(path) == ["R-AC", "R-CD", "R-DB"]
+    
+    def test_compiled_and_python_astar_agree(self):
+        """Test the CSR kernel and pure-Python A* find equal-cost paths"""
+        pathfinder = EmergencyPathfinder()
+        pathfinder.build_mock_graph(grid_size=8)
+        
+        start = pathfinder.id_to_idx["J-0"]
+        goal = pathfinder.id_to_idx["J-63"]
+        
+        h = pathfinder._heuristic_to(goal)
+        
+        compiled_path, _ = pathfinder._astar_compiled(start, goal, h)
+        python_path, _ = pathfinder._astar_python(start, goal, h)
+        
+        assert compiled_path[0] == python_path[0] == "J-0"
+        assert compiled_path[-1] == python_path[-1] == "J-63"
+        assert (
+            pathfinder.get_path_distance(compiled_path)
+            == pathfinder.get_path_distance(python_path)
+            == 14 * 300
+        )
+    
+    def test_bucket_queue_pops_in_bucket_order(self):
+        """Test bucket queue ordering, including overflow beyond the window"""
+        from app.emergency.pathfinder import BucketQueue
+        
+        queue = BucketQueue(width=10, num_buckets=4)
+        for f in [35, 5, 500, 12, 80]:
+            queue.push((f, f"n{f}"))
+        
+        popped = [queue.pop()[0] for _ in range(len(queue))]
+        
+        assert popped == [5, 12, 35, 80, 500]
+        assert len(queue) == 0
+    
+    def test_find_path_with_bucket_queue(self):
+        """Test A* with bucket queue matches the heap result"""
+        pathfinder = EmergencyPathfinder(bucket_width=1.0)
+        pathfinder.build_mock_graph(grid_size=5)
+        
+        path = pathfinder.find_path("J-0", "J-24")
+        
+        assert path[0] == "J-0" and path[-1] == "J-24"
+        assert pathfinder.get_path_distance(path) == 8 * 300
+    
+    def test_bidirectional_matches_unidirectional(self):
+        """Test bidirectional A* finds an equally short path"""
+        pathfinder = EmergencyPathfinder()
+        pathfinder.build_mock_graph(grid_size=6)
+        
+        path = pathfinder.find_path_bidirectional("J-0", "J-35")
+        
+        assert path[0] == "J-0" and path[-1] == "J-35"
+        assert pathfinder.get_path_distance(path) == pathfinder.get_path_distance(
+            pathfinder.find_path("J-0", "J-35")
+        )
+        assert pathfinder.get_road_segments_in_path(path)
+    
+    def test_bidirectional_respects_oneway(self):
+        """Test backward search follows incoming edges only"""
+        pathfinder = EmergencyPathfinder()
+        pathfinder.build_graph_from_data(
+            junctions=[
+                {'id': 'A', 'x': 0, 'y': 0},
+                {'id': 'B', 'x': 100, 'y': 0},
+                {'id': 'C', 'x': 200, 'y': 0},
+            ],
+            roads=[
+                {'id': 'R-AB', 'start_junction_id': 'A', 'end_junction_id': 'B', 'length': 100, 'oneway': True},
+                {'id': 'R-BC', 'start_junction_id': 'B', 'end_junction_id': 'C', 'length': 100, 'oneway': True},
+            ]
+        )
+        
+        assert pathfinder.find_path_bidirectional("A", "C") == ["A", "B", "C"]
+        assert pathfinder.find_path_bidirectional("C", "A") is None
+    
+    def test_graph_cache_roundtrip(self, tmp_path):
+        """Test compiled graph is cached to disk and reloaded"""
+        from types import SimpleNamespace
+        
+        map_loader = SimpleNamespace(
+            junctions=[
+                SimpleNamespace(id=f"J-{i}", x=100.0 * i, y=50.0) for i in range(4)
+            ],
+            roads=[
+                SimpleNamespace(
+                    id=f"R-{i}", start_junction_id=f"J-{i}",
+                    end_junction_id=f"J-{i + 1}", length=120.5, oneway=False
+                )
+                for i in range(3)
+            ]
+        )
+        
+        built = EmergencyPathfinder(map_loader, cache_dir=str(tmp_path))
+        assert len(list(tmp_path.glob("graph_*.npz"))) == 1
+        
+        loaded = EmergencyPathfinder(cache_dir=str(tmp_path))
+        assert loaded._load_graph_cache(next(tmp_path.glob("graph_*.npz")))
+        
+        assert loaded.junction_graph == built.junction_graph
+        assert loaded.junction_positions == built.junction_positions
+        assert loaded.edge_road_ids == built.edge_road_ids
+        assert loaded.find_path("J-0", "J-3") == ["J-0", "J-1", "J-2", "J-3"]
+    
+    def test_map_loader_graph_restored_after_mock(self, tmp_path):
+        """Test an ad-hoc graph does not pin the map loader's signature"""
+        from types import SimpleNamespace
+        
+        map_loader = SimpleNamespace(
+            junctions=[
+                SimpleNamespace(id=f"M-{i}", x=100.0 * i, y=50.0) for i in range(3)
+            ],
+            roads=[
+                SimpleNamespace(
+                    id=f"R-{i}", start_junction_id=f"M-{i}",
+                    end_junction_id=f"M-{i + 1}", length=100.0, oneway=False
+                )
+                for i in range(2)
+            ]
+        )
+        
+        pathfinder = EmergencyPathfinder(map_loader, cache_dir=str(tmp_path))
+        pathfinder.build_mock_graph()
+        assert "M-0" not in pathfinder.junction_graph
+        
+        pathfinder.set_map_loader(map_loader)
+        assert pathfinder.find_path("M-0", "M-2") == ["M-0", "M-1", "M-2"]
 
 
 # ============================================
@@ -547,6 +788,17 @@ class TestEmergencyAPI:
         response = client.get("/api/emergency/history")
         
         assert response.status_code in [200, 503]
+    
+    def test_routes_follow_reinitialized_components(self):
+        """Test route lookups see a tracker replaced by a later init"""
+        from app.api import emergency_routes
+        
+        first, second = MagicMock(), MagicMock()
+        with patch.object(emergency_routes, "_emergency_tracker", None), \
+                patch.object(emergency_routes, "get_emergency_tracker", return_value=first) as getter:
+            assert emergency_routes._get_tracker() is first
+            getter.return_value = second
+            assert emergency_routes._get_tracker() is second
 
 
 if __name__ == "__main__":
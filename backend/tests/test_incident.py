@@ -11,6 +11,8 @@ Tests:
 import pytest
 import time
 import asyncio
+import gc
+import numpy as np
 from unittest.mock import Mock, AsyncMock, patch
 
 # Import incident components
@@ -112,6 +114,150 @@ class TestDetectionLogger:
         assert stats['totalDetections'] == 5
         assert stats['bufferSize'] == 5
         assert 'retentionHours' in stats
+    
+    @pytest.mark.asyncio
+    async def test_flush_buffer_batch_insert(self):
+        """Test buffered detections are written in one batch"""
+        from sqlalchemy import create_engine, select, func
+        from sqlalchemy.pool import StaticPool
+        from app.database.database import Base
+        from app.database.models import DetectionRecord
+        
+        # Flushes run on the logger's DB thread, so share one connection
+        test_engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=test_engine)
+        
+        logger = DetectionHistoryLogger(buffer_size=100)
+        for i in range(20):
+            logger.log_detection(
+                vehicle_id=f"V-{i}",
+                number_plate=f"GJ01AB{i:04d}",
+                junction_id="J-1",
+                direction="E",
+                position_x=1.0,
+                position_y=2.0
+            )
+        
+        with patch('app.incident.detection_logger.engine', test_engine):
+            await logger.force_flush()
+        
+        with test_engine.connect() as conn:
+            count = conn.execute(select(func.count()).select_from(DetectionRecord)).scalar()
+            ids = conn.execute(select(DetectionRecord.id)).scalars().all()
+        
+        assert count == 20
+        assert len(set(ids)) == 20
+        assert all(record_id.startswith("det-") and len(record_id) == 16 for record_id in ids)
+        assert logger.total_flushes == 1
+        assert len(logger._buffer) == 0
+    
+    @pytest.mark.asyncio
+    async def test_overflow_schedules_single_flush(self):
+        """Test a burst past buffer_size schedules only one flush task"""
+        logger = DetectionHistoryLogger(buffer_size=5)
+        
+        with patch.object(logger, '_flush_buffer', new=AsyncMock()) as flush:
+            for i in range(20):
+                logger.log_detection(
+                    vehicle_id=f"V-{i}",
+                    number_plate=f"GJ01AB{i:04d}",
+                    junction_id="J-1",
+                    direction="N",
+                    position_x=0.0,
+                    position_y=0.0
+                )
+            
+            assert logger._flush_pending
+            await asyncio.sleep(0)
+        
+        assert flush.await_count == 1
+        assert not logger._flush_pending
+    
+    def test_detection_store_route_and_summary(self):
+        """Test the columnar store reconstructs routes and summaries"""
+        logger = DetectionHistoryLogger(buffer_size=100)
+        
+        for i, junction in enumerate(["J-1", "J-2", "J-3"]):
+            logger.log_detection(
+                vehicle_id="V-001",
+                number_plate="GJ01AB1234",
+                junction_id=junction,
+                direction="E",
+                position_x=0.0,
+                position_y=0.0,
+                speed=10.0 * (i + 1)
+            )
+        logger.log_detection(
+            vehicle_id="V-002",
+            number_plate="GJ01AB9999",
+            junction_id="J-2",
+            direction="N",
+            position_x=0.0,
+            position_y=0.0,
+            speed=40.0,
+            vehicle_type="BIKE"
+        )
+        
+        store = logger.store
+        assert len(store) == 4
+        assert logger.get_statistics()['storeSize'] == 4
+        
+        route = store.route("GJ01AB1234")
+        assert route.route == ["J-1", "J-2", "J-3"]
+        assert route.vehicle_id == "V-001"
+        assert route.avg_speed == pytest.approx(20.0)
+        assert store.route("UNKNOWN") is None
+        
+        summary = store.summary()
+        assert summary.total_detections == 4
+        assert summary.unique_vehicles == 2
+        assert summary.by_junction == {"J-1": 1, "J-2": 2, "J-3": 1}
+        assert summary.by_vehicle_type == {"CAR": 3, "BIKE": 1}
+        assert summary.avg_speed == pytest.approx(25.0)
+    
+    def test_detection_store_grows_and_prunes(self):
+        """Test store capacity doubling and window pruning"""
+        from app.incident.detection_store import DetectionStore
+        
+        store = DetectionStore(window_seconds=100.0, capacity=2)
+        for t in range(5):
+            store.append("P", "V", f"J-{t}", "CAR", 1.0, float(t * 50))
+        
+        assert len(store) == 5
+        assert store.capacity >= 5
+        
+        assert store.prune(now=200.0) == 2
+        assert store.route("P").route == ["J-2", "J-3", "J-4"]
+        assert store.summary().total_detections == 3
+    
+    def test_detection_store_prune_compacts_intern_tables(self):
+        """Test pruned plates and vehicle IDs leave the intern tables"""
+        from app.incident.detection_store import DetectionStore
+        
+        store = DetectionStore(window_seconds=100.0)
+        for t in range(10):
+            store.append(f"P-{t}", f"V-{t}", "J-1", "CAR", float(t), float(t * 50))
+        
+        assert len(store._plate_table.values) == 10
+        assert len(store._vehicle_table.values) == 10
+        
+        assert store.prune(now=450.0) == 7
+        assert store._plate_table.values == ["P-7", "P-8", "P-9"]
+        assert store._vehicle_table.values == ["V-7", "V-8", "V-9"]
+        assert store.route("P-3") is None
+        
+        route = store.route("P-8")
+        assert route.vehicle_id == "V-8"
+        assert route.speeds == [8.0]
+        assert store.summary().unique_vehicles == 3
+        
+        store.append("P-8", "V-8", "J-2", "CAR", 1.0, 460.0)
+        assert len(store._plate_table.values) == 3
+        assert store.route("P-8").route == ["J-1", "J-2"]
 
 
 # ============================================
@@ -204,15 +350,563 @@ class TestIncidentManager:
         assert stats['totalIncidents'] == 0
         assert stats['totalResolved'] == 0
         assert stats['activeIncidents'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_status_counts_follow_transitions(self):
+        """Test per-status counters track each status change"""
+        manager = IncidentManager()
+        
+        with patch.object(manager, '_save_incident_to_db', new=AsyncMock()), \
+                patch.object(manager, '_update_incident_in_db', new=AsyncMock()), \
+                patch.object(manager, '_process_incident', new=AsyncMock()):
+            first = await manager.create_incident("GJ01AA0001", time.time())
+            await manager.create_incident("GJ01AA0002", time.time())
+            
+            stats = manager.get_statistics()
+            assert stats['processing'] == 2
+            
+            # No inference engine: processing marks the incident failed
+            await IncidentManager._process_incident(manager, manager._active_incidents[first])
+            await manager.resolve_incident(first)
+        
+        stats = manager.get_statistics()
+        assert stats['processing'] == 1
+        assert stats['failed'] == 0
+        assert stats['resolved'] == 1
+        assert stats['completed'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_incident_cache_evicts_least_recently_used(self):
+        """Test the active incident cache is bounded and LRU-ordered"""
+        manager = IncidentManager(cache_size=2)
+        
+        with patch.object(manager, '_save_incident_to_db', new=AsyncMock()), \
+                patch.object(manager, '_process_incident', new=AsyncMock()):
+            first = await manager.create_incident("GJ01AA0001", time.time())
+            second = await manager.create_incident("GJ01AA0002", time.time())
+            
+            # Touch the first so the second becomes least recently used
+            await manager.get_incident(first)
+            third = await manager.create_incident("GJ01AA0003", time.time())
+        
+        assert list(manager._active_incidents) == [first, third]
+        assert second not in manager._active_incidents
+    
+    @pytest.mark.asyncio
+    async def test_evicted_incident_found_while_referenced(self):
+        """Test evicted incidents stay findable only while held elsewhere"""
+        manager = IncidentManager(cache_size=1)
+        
+        # Plain coroutines rather than mocks: mocks keep call args alive
+        async def noop(incident):
+            pass
+        
+        with patch.object(manager, '_save_incident_to_db', new=noop), \
+                patch.object(manager, '_process_incident', new=noop):
+            first = await manager.create_incident("GJ01AA0001", time.time())
+            held = manager._active_incidents[first]
+            await manager.create_incident("GJ01AA0002", time.time())
+        
+        assert first not in manager._active_incidents
+        
+        with patch.object(manager, '_load_incident_from_db', new=AsyncMock(return_value=None)) as load:
+            found = await manager.get_incident(first)
+            assert found is held
+            load.assert_not_called()
+            
+            # Once processing finishes and the last strong ref drops,
+            # the weak entry goes with it
+            manager._active_incidents.clear()
+            del held, found
+            await asyncio.sleep(0)
+            gc.collect()
+            assert await manager.get_incident(first) is None
+            load.assert_called_once_with(first)
+    
+    @pytest.mark.asyncio
+    async def test_incident_type_parsing(self):
+        """Test types are matched case-insensitively, unknown ones map to OTHER"""
+        manager = IncidentManager()
+        
+        with patch.object(manager, '_save_incident_to_db', new=AsyncMock()), \
+                patch.object(manager, '_process_incident', new=AsyncMock()):
+            theft_id = await manager.create_incident("GJ01AA0001", time.time(), incident_type="theft")
+            other_id = await manager.create_incident("GJ01AA0002", time.time(), incident_type="meteor")
+        
+        assert manager._active_incidents[theft_id].incident_type == IncidentType.THEFT
+        assert manager._active_incidents[other_id].incident_type == IncidentType.OTHER
+    
+    @pytest.mark.asyncio
+    async def test_number_plate_normalized(self):
+        """Test plates are uppercased with separators removed"""
+        manager = IncidentManager()
+        
+        with patch.object(manager, '_save_incident_to_db', new=AsyncMock()), \
+                patch.object(manager, '_process_incident', new=AsyncMock()):
+            incident_id = await manager.create_incident("gj-01 ab\t1234", time.time())
+        
+        assert manager._active_incidents[incident_id].number_plate == "GJ01AB1234"
+    
+    @pytest.mark.asyncio
+    async def test_incident_emits_are_batched(self):
+        """Test a burst of incident events goes out as one batch"""
+        emitter = Mock()
+        emitter.emit = AsyncMock()
+        manager = IncidentManager(ws_emitter=emitter)
+        
+        with patch.object(manager, '_save_incident_to_db', new=AsyncMock()), \
+                patch.object(manager, '_process_incident', new=AsyncMock()):
+            for i in range(5):
+                await manager.create_incident(f"GJ01AA{i:04d}", time.time())
+            
+            await asyncio.sleep(0.1)
+        
+        await manager.stop()
+        
+        emitter.emit.assert_awaited_once()
+        event, payload = emitter.emit.await_args.args
+        assert event == 'incident:batch'
+        assert payload['event'] == 'incident:created'
+        assert [e['seq'] for e in payload['events']] == [1, 2, 3, 4, 5]
+    
+    def test_inference_result_reads_legacy_json_keys(self):
+        """Test rows stored with camelCase JSON keys still load"""
+        from app.database.models import InferenceResult as InferenceResultModel
+        
+        db_result = InferenceResultModel(
+            id="inf-inc-1",
+            incident_id="inc-1",
+            number_plate="GJ01AB1234",
+            probable_locations_json='[{"junctionId": "J-2", "junctionName": "Junction 2", '
+                                    '"lat": 23.2, "lon": 72.6, "confidence": 75.0, '
+                                    '"distance": 2, "travelTime": 40.0}]',
+            detection_history_json='[{"junctionId": "J-1", "junctionName": null, '
+                                   '"timestamp": 100.0, "direction": "N"}]'
+        )
+        
+        result = IncidentManager()._db_to_inference_result(db_result)
+        
+        # Nothing parsed until a list is accessed
+        assert result.probable_locations._items is None
+        
+        assert result.probable_locations[0].junction_id == "J-2"
+        assert result.probable_locations[0].distance_from_last == 2
+        assert result.detection_history[0].direction == "N"
+    
+    @pytest.mark.asyncio
+    async def test_update_skipped_when_unchanged(self):
+        """Test no DB session is opened for a no-op update"""
+        manager = IncidentManager()
+        incident = manager._build_record("GJ01AB1234", time.time())
+        incident.mark_persisted()
+        
+        with patch('app.incident.incident_manager.AsyncSessionLocal',
+                   side_effect=RuntimeError("no db")) as sessions:
+            await manager._update_incident_in_db(incident)
+            sessions.assert_not_called()
+            
+            incident.status = IncidentStatus.COMPLETED
+            await manager._update_incident_in_db(incident)
+            sessions.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_incidents(self):
+        """Test bulk ingest inserts all incidents in one batch"""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.database.database import Base
+        
+        test_engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        test_sessions = async_sessionmaker(test_engine, expire_on_commit=False)
+        
+        manager = IncidentManager()
+        
+        with patch('app.incident.incident_manager.AsyncSessionLocal', test_sessions):
+            incident_ids = await manager.bulk_create_incidents([
+                {'number_plate': f"gj01aa{i:04d}", 'incident_time': time.time(), 'incident_type': "THEFT"}
+                for i in range(3)
+            ], process=False)
+            
+            listed = await manager.list_incidents()
+        
+        await test_engine.dispose()
+        
+        assert len(incident_ids) == 3
+        assert manager.total_incidents == 3
+        assert {incident.id for incident in listed} == set(incident_ids)
+        assert all(incident.incident_type == IncidentType.THEFT for incident in listed)
+        assert all(incident.number_plate.startswith("GJ01AA") for incident in listed)
+    
+    @pytest.mark.asyncio
+    async def test_update_persists_inference_result(self):
+        """Test incident update and inference result share one transaction"""
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from app.database.database import Base
+        from app.incident.incident_manager import IncidentInferenceResult, ProbableLocation
+        
+        test_engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        test_sessions = async_sessionmaker(test_engine, expire_on_commit=False)
+        
+        manager = IncidentManager()
+        
+        with patch('app.incident.incident_manager.AsyncSessionLocal', test_sessions), \
+                patch.object(manager, '_process_incident', new=AsyncMock()):
+            incident_id = await manager.create_incident(
+                number_plate="GJ01AB1234",
+                incident_time=time.time()
+            )
+            
+            incident = manager._active_incidents[incident_id]
+            incident.status = IncidentStatus.COMPLETED
+            incident.processed_at = time.time()
+            incident.inference_result = IncidentInferenceResult(
+                incident_id=incident_id,
+                number_plate="GJ01AB1234",
+                last_known_junction="J-1",
+                last_known_junction_name=None,
+                last_seen_time=time.time(),
+                last_seen_lat=23.2,
+                last_seen_lon=72.6,
+                time_elapsed=60.0,
+                probable_locations=[
+                    ProbableLocation("J-2", "Junction 2", 23.21, 72.61, 80.0, 1, 30.0)
+                ],
+                search_radius=1.0,
+                search_center_lat=23.2,
+                search_center_lon=72.6,
+                detection_history=[],
+                detection_count=0,
+                overall_confidence=80.0,
+                inference_time_ms=5.0,
+                generated_at=time.time()
+            )
+            await manager._update_incident_in_db(incident)
+            
+            loaded = await manager._load_incident_from_db(incident_id)
+        
+        await test_engine.dispose()
+        
+        assert loaded.status == IncidentStatus.COMPLETED
+        assert loaded.inference_result is not None
+        assert loaded.inference_result.probable_locations[0].junction_id == "J-2"
 
 
 # ============================================
 # Inference Engine Tests
 # ============================================
 
+def make_chain_map_service(count: int = 6):
+    """Map service mock: junctions J-0..J-n in a two-way chain plus a one-way spur"""
+    map_service = Mock()
+    map_service.get_junctions.return_value = [
+        {'id': f"J-{i}", 'name': f"Junction {i}", 'lat': 23.0 + i * 0.01, 'lon': 72.5}
+        for i in range(count)
+    ] + [{'id': "J-spur", 'name': "Spur", 'lat': 23.5, 'lon': 72.6}]
+    map_service.get_roads.return_value = [
+        {'from_junction': f"J-{i}", 'to_junction': f"J-{i + 1}"}
+        for i in range(count - 1)
+    ] + [{'from_junction': "J-spur", 'to_junction': "J-0", 'bidirectional': False}]
+    return map_service
+
+
 class TestInferenceEngine:
     """Tests for VehicleInferenceEngine"""
     
+    def test_bfs_reachable_junctions(self):
+        """Test BFS respects hop limits and edge direction"""
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service())
+        
+        assert engine._bfs_reachable_junctions("J-2", 2) == {
+            "J-2": 0, "J-1": 1, "J-3": 1, "J-0": 2, "J-4": 2
+        }
+        
+        # The spur is one-way into J-0, so it is never reached from the chain
+        assert "J-spur" not in engine._bfs_reachable_junctions("J-0", 10)
+        assert engine._bfs_reachable_junctions("J-spur", 1) == {"J-spur": 0, "J-0": 1}
+        
+        # Unknown start junction: only itself
+        assert engine._bfs_reachable_junctions("J-missing", 3) == {"J-missing": 0}
+    
+    def test_road_graph_compiled_without_networkx(self):
+        """Test the road network is held as CSR arrays, with a DiGraph on demand"""
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service(count=4))
+        
+        # 3 two-way chain roads plus the one-way spur
+        assert engine.get_statistics()['graphEdges'] == 7
+        assert engine.get_statistics()['graphNodes'] == 5
+        
+        csr = engine._csr
+        spur = engine._id_to_idx["J-spur"]
+        assert csr.neighbors(spur).tolist() == [engine._id_to_idx["J-0"]]
+        assert (csr.n_nodes, csr.n_edges) == (5, 7)
+        
+        graph = engine.to_networkx()
+        assert graph.has_edge("J-spur", "J-0")
+        assert not graph.has_edge("J-0", "J-spur")
+        assert graph.nodes["J-1"]["lat"] == pytest.approx(23.01)
+        assert graph.edges["J-0", "J-1"]["weight"] == 0.5
+    
+    def test_edge_lengths_quantized(self):
+        """Test road lengths are stored as int16 10 m units next to the CSR"""
+        map_service = make_chain_map_service(count=3)
+        map_service.get_roads.return_value = [
+            {'from_junction': "J-0", 'to_junction': "J-1", 'length_km': 1.234},
+            {'from_junction': "J-1", 'to_junction': "J-2", 'bidirectional': False}
+        ]
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(map_service)
+        
+        assert engine._edge_len_10m.dtype == np.int16
+        assert len(engine._edge_len_10m) == len(engine._csr.indices)
+        lengths = {
+            (engine._idx_to_id[u], engine._idx_to_id[engine._csr.indices[k]]): int(engine._edge_len_10m[k])
+            for u in range(len(engine._idx_to_id))
+            for k in range(engine._csr.indptr[u], engine._csr.indptr[u + 1])
+        }
+        assert lengths == {("J-0", "J-1"): 123, ("J-1", "J-0"): 123, ("J-1", "J-2"): 50}
+        assert engine.to_networkx().edges["J-0", "J-1"]["weight"] == 1.234
+    
+    def test_reachable_rejects_bad_start(self, caplog):
+        """Test invalid BFS starts are rejected up front and logged by the caller"""
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service())
+        
+        with pytest.raises(IndexError):
+            engine._reachable(len(engine._idx_to_id), 2)
+        with pytest.raises(IndexError):
+            engine._reachable(-1, 2)
+        
+        with caplog.at_level("ERROR", logger="app.incident.inference_engine"):
+            assert engine._calculate_probable_locations("J-0", float('nan')) == []
+        assert "Reachability search failed" in caplog.text
+    
+    def test_bfs_results_cached_until_rebuild(self):
+        """Test repeated BFS from the same junction reuses the cached result"""
+        engine = VehicleInferenceEngine(
+            map_service=None,
+            bfs_cache_size=2,
+            precompute_reachability=False
+        )
+        engine.set_map_service(make_chain_map_service())
+        start = engine._id_to_idx["J-0"]
+        
+        first = engine._reachable(start, 3)
+        assert engine._reachable(start, 3) is first
+        assert not first[0].flags.writeable
+        
+        # Bounded: the oldest entry is evicted
+        engine._reachable(start, 1)
+        engine._reachable(start, 2)
+        assert (start, 3) not in engine._bfs_cache
+        
+        # Rebuilding the graph invalidates everything
+        engine.set_map_service(make_chain_map_service())
+        assert len(engine._bfs_cache) == 0
+    
+    def test_reach_table_matches_bfs(self):
+        """Test precomputed reachability agrees with a fresh BFS"""
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service(30))
+        
+        assert engine._reach_max_hops == 20
+        assert len(engine._reach_nodes) == len(engine._idx_to_id)
+        
+        for start in range(len(engine._idx_to_id)):
+            for max_hops in (1, 5, 20):
+                nodes, dists = engine._reachable(start, max_hops)
+                py_nodes, py_dists = engine._bfs_python(start, max_hops)
+                
+                assert nodes.tolist() == py_nodes.tolist()
+                assert dists.tolist() == py_dists.tolist()
+    
+    def test_probable_locations_scoring(self):
+        """Test vectorized scoring matches the per-junction formula"""
+        map_service = make_chain_map_service(30)
+        # A road endpoint with no junction info is reachable but never ranked
+        map_service.get_roads.return_value.append(
+            {'from_junction': "J-10", 'to_junction': "X-unmapped"}
+        )
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(map_service)
+        time_elapsed = 900  # 15 min -> 7.5 km -> 15 hops
+        
+        locations = engine._calculate_probable_locations("J-10", time_elapsed)
+        
+        assert len(locations) == 10
+        assert locations[0].junction_id == "J-10"
+        assert locations[0].junction_name == "Junction 10"
+        
+        time_factor = max(0.3, 1 - (time_elapsed / 3600))
+        for location in locations:
+            hops = abs(int(location.junction_id.split("-")[1]) - 10)
+            expected = min(100, max(5, 100 / (1 + hops * 0.5) * time_factor))
+            assert location.distance_from_last == hops
+            assert location.confidence == round(expected, 1)
+            assert location.estimated_travel_time == round(hops * 0.5 / 30.0 * 3600, 0)
+        
+        confidences = [location.confidence for location in locations]
+        assert confidences == sorted(confidences, reverse=True)
+        assert "X-unmapped" not in [location.junction_id for location in locations]
+        
+        # Ranking relies on confidence never increasing with hop count
+        assert np.all(np.diff(engine._conf_lut) <= 0)
+    
+    def test_detection_history_uses_junction_info(self):
+        """Test history takes known junction coordinates, else the raw position"""
+        from types import SimpleNamespace
+        
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service())
+        
+        detections = [
+            SimpleNamespace(junction_id="J-3", timestamp=1.0, direction="E",
+                            position_x=1.0, position_y=2.0),
+            SimpleNamespace(junction_id="J-unmapped", timestamp=2.0, direction=None,
+                            position_x=3.0, position_y=4.0)
+        ]
+        
+        history = engine._build_detection_history(detections)
+        
+        assert history[0].junction_name == "Junction 3"
+        assert history[0].lat == pytest.approx(23.03)
+        assert history[0].lon == pytest.approx(72.5)
+        assert history[1].junction_name is None
+        assert (history[1].lat, history[1].lon) == (4.0, 3.0)
+        assert history[1].direction == 'N'
+        
+        # No map: every detection keeps its recorded position
+        bare = VehicleInferenceEngine(map_service=None)
+        assert [(h.lat, h.lon) for h in bare._build_detection_history(detections)] == [(2.0, 1.0), (4.0, 3.0)]
+        assert bare._build_detection_history([]) == []
+        
+        info = engine._junction_info("J-3")
+        assert info.name == "Junction 3"
+        assert engine._junction_info("J-unmapped") is None
+        
+        # Lightweight, immutable view over the arrays
+        assert not hasattr(info, '__dict__')
+        with pytest.raises(AttributeError):
+            info.name = "Renamed"
+    
+    @pytest.mark.asyncio
+    async def test_process_incident_batch(self):
+        """Test a batch of incidents shares one detection query"""
+        from sqlalchemy.pool import StaticPool
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from app.database.database import Base
+        from app.database.models import DetectionRecord
+        
+        test_engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with test_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        test_sessions = async_sessionmaker(test_engine, expire_on_commit=False)
+        
+        now = time.time()
+        async with test_sessions() as db:
+            for i, (plate, junction, age) in enumerate([
+                ("GJ01AA0001", "J-1", 600), ("GJ01AA0001", "J-2", 300),
+                ("GJ01AA0002", "J-4", 7200), ("GJ01AA0002", "J-5", 120)
+            ]):
+                db.add(DetectionRecord(
+                    id=f"det-{i}", vehicle_id=f"V-{i}", number_plate=plate,
+                    junction_id=junction, timestamp=now - age, direction="N"
+                ))
+            await db.commit()
+        
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service())
+        
+        with patch('app.incident.inference_engine.AsyncSessionLocal', test_sessions), \
+                patch.object(engine, '_query_detections_batch',
+                             wraps=engine._query_detections_batch) as fetch:
+            results = await engine.process_incident_batch([
+                ("inc-1", "GJ01AA0001", now, None),
+                ("inc-2", "GJ01AA0002", now, None),
+                ("inc-3", "GJ01ZZ9999", now, None)
+            ])
+        
+        # A caller-provided session is queried directly; none is opened
+        engine._result_cache.clear()
+        with patch('app.incident.inference_engine.AsyncSessionLocal') as session_factory:
+            async with test_sessions() as db:
+                reused = await engine.process_incident("inc-4", "GJ01AA0001", now, session=db)
+        
+        await test_engine.dispose()
+        
+        session_factory.assert_not_called()
+        assert reused.detection_count == 2
+        
+        fetch.assert_called_once()
+        assert [r.incident_id for r in results] == ["inc-1", "inc-2", "inc-3"]
+        assert results[0].detection_count == 2
+        assert results[0].last_known_junction == "J-2"
+        # The 2h-old detection is outside the 1h window
+        assert results[1].detection_count == 1
+        assert results[1].last_known_junction == "J-5"
+        assert results[2].detection_count == 0
+        assert results[2].probable_locations == ()
+        assert results[2].incident_id == "inc-3"
+        assert results[2].generated_at > 0
+    
+    def test_detection_query_uses_plate_time_index(self):
+        """Test the detection lookup is an index seek with no extra sort"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from app.database.database import Base
+        
+        test_engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=test_engine)
+        
+        with Session(test_engine) as db:
+            plan = " ".join(VehicleInferenceEngine().explain_detection_query(db))
+        
+        test_engine.dispose()
+        
+        assert "idx_detection_plate_time" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    @pytest.mark.asyncio
+    async def test_inference_results_cached_per_minute(self):
+        """Test repeat requests for the same plate and minute reuse the result"""
+        engine = VehicleInferenceEngine(map_service=None)
+        incident_time = 1_700_000_000.0
+        
+        with patch.object(engine, '_query_detections_batch', new=AsyncMock(return_value=[[]])) as fetch:
+            first = await engine.process_incident("inc-1", "GJ01AB1234", incident_time)
+            second = await engine.process_incident("inc-2", "GJ01AB1234", incident_time + 5)
+            other_plate = await engine.process_incident("inc-3", "GJ01AB9999", incident_time)
+        
+        assert fetch.call_count == 2
+        assert second.incident_id == "inc-2"
+        assert second.probable_locations is first.probable_locations
+        assert other_plate.number_plate == "GJ01AB9999"
+        
+        stats = engine.get_statistics()
+        assert stats['cacheHits'] == 1
+        assert stats['cacheMisses'] == 2
+    
+    def test_bfs_python_fallback_matches_kernel(self):
+        """Test the interpreter BFS agrees with the CSR kernel"""
+        from app.incident._bfs_numba import bfs_csr
+        
+        engine = VehicleInferenceEngine(map_service=None)
+        engine.set_map_service(make_chain_map_service(12))
+        
+        for start in range(len(engine._idx_to_id)):
+            for max_hops in (1, 3, 20):
+                nodes, dists = bfs_csr(engine._csr.indptr, engine._csr.indices, start, max_hops)
+                py_nodes, py_dists = engine._bfs_python(start, max_hops)
+                
+                assert nodes.tolist() == py_nodes.tolist()
+                assert dists.tolist() == py_dists.tolist()
+    
     def test_engine_initialization(self):
         """Test engine initializes correctly"""
         engine = VehicleInferenceEngine(
@@ -277,6 +971,21 @@ class TestInferenceEngine:
         assert stats['avgInferenceTimeMs'] == 0
         assert 'avgCitySpeed' in stats
         assert 'maxSearchRadius' in stats
+    
+    def test_latency_statistics(self):
+        """Test mean and percentiles over recorded inference times"""
+        engine = VehicleInferenceEngine()
+        
+        for ms in range(1, 101):
+            engine._update_stats(float(ms))
+        
+        stats = engine.get_statistics()
+        
+        assert stats['totalInferences'] == 100
+        assert stats['avgInferenceTimeMs'] == pytest.approx(50.5)
+        assert stats['p50InferenceTimeMs'] == pytest.approx(50.5)
+        assert stats['p95InferenceTimeMs'] == pytest.approx(95.05)
+        assert stats['p99InferenceTimeMs'] == pytest.approx(99.01)
 
 
 # ============================================
@@ -7,11 +7,13 @@ Tests all data models for proper validation and serialization.
 import pytest
 import time
 import json
-from pydantic import ValidationError
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
 
 from app.models import (
     # Core models
     Position,
+    MovingPosition,
     Vehicle,
     Junction,
     RoadSegment,
@@ -39,6 +41,9 @@ from app.models import (
     CoordinateConverter,
     GANDHINAGAR_BOUNDS,
     
+    # Real map models
+    OSMWayData,
+    
     # Traffic Control models
     TrafficDataMode,
     TrafficDataSource,
@@ -77,6 +82,32 @@ from app.models import (
 )
 
 
+class TestModelsPackage:
+    """Tests for the lazy app.models facade"""
+    
+    def test_exports_resolve_lazily(self):
+        import subprocess
+        import sys
+        
+        code = (
+            "import sys, app.models as m; "
+            "assert not [k for k in sys.modules if k.startswith('app.models.')]; "
+            "from app.models import Vehicle; "
+            "assert 'app.models.vehicle' in sys.modules; "
+            "assert 'app.models.incident' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+    
+    def test_all_exports_available(self):
+        import app.models as models
+        
+        for name in models.__all__:
+            assert getattr(models, name) is not None
+        
+        with pytest.raises(AttributeError):
+            models.NotAModel
+
+
 class TestPositionModel:
     """Tests for Position model"""
     
@@ -86,11 +117,36 @@ class TestPositionModel:
         assert pos.y == 200.0
     
     def test_position_json(self):
+        adapter = TypeAdapter(Position)
         pos = Position(x=100.0, y=200.0)
-        json_str = pos.model_dump_json()
+        json_str = adapter.dump_json(pos)
         data = json.loads(json_str)
         assert data['x'] == 100.0
         assert data['y'] == 200.0
+        
+        assert adapter.validate_json(json_str) == pos
+        assert adapter.validate_python({"x": 1, "y": 2}) == (1.0, 2.0)
+        assert adapter.validate_python((3, 4)) == Position(3.0, 4.0)
+        with pytest.raises(ValidationError):
+            adapter.validate_python({"x": "left", "y": 2})
+    
+    def test_position_is_immutable(self):
+        pos = Position(x=1.0, y=2.0)
+        with pytest.raises(AttributeError):
+            pos.x = 5.0
+        
+        x, y = pos
+        assert (x, y) == (1.0, 2.0)
+    
+    def test_vehicle_gets_its_own_moving_position(self):
+        junction_pos = Position(x=10.0, y=20.0)
+        vehicle = Vehicle(number_plate="TEST", type="car", position=junction_pos, destination="J-1")
+        
+        assert isinstance(vehicle.position, MovingPosition)
+        vehicle.position.x += 5
+        assert vehicle.position.x == 15.0
+        assert junction_pos.x == 10.0
+        assert vehicle.model_dump()["position"] == {"x": 15.0, "y": 20.0}
 
 
 class TestVehicleModel:
@@ -175,6 +231,12 @@ class TestSignalModels:
     def test_junction_get_green_direction(self):
         signals = create_default_signals('east')
         assert signals.get_green_direction() == 'east'
+        
+        # String colors are stored as enum members
+        signals.east = SignalState(current="RED", duration=30.0, last_change=0.0)
+        signals.west = SignalState(current="GREEN", duration=30.0, last_change=0.0)
+        assert signals.west.current is SignalColor.GREEN
+        assert signals.get_green_direction() == 'west'
     
     def test_junction(self):
         junction = Junction(
@@ -207,10 +269,34 @@ class TestRoadModels:
         assert traffic.vehicle_count == 0
         assert traffic.congestion_ratio == 0
         
-        traffic.current_vehicles = ["v1", "v2", "v3"]
+        traffic.current_vehicles = {"v1", "v2", "v3"}
         assert traffic.vehicle_count == 3
         assert traffic.congestion_ratio == 0.15
     
+    def test_hot_models_are_slotted_dataclasses(self):
+        import dataclasses
+        
+        for model in (RoadGeometry, RoadTraffic, SignalState, ConnectedRoads):
+            assert dataclasses.is_dataclass(model)
+        
+        traffic = RoadTraffic()
+        with pytest.raises(AttributeError):
+            traffic.not_a_field = 1
+        
+        # Still validated and serialized where embedded in Pydantic models
+        road = RoadSegment(
+            id="R-1-2",
+            start_junction="J-1",
+            end_junction="J-2",
+            geometry={"start_pos": {"x": 0, "y": 0}, "end_pos": {"x": 3, "y": 4}, "length": 5}
+        )
+        assert isinstance(road.geometry, RoadGeometry)
+        assert road.model_dump()["traffic"]["density"] == "LOW"
+        
+        # Direction is precomputed on validation too, and not serialized
+        assert road.geometry.get_direction_vector() == pytest.approx((0.6, 0.8))
+        assert "_direction" not in road.model_dump()["geometry"]
+    
     def test_road_segment(self):
         road = RoadSegment(
             id="R-1-2",
@@ -229,8 +315,43 @@ class TestRoadModels:
         road.add_vehicle("v-1")
         assert "v-1" in road.traffic.current_vehicles
         
+        road.add_vehicle("v-0")
+        road.add_vehicle("v-1")
+        assert road.traffic.vehicle_count == 2
+        assert road.model_dump()["traffic"]["current_vehicles"] == ["v-0", "v-1"]
+        road.remove_vehicle("v-0")
+        
         road.remove_vehicle("v-1")
         assert "v-1" not in road.traffic.current_vehicles
+    
+    def test_road_segment_uses_tick_timestamp(self):
+        from app.utils import tick_clock
+        
+        road = RoadSegment(
+            id="R-1-2",
+            start_junction="J-1",
+            end_junction="J-2",
+            geometry=RoadGeometry(Position(x=0, y=0), Position(x=10, y=0), 10.0)
+        )
+        try:
+            assert tick_clock.advance_tick(1234.5) == 1234.5
+            road.add_vehicle("v-1")
+            assert road.last_update == 1234.5
+        finally:
+            tick_clock.stop_ticks()
+    
+    def test_tick_time_falls_back_to_wall_clock_when_idle(self):
+        import time
+        from app.utils import tick_clock
+        
+        try:
+            tick_clock.advance_tick(1234.5)
+            assert tick_clock.tick_time() == 1234.5
+        finally:
+            tick_clock.stop_ticks()
+        
+        before = time.time()
+        assert before <= tick_clock.tick_time() <= time.time()
 
 
 class TestLiveTrafficModels:
@@ -287,7 +408,54 @@ class TestCoordinateModels:
         gps_back = converter.canvas_to_gps(canvas.x, canvas.y)
         assert gps_back.lat == pytest.approx(center_lat, abs=0.001)
         assert gps_back.lon == pytest.approx(center_lon, abs=0.001)
+    
+    def test_coordinate_converter_batch(self):
+        bounds = MapBounds(north=23.25, south=23.20, east=72.68, west=72.60)
+        converter = CoordinateConverter(1200, 800, bounds, padding=20)
+        points = [(23.225, 72.64), (23.25, 72.60), (23.20, 72.68), (23.2137, 72.6612)]
+        
+        canvas = converter.gps_to_canvas_batch(points)
+        assert canvas.shape == (4, 2)
+        for (lat, lon), (x, y) in zip(points, canvas.tolist()):
+            single = converter.gps_to_canvas(lat, lon)
+            assert (x, y) == (single.x, single.y)
+        
+        gps = converter.canvas_to_gps_batch(canvas)
+        assert gps == pytest.approx(np.array(points), abs=1e-4)
+        
+        # (20.98, 521.79) maps to a latitude on a 6-decimal half-way point,
+        # where np.round and round() disagree
+        ties = [(20.98, 521.79), (845.22, 156.61)] + canvas.tolist()
+        for (x, y), (lat, lon) in zip(ties, converter.canvas_to_gps_batch(ties).tolist()):
+            single = converter.canvas_to_gps(x, y)
+            assert (lat, lon) == (single.lat, single.lon)
+        
+        assert converter.gps_to_canvas_batch([]).shape == (0, 2)
+
 
+class TestRealMapModels:
+    """Tests for OSM / real map models"""
+    
+    def test_osm_way_tag_parsing(self):
+        way = OSMWayData(id=7, nodes=[1, 2], tags={"maxspeed": "30 mph", "lanes": "4"})
+        assert way.max_speed == 30.0
+        assert way.lanes == 4
+        assert way.name == "Way 7"
+        assert way.road_type == "unclassified"
+        
+        assert OSMWayData(id=1, nodes=[], tags={"maxspeed": "60"}).max_speed == 60.0
+        assert OSMWayData(id=1, nodes=[], tags={"maxspeed": "50 km/h"}).max_speed == 50.0
+        assert OSMWayData(id=1, nodes=[], tags={"maxspeed": "signals"}).max_speed == 50.0
+        assert OSMWayData(id=1, nodes=[], tags={"lanes": "2;3"}).lanes == 2
+        assert OSMWayData(id=1, nodes=[], tags={"maxspeed": " 50"}).max_speed == 50.0
+        assert OSMWayData(id=1, nodes=[], tags={"maxspeed": "20 knots"}).max_speed == 50.0
+        assert OSMWayData(id=1, nodes=[], tags={"lanes": " 3"}).lanes == 3
+        assert OSMWayData(id=1, nodes=[], tags={"lanes": "-1"}).lanes == -1
+        assert OSMWayData(id=1, nodes=[], tags={"lanes": "\u00b2"}).lanes == 2
+        
+        # Parsed values are cached, not part of the serialized model
+        assert "max_speed" in way.__dict__
+        assert way.model_dump() == {"id": 7, "nodes": [1, 2], "tags": {"maxspeed": "30 mph", "lanes": "4"}}
 
 class TestViolationModels:
     """Tests for Violation and Challan models"""
@@ -316,6 +484,23 @@ class TestViolationModels:
         assert challan.challan_id.startswith("CH-")
         assert challan.status == "ISSUED"
         assert challan.fine_amount == 1000.0
+    
+    def test_mock_owners_by_plate(self):
+        from app.models import MOCK_OWNERS, MOCK_OWNERS_BY_PLATE
+        
+        assert len(MOCK_OWNERS_BY_PLATE) == len(MOCK_OWNERS)
+        assert MOCK_OWNERS_BY_PLATE["GJ18AB1234"].owner_name == "Rajesh Kumar"
+    
+    def test_sequential_ids(self):
+        from app.utils.ids import WORKER_TAG, sequential_id_factory
+        
+        next_id = sequential_id_factory("t-")
+        first, second = next_id(), next_id()
+        assert first == f"t-{WORKER_TAG}00000000"
+        assert second == f"t-{WORKER_TAG}00000001"
+        
+        upper_id = sequential_id_factory("CH-", upper=True)()
+        assert upper_id == f"CH-{WORKER_TAG.upper()}00000000"
 
 
 class TestEmergencyModels:
@@ -351,6 +351,49 @@ class TestMapLoaderService:
         
         assert service.converter is not None
     
+    def test_cache_round_trip(self, tmp_path):
+        """Test cached map data is restored as validated models"""
+        service = MapLoaderService(cache_dir=str(tmp_path))
+        result = service._generate_mock_data("test", "Test")
+        service._save_to_cache("test", result)
+        
+        cached = MapLoaderService(cache_dir=str(tmp_path))._load_from_cache("test")
+        
+        assert cached is not None
+        assert cached.from_cache is True
+        assert [j.model_dump() for j in cached.junctions] == [j.model_dump() for j in result.junctions]
+        assert [r.model_dump() for r in cached.roads] == [r.model_dump() for r in result.roads]
+    
+    def test_extract_from_graph(self):
+        """Test junctions/roads extracted from a graph share projected coordinates"""
+        nx = pytest.importorskip("networkx")
+        
+        service = MapLoaderService()
+        service._generate_mock_data("test", "Test")
+        
+        graph = nx.MultiDiGraph()
+        graph.add_node(11, y=23.21, x=72.62)
+        graph.add_node(12, y=23.22, x=72.65)
+        graph.add_node(13, y=23.19, x=72.66)
+        graph.add_edge(11, 12, length=350, name="A Road", lanes="3", maxspeed="40")
+        graph.add_edge(12, 13, length=420, oneway="yes")
+        service.graph = graph
+        
+        service._extract_junctions()
+        service._extract_roads()
+        
+        assert [j.id for j in service.junctions] == ["J-0", "J-1", "J-2"]
+        for junction in service.junctions:
+            canvas = service.converter.gps_to_canvas(junction.lat, junction.lon)
+            assert (junction.x, junction.y) == (canvas.x, canvas.y)
+        
+        first, second = service.roads
+        assert (first.start_x, first.start_y) == (service.junctions[0].x, service.junctions[0].y)
+        assert (first.end_lat, first.end_lon) == (23.22, 72.65)
+        assert first.lanes == 3 and first.max_speed == 40
+        assert second.oneway is True
+        assert service.junctions[1].connected_roads == ["R-0", "R-1"]
+    
     def test_global_service_instance(self):
         """Test global service instance"""
         service1 = get_map_loader_service()
@@ -325,6 +325,69 @@ class TestWebSocketEmitter:
         assert call_args[0][1]["reason"] == "Agent timeout exceeded"
         assert len(call_args[0][1]["affectedJunctions"]) == 3
     
+    @pytest.mark.asyncio
+    async def test_vehicle_updates_quantized(self, emitter, mock_sio):
+        """Test vehicle payloads are rounded to wire precision"""
+        await emitter.emit_vehicle_update({
+            "id": "v-1",
+            "position": {"x": 101.23456789, "y": 57.891011},
+            "speed": 33.3333333,
+            "heading": 89.987654,
+            "lat": 23.21561234567,
+            "lon": 72.63691234567,
+            "last_update": 1700000000.123456
+        })
+        
+        data = mock_sio.emit.call_args[0][1]
+        assert data["position"] == {"x": 101.23, "y": 57.89}
+        assert (data["speed"], data["heading"]) == (33.3, 90.0)
+        assert (data["lat"], data["lon"]) == (23.215612, 72.636912)
+        # Timestamps keep full precision
+        assert data["timestamp"] == 1700000000.123456
+    
+    @pytest.mark.asyncio
+    async def test_vehicle_update_passes_none_fields_through(self, emitter, mock_sio):
+        """Test a Vehicle.model_dump() payload without GPS is sent as-is"""
+        from app.models.junction import Position
+        from app.models.vehicle import Vehicle
+        
+        vehicle = Vehicle(number_plate="GJ01AB1234", type="car",
+                          position=Position(x=1.234, y=5.678), destination="J-2")
+        await emitter.emit_vehicle_update(vehicle.model_dump())
+        
+        data = mock_sio.emit.call_args[0][1]
+        assert data["position"] == {"x": 1.23, "y": 5.68}
+        assert (data["lat"], data["lon"]) == (None, None)
+        
+        emitter.queue_vehicle_update({"id": "v-2", "speed": None, "heading": None})
+        await emitter._flush_vehicle_updates(time.time())
+        
+        update = mock_sio.emit.call_args[0][1]["vehicles"][0]
+        assert (update["speed"], update["heading"]) == (None, None)
+    
+    @pytest.mark.asyncio
+    async def test_vehicle_ticker_conflates_updates(self, emitter, mock_sio):
+        """Test queued updates are sent as one conflated batch per tick"""
+        import asyncio
+        
+        emitter._vehicle_update_interval = 0.01
+        emitter.queue_vehicle_update({"id": "v-1", "speed": 10})
+        emitter.queue_vehicle_update({"id": "v-2", "speed": 20})
+        emitter.queue_vehicle_update({"id": "v-1", "speed": 15})
+        
+        await emitter.start_vehicle_ticker()
+        await asyncio.sleep(0.05)
+        await emitter.stop_vehicle_ticker()
+        
+        # One frame for the tick with pending updates; idle ticks send nothing
+        mock_sio.emit.assert_called_once()
+        event, payload = mock_sio.emit.call_args[0]
+        assert event == "vehicles:batch_update"
+        assert payload["count"] == 2
+        assert {v["vehicleId"]: v["speed"] for v in payload["vehicles"]} == {"v-1": 15, "v-2": 20}
+        assert emitter.get_stats()["pendingVehicleUpdates"] == 0
+        assert not emitter.get_stats()["vehicleTickerRunning"]
+    
     def test_subscription_management(self, emitter):
         """Test subscription add/remove"""
         emitter.add_subscription("sid-1", "vehicles")
@@ -342,6 +405,66 @@ class TestWebSocketEmitter:
         emitter.remove_subscription("sid-1")  # Remove all
         assert "sid-1" not in emitter.get_subscribers("signals")
     
+    @pytest.mark.asyncio
+    async def test_vehicle_ticker_survives_flush_error(self, emitter, mock_sio):
+        """Test a failing flush is counted and later ticks still emit"""
+        import asyncio
+        
+        emitter._vehicle_update_interval = 0.01
+        emitter.queue_vehicle_update({"id": "v-bad", "speed": "fast"})
+        
+        await emitter.start_vehicle_ticker()
+        await asyncio.sleep(0.05)
+        assert emitter.get_stats()["errorCount"] == 1
+        assert not emitter._ticker_task.done()
+        
+        emitter.queue_vehicle_update({"id": "v-1", "speed": 10})
+        await asyncio.sleep(0.05)
+        await emitter.stop_vehicle_ticker()
+        
+        assert not emitter._pending_vehicle_updates
+        frames = [call.args[1] for call in mock_sio.emit.call_args_list]
+        assert [v["vehicleId"] for v in frames[-1]["vehicles"]] == ["v-1"]
+    
+    @pytest.mark.asyncio
+    async def test_viewport_subscription_routes_by_tile_and_area(self, emitter, mock_sio):
+        """Test viewport clients get only their tiles/area; others get everything"""
+        mock_sio.enter_room = AsyncMock()
+        mock_sio.leave_room = AsyncMock()
+        
+        assert await emitter.set_viewport("sid-tile", bbox=[0, 0, 100, 100]) == ["tile:0:0"]
+        assert await emitter.set_viewport("sid-area", area="sector5") == ["area:sector5"]
+        with pytest.raises(ValueError):
+            await emitter.set_viewport("sid-bad", area="atlantis")
+        with pytest.raises(ValueError):
+            await emitter.set_viewport("sid-bad", bbox=[0, 0, 1e6, 1e6])
+        # area + bbox would put one client in overlapping rooms
+        with pytest.raises(ValueError):
+            await emitter.set_viewport("sid-bad", area="sector5", bbox=[0, 0, 100, 100])
+        assert "sid-bad" not in emitter._viewport_rooms
+        
+        emitter.queue_vehicle_update({"id": "v-1", "position": {"x": 10.0, "y": 20.0}})
+        emitter.queue_vehicle_update({"id": "v-2", "position": {"x": 900.0, "y": 900.0},
+                                      "lat": 23.22, "lon": 72.63})
+        await emitter._flush_vehicle_updates(time.time())
+        
+        frames = {
+            call.kwargs.get("room"): (call.kwargs.get("skip_sid"), call.args[1])
+            for call in mock_sio.emit.call_args_list
+        }
+        skip, everything = frames[None]
+        assert sorted(skip) == ["sid-area", "sid-tile"]
+        assert everything["count"] == 2
+        assert [v["vehicleId"] for v in frames["tile:0:0"][1]["vehicles"]] == ["v-1"]
+        assert [v["vehicleId"] for v in frames["area:sector5"][1]["vehicles"]] == ["v-2"]
+        
+        # Clearing the viewport (or disconnecting) restores global updates
+        assert await emitter.set_viewport("sid-tile") == []
+        mock_sio.leave_room.assert_awaited_once_with("sid-tile", "tile:0:0")
+        emitter.remove_subscription("sid-area")
+        assert emitter.get_stats()["viewportClients"] == 0
+        assert not emitter._room_members
+    
     def test_get_stats(self, emitter):
         """Test statistics retrieval"""
         stats = emitter.get_stats()
@@ -479,6 +602,11 @@ class TestWebSocketHandlers:
         # Should join rooms for each channel
         assert mock_sio.enter_room.call_count == 3
         mock_emitter.add_subscription.assert_called()
+        
+        mock_emitter.set_viewport = AsyncMock(return_value=["area:sector5"])
+        await handlers.handle_subscribe("test-sid", {"channels": [], "area": "sector5"})
+        mock_emitter.set_viewport.assert_awaited_once_with("test-sid", area="sector5", bbox=None)
+        assert mock_sio.emit.call_args[0][1]["rooms"] == ["area:sector5"]
     
     @pytest.mark.asyncio
     async def test_handle_unsubscribe(self, handlers, mock_sio, mock_emitter):
@@ -501,6 +629,152 @@ class TestWebSocketHandlers:
         assert count == 0
 
 
+
+# ============================================
+# Telemetry Channel Tests
+# ============================================
+
+class TestTelemetryHub:
+    """Test raw WebSocket telemetry fan-out"""
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_one_frame_to_all(self):
+        """Test one encoded frame is sent to every client; failed clients are dropped"""
+        import json
+        from app.websocket.telemetry import TelemetryHub
+        
+        hub = TelemetryHub()
+        good = MagicMock()
+        good.send_bytes = AsyncMock()
+        broken = MagicMock()
+        broken.send_bytes = AsyncMock(side_effect=RuntimeError("closed"))
+        hub.add(good)
+        hub.add(broken)
+        
+        await hub.broadcast("vehicles:batch_update", {"count": 0})
+        
+        frame = good.send_bytes.call_args[0][0]
+        assert broken.send_bytes.call_args[0][0] is frame
+        assert json.loads(frame) == {"event": "vehicles:batch_update", "data": {"count": 0}}
+        assert len(hub) == 1
+        assert hub.get_stats() == {"clients": 1, "framesSent": 1, "errorCount": 1}
+    
+    @pytest.mark.asyncio
+    async def test_emitter_batches_reach_telemetry(self):
+        """Test vehicle batch updates go to Socket.IO and the telemetry hub"""
+        from app.websocket.telemetry import TelemetryHub
+        
+        sio = MagicMock()
+        sio.emit = AsyncMock()
+        hub = TelemetryHub()
+        client = MagicMock()
+        client.send_bytes = AsyncMock()
+        hub.add(client)
+        
+        emitter = WebSocketEmitter(sio, telemetry=hub)
+        await emitter.emit_vehicle_batch_update([{"id": "v-1", "speed": 10}])
+        
+        assert sio.emit.call_args[0][0] == "vehicles:batch_update"
+        client.send_bytes.assert_awaited_once()
+        assert emitter.get_stats()["telemetry"]["clients"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_endpoint_registers_until_disconnect(self):
+        """Test the endpoint keeps a client registered until it disconnects"""
+        from app.websocket.telemetry import telemetry_endpoint, get_telemetry_hub
+        
+        hub = get_telemetry_hub()
+        websocket = MagicMock()
+        websocket.query_params = {}
+        websocket.accept = AsyncMock()
+        seen = []
+        
+        async def receive():
+            seen.append(websocket in hub._clients)
+            return {"type": "websocket.disconnect", "code": 1000}
+        
+        websocket.receive = receive
+        await telemetry_endpoint(websocket)
+        
+        websocket.accept.assert_awaited_once()
+        assert seen == [True]
+        assert websocket not in hub._clients
+        
+        # Unknown encodings are refused before the handshake completes
+        websocket = MagicMock()
+        websocket.query_params = {"format": "xml"}
+        websocket.accept = AsyncMock()
+        websocket.close = AsyncMock()
+        await telemetry_endpoint(websocket)
+        
+        websocket.close.assert_awaited_once_with(code=1003)
+        websocket.accept.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once_per_format(self):
+        """Test JSON and MessagePack clients each get their own encoding"""
+        import json
+        msgpack = pytest.importorskip("msgpack")
+        from app.websocket import telemetry
+        
+        hub = telemetry.TelemetryHub()
+        clients = {}
+        for name, fmt in [("json-1", "json"), ("json-2", "json"), ("packed", "msgpack")]:
+            client = MagicMock()
+            client.send_bytes = AsyncMock()
+            hub.add(client, fmt)
+            clients[name] = client
+        
+        payload = {"roads": [{"roadId": "R-1", "densityScore": 42.5}], "count": 1}
+        with patch.object(telemetry, "encode_frame", wraps=telemetry.encode_frame) as encode:
+            await hub.broadcast("density:batch_update", payload)
+        
+        assert encode.call_count == 2
+        json_frame = clients["json-1"].send_bytes.call_args[0][0]
+        assert clients["json-2"].send_bytes.call_args[0][0] is json_frame
+        expected = {"event": "density:batch_update", "data": payload}
+        assert json.loads(json_frame) == expected
+        packed = clients["packed"].send_bytes.call_args[0][0]
+        assert msgpack.unpackb(packed) == expected
+        assert len(packed) < len(json_frame)
+    
+    @pytest.mark.asyncio
+    async def test_compressed_clients_get_flagged_frames(self):
+        """Test deflate clients get flag-prefixed frames, deflated only when large"""
+        import json
+        import zlib
+        from app.websocket import telemetry
+        
+        hub = telemetry.TelemetryHub()
+        plain = MagicMock()
+        plain.send_bytes = AsyncMock()
+        packed = MagicMock()
+        packed.send_bytes = AsyncMock()
+        hub.add(plain)
+        hub.add(packed, compress=True)
+        
+        await hub.broadcast("vehicles:batch_update", {"count": 0})
+        small = packed.send_bytes.call_args[0][0]
+        assert small[:1] == telemetry.FLAG_PLAIN
+        assert small[1:] == plain.send_bytes.call_args[0][0]
+        
+        predictions = [{"roadId": f"R-{i}", "congestionLevel": "LOW", "confidence": 0.9} for i in range(100)]
+        await hub.broadcast("prediction:update", {"predictions": predictions})
+        large = packed.send_bytes.call_args[0][0]
+        assert large[:1] == telemetry.FLAG_DEFLATE
+        assert zlib.decompress(large[1:]) == plain.send_bytes.call_args[0][0]
+        assert len(large) < len(plain.send_bytes.call_args[0][0]) // 5
+        assert json.loads(zlib.decompress(large[1:]))["event"] == "prediction:update"
+        
+        # Unknown compression is refused
+        websocket = MagicMock()
+        websocket.query_params = {"compress": "zstd"}
+        websocket.accept = AsyncMock()
+        websocket.close = AsyncMock()
+        await telemetry.telemetry_endpoint(websocket)
+        websocket.close.assert_awaited_once_with(code=1003)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 